@@ -1,6 +1,7 @@
-import sys
-import csv
+import math
+import numpy as np
 from collections import Counter  # Import Counter for counting codons
+from genedesign.codon_table import load_codon_table
 
 class CodonChecker:
     """
@@ -25,27 +26,36 @@ class CodonChecker:
     rare_codons: list[str]
     rare_codon_threshold: float
 
+    # Thresholds a CDS must meet to be above board
+    diversity_threshold = 0.5
+    rare_codon_limit = 3
+    cai_threshold = 0.2
+    unknown_frequency = 0.01  # Frequency assumed for codons missing from the usage table
+
     def initiate(self) -> None:
         """
-        Loads codon usage data from a file and sets up the codon frequencies and rare codons.
+        Sets up the codon frequencies and rare codons from the process-wide codon usage table.
         """
-        codon_usage_file = 'genedesign/data/codon_usage.txt'
-        self.codon_frequencies = {}
-        self.rare_codons = []
+        table = load_codon_table()
+        self.codon_table = table
+        self.codon_frequencies = table.frequencies
         self.rare_codon_threshold = 0.1  # Threshold for rare codon frequency
 
-        with open(codon_usage_file, 'r') as f:
-            reader = csv.reader(f, delimiter='\t')
-            for row in reader:
-                if len(row) < 4:
-                    continue  # Skip invalid rows
-                codon = row[0].strip()
-                usage_freq = float(row[2].strip())
-                self.codon_frequencies[codon] = usage_freq
-                
-                # Identify rare codons
-                if usage_freq < self.rare_codon_threshold:
-                    self.rare_codons.append(codon)
+        # Identify rare codons
+        self.rare_codons = [codon for codon in table.codons if table.frequencies[codon] < self.rare_codon_threshold]
+
+        # Per-codon-index lookups for run_batch; a frequency of 0 has a log frequency of -inf
+        frequencies = np.array([table.frequencies[codon] for codon in table.codons])
+        with np.errstate(divide='ignore'):
+            self.log_frequency_array = np.log(frequencies)
+        self.rare_mask = frequencies < self.rare_codon_threshold
+
+    def settings(self) -> tuple:
+        """
+        Returns every setting that decides a verdict besides the codon usage table, e.g. for cache fingerprints.
+        """
+        return (self.rare_codon_threshold, self.diversity_threshold, self.rare_codon_limit, self.cai_threshold,
+                self.unknown_frequency)
 
     def run(self, cds: list[str]) -> tuple[bool, float, int, float]:
         """
@@ -67,7 +77,7 @@ class CodonChecker:
         rare_codon_count = sum(codon_counts[codon] for codon in self.rare_codons if codon in cds)
 
         # Calculate CAI (Codon Adaptation Index) as the geometric mean of codon frequencies
-        cai_numerators = [self.codon_frequencies.get(codon, 0.01) for codon in cds]  # Use 0.01 for unknown codons
+        cai_numerators = [self.codon_frequencies.get(codon, self.unknown_frequency) for codon in cds]  # Use 0.01 for unknown codons
         cai_product = 1
         for freq in cai_numerators:
             cai_product *= freq
@@ -75,16 +85,165 @@ class CodonChecker:
         cai_value = cai_product ** (1 / len(cai_numerators)) if cai_numerators else 0.0
 
         # Apply thresholds to determine if the codons are above board
-        diversity_threshold = 0.5
-        rare_codon_limit = 3
-        cai_threshold = 0.2
+        codons_above_board = (codon_diversity >= self.diversity_threshold and
+                              rare_codon_count <= self.rare_codon_limit and
+                              cai_value >= self.cai_threshold)
+
+        return codons_above_board, codon_diversity, rare_codon_count, cai_value
+
+    def run_batch(self, codon_ids) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calculates the metrics of `run` for many equal-length candidates at once.
+
+        Codon counts of all candidates come from a single bincount and CAI from a log-frequency lookup, so the
+        cost is a handful of array operations however many candidates there are. As in RollingCodonChecker,
+        CAI is the exponential of the mean log frequency; it matches `run` up to rounding, except that it does
+        not underflow to 0 on long candidates.
+
+        :param codon_ids: (n_candidates, n_codons) codon indices into the codon table (see CodonTable.ids_for).
+        :return: Tuple of arrays, one entry per candidate: above board (bool), codon diversity, rare codon
+            count, and CAI score.
+        """
+        codon_ids = np.asarray(codon_ids, dtype=np.intp)
+        n_candidates, n_codons = codon_ids.shape
+        if n_codons == 0:
+            return (np.zeros(n_candidates, dtype=bool), np.zeros(n_candidates),
+                    np.zeros(n_candidates, dtype=np.int64), np.zeros(n_candidates))
+
+        # Count every candidate's codons in one pass by giving each row its own block of codon indices
+        n_table = len(self.log_frequency_array)
+        offsets = (np.arange(n_candidates) * n_table)[:, None]
+        counts = np.bincount((codon_ids + offsets).ravel(), minlength=n_candidates * n_table).reshape(n_candidates, n_table)
 
-        codons_above_board = (codon_diversity >= diversity_threshold and
-                              rare_codon_count <= rare_codon_limit and
-                              cai_value >= cai_threshold)
+        codon_diversity = np.count_nonzero(counts, axis=1) / n_codons
+        rare_codon_count = counts[:, self.rare_mask].sum(axis=1)
+        cai_value = np.exp(self.log_frequency_array[codon_ids].mean(axis=1))
 
+        codons_above_board = ((codon_diversity >= self.diversity_threshold) &
+                              (rare_codon_count <= self.rare_codon_limit) &
+                              (cai_value >= self.cai_threshold))
         return codons_above_board, codon_diversity, rare_codon_count, cai_value
 
+    def rolling(self) -> "RollingCodonChecker":
+        """
+        Returns an empty RollingCodonChecker using this checker's codon usage and thresholds.
+        """
+        return RollingCodonChecker(self)
+
+class RollingCodonChecker:
+    """
+    Tracks the codon usage metrics of a CDS that is built up, or edited, one codon at a time.
+
+    Codon counts, the number of distinct codons, the rare codon total and the sum of log codon frequencies
+    are updated in O(1) per appended or replaced codon, so `metrics` never rescans the CDS. The CAI is the
+    exponential of the mean log frequency, which stays accurate on long genes where the product of
+    frequencies computed by CodonChecker.run underflows to 0. Otherwise the metrics equal those of
+    CodonChecker.run on the same codons, up to floating point rounding of the CAI.
+
+    Designers can `copy` the state to try out candidates without committing to them.
+    """
+
+    def __init__(self, checker: CodonChecker):
+        """
+        Parameters:
+            checker (CodonChecker): An initiated checker supplying codon frequencies, rare codons and thresholds.
+        """
+        self.checker = checker
+        self.rare = frozenset(checker.rare_codons)
+        # Log frequency of every known codon; codons with frequency 0 are counted separately as they have none
+        self.log_frequencies = {codon: math.log(freq) for codon, freq in checker.codon_frequencies.items() if freq > 0}
+        self.unknown_log_frequency = math.log(checker.unknown_frequency)
+
+        self.codons = []            # The CDS so far
+        self.counts = Counter()     # Occurrences of each codon
+        self.distinct = 0           # Number of codons with a non-zero count
+        self.rare_count = 0         # Number of rare codons
+        self.log_cai_sum = 0.0      # Sum of log frequencies over codons with a non-zero frequency
+        self.zero_count = 0         # Number of codons whose frequency is 0
+
+    def copy(self) -> "RollingCodonChecker":
+        """
+        Returns an independent copy of the current state.
+        """
+        clone = RollingCodonChecker.__new__(RollingCodonChecker)
+        clone.__dict__.update(self.__dict__)
+        clone.codons = list(self.codons)
+        clone.counts = Counter(self.counts)
+        return clone
+
+    def _add(self, codon: str, sign: int) -> None:
+        count = self.counts[codon] + sign
+        self.counts[codon] = count
+        if sign > 0 and count == 1:
+            self.distinct += 1
+        elif sign < 0 and count == 0:
+            self.distinct -= 1
+            del self.counts[codon]
+        if codon in self.rare:
+            self.rare_count += sign
+
+        log_frequency = self.log_frequencies.get(codon)
+        if log_frequency is not None:
+            self.log_cai_sum += sign * log_frequency
+        elif codon in self.checker.codon_frequencies:
+            self.zero_count += sign
+        else:
+            self.log_cai_sum += sign * self.unknown_log_frequency
+
+    def append(self, codon: str) -> None:
+        """
+        Appends a codon to the CDS.
+        """
+        self.codons.append(codon)
+        self._add(codon, 1)
+
+    def extend(self, codons) -> None:
+        """
+        Appends codons to the CDS.
+        """
+        for codon in codons:
+            self.append(codon)
+
+    def replace(self, index: int, codon: str) -> None:
+        """
+        Replaces the codon at `index` (negative indices count from the end).
+
+        Raises:
+            IndexError: If there is no codon at `index`.
+        """
+        old = self.codons[index]
+        self.codons[index] = codon
+        self._add(old, -1)
+        self._add(codon, 1)
+
+    def __len__(self) -> int:
+        return len(self.codons)
+
+    def cai(self) -> float:
+        """
+        Returns the Codon Adaptation Index of the CDS so far (0.0 when empty).
+        """
+        if not self.codons or self.zero_count:
+            return 0.0
+        return math.exp(self.log_cai_sum / len(self.codons))
+
+    def metrics(self) -> tuple[bool, float, int, float]:
+        """
+        Returns the metrics of the CDS so far, in the same form as CodonChecker.run.
+
+        :return: Tuple containing a boolean, codon diversity, rare codon count, and CAI score.
+        """
+        if not self.codons:
+            return False, 0.0, 0, 0.0
+
+        checker = self.checker
+        codon_diversity = self.distinct / len(self.codons)
+        cai_value = self.cai()
+        codons_above_board = (codon_diversity >= checker.diversity_threshold and
+                              self.rare_count <= checker.rare_codon_limit and
+                              cai_value >= checker.cai_threshold)
+        return codons_above_board, codon_diversity, self.rare_count, cai_value
+
 if __name__ == "__main__":
     """
     Main method for running the CodonChecker on a hardcoded CDS.
@@ -109,3 +268,15 @@ if __name__ == "__main__":
     print(f"Codon Diversity: {codon_diversity}")
     print(f"Rare Codon Count: {rare_codon_count}")
     print(f"Codon Adaptation Index (CAI): {cai_value}")
+
+    # Score several candidates at once from their codon indices
+    candidates = [['ATG', 'CAA', 'GGG', 'TAA'], ['AGG', 'AGA', 'AGG', 'AGA']]
+    print(f"Batch: {codon_checker.run_batch(codon_checker.codon_table.ids_for(candidates))}")
+
+    # Track the same metrics while the CDS grows, then swap the first codon for a rare one
+    rolling = codon_checker.rolling()
+    for codon in cds:
+        rolling.append(codon)
+        print(f"After {rolling.codons}: {rolling.metrics()}")
+    rolling.replace(0, 'AGG')
+    print(f"After replacing the first codon: {rolling.metrics()}")
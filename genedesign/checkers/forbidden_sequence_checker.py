@@ -1,8 +1,20 @@
 from genedesign.seq_utils.reverse_complement import reverse_complement
+from genedesign.seq_utils.aho_corasick import build_automaton
 
 class ForbiddenSequenceChecker:
+    """
+    Detects forbidden sequences (homopolymers and restriction sites) on either strand of a DNA sequence.
+
+    The forbidden sites and their reverse complements are compiled into a single Aho-Corasick automaton
+    in `initiate`, so both strands are covered by one linear pass over the input without building its
+    reverse complement.
+    """
+
     def __init__(self):
         self.forbidden = []
+        self.transitions = None
+        self.outputs = None
+        self.patterns = []
 
     def initiate(self):
         # Populate forbidden sequences
@@ -27,14 +39,99 @@ class ForbiddenSequenceChecker:
             "AAGCTT",    # HindIII
         ]
 
+        # A site on the reverse strand shows up on the forward strand as its reverse complement.
+        # Forward patterns come first so they are reported first when both strands match at once.
+        self.patterns = [(site, "+", site) for site in self.forbidden]
+        self.patterns += [(site, "-", reverse_complement(site)) for site in self.forbidden]
+        self.transitions, self.outputs = build_automaton([pattern for _, _, pattern in self.patterns])
+
+    def settings(self):
+        """
+        Returns every setting that decides a verdict, e.g. for cache fingerprints.
+        """
+        return tuple(self.forbidden)
+
+    def scan(self, dnaseq, state=0):
+        """
+        Feeds a DNA sequence through the automaton, stopping at the first forbidden site.
+
+        The returned state can be passed back in to continue scanning a sequence that is built up
+        piece by piece; only sites ending inside the new piece are reported.
+
+        Parameters:
+            dnaseq (str or DNASequence): The DNA sequence to scan.
+            state (int): The automaton state left by the preceding sequence (0 for a fresh scan).
+
+        Returns:
+            tuple: (int, str or None)
+                - The automaton state after the scanned sequence (or at the forbidden site).
+                - The first forbidden site found, or None if there is none.
+        """
+        dnaseq = str(dnaseq)
+        transitions = self.transitions
+        outputs = self.outputs
+        for char in dnaseq:
+            state = transitions[state].get(char, 0)
+            if outputs[state]:
+                return state, self.patterns[outputs[state][0]][0]
+        return state, None
+
+    def advance(self, dnaseq, state=0):
+        """
+        Feeds a DNA sequence through the automaton without stopping at forbidden sites.
+
+        Parameters:
+            dnaseq (str or DNASequence): The DNA sequence to feed.
+            state (int): The automaton state left by the preceding sequence.
+
+        Returns:
+            int: The automaton state after the whole sequence.
+        """
+        dnaseq = str(dnaseq)
+        transitions = self.transitions
+        for char in dnaseq:
+            state = transitions[state].get(char, 0)
+        return state
+
+    def find_all(self, dnaseq):
+        """
+        Reports every forbidden site on both strands of a DNA sequence.
+
+        Parameters:
+            dnaseq (str or DNASequence): The DNA sequence to scan.
+
+        Returns:
+            list[tuple]: (position, strand, site) for every hit, in order of where the hit ends. The position is
+            the 0-based forward-strand coordinate of the first base covered by the site, and the strand is '+'
+            or '-'. Palindromic sites are reported once per strand.
+        """
+        dnaseq = str(dnaseq)
+        transitions = self.transitions
+        outputs = self.outputs
+        hits = []
+        state = 0
+        for end, char in enumerate(dnaseq, start=1):
+            state = transitions[state].get(char, 0)
+            for index in outputs[state]:
+                site, strand, pattern = self.patterns[index]
+                hits.append((end - len(pattern), strand, site))
+        return hits
+
     def run(self, dnaseq):
-        # Use the reverse_complement function from seq_utils
-        rc = reverse_complement(dnaseq)
-        combined = (dnaseq + "x" + rc).upper()
+        """
+        Checks a DNA sequence and its reverse complement for forbidden sites.
+
+        Parameters:
+            dnaseq (str or DNASequence): The DNA sequence to check.
 
-        for site in self.forbidden:
-            if site in combined:
-                return False, site
+        Returns:
+            tuple: (bool, str or None)
+                - True and None if no forbidden site is present.
+                - False and the first forbidden site encountered otherwise.
+        """
+        _, site = self.scan(dnaseq)
+        if site is not None:
+            return False, site
 
         return True, None
 
@@ -43,6 +140,7 @@ def main():
     checker.initiate()
     result = checker.run("GGGGGGGGG")  # returns False due to poly(G)
     print(result)
+    print(checker.find_all("CCGAATTCTTTTTTTTGG"))  # EcoRI on both strands and poly(T)
 
 if __name__ == "__main__":
     main()
@@ -1,40 +1,144 @@
-from genedesign.seq_utils.hairpin_counter import hairpin_counter
+from genedesign.seq_utils.hairpin_counter import format_hairpins, STEM_COMPLEMENT_TABLE
+
+class RollingHairpinChecker:
+    """
+    Checks for bad hairpin structures in a DNA sequence that may be built up piece by piece.
+
+    The sequence is covered by 50 bp windows with a 25 bp step, exactly as in hairpin_checker. Instead of
+    re-counting each window, every hairpin is found once, when the last base of its second stem arrives,
+    and is credited to the windows that contain it. A window is judged as soon as its last base has been
+    appended, and checking stops at the first window holding more than `max_hairpins` hairpins.
+
+    Only the bases of the oldest window still open are kept, so memory stays bounded however long the
+    sequence grows. Designers can `copy` the state to try out a candidate without committing to it.
+    """
+
+    def __init__(self, chunk_size=50, overlap=25, min_stem=3, min_loop=4, max_loop=9, max_hairpins=1):
+        """
+        Parameters:
+            chunk_size (int): Width of each window in bp.
+            overlap (int): Step between the starts of consecutive windows in bp.
+            min_stem (int): Minimum number of bases in the stem.
+            min_loop (int): Minimum number of bases in the loop.
+            max_loop (int): Maximum number of bases in the loop.
+            max_hairpins (int): Number of hairpins a window may contain before it fails.
+        """
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self.min_stem = min_stem
+        self.min_loop = min_loop
+        self.max_loop = max_loop
+        self.max_hairpins = max_hairpins
+
+        self.length = 0         # Number of bases appended so far
+        self.offset = 0         # Absolute position of the first base held in the buffer
+        self.buffer = ""        # Bases from the oldest open window onwards
+        self.next_window = 0    # Start of the oldest window that has not been judged yet
+        self.hairpins = []      # (i, j) absolute stem positions of hairpins starting in an open window
+        self.passed = True
+        self.hairpin_string = None
+
+    def settings(self):
+        """
+        Returns every setting that decides a verdict, e.g. for cache fingerprints.
+        """
+        return self.chunk_size, self.overlap, self.min_stem, self.min_loop, self.max_loop, self.max_hairpins
+
+    def copy(self):
+        """
+        Returns an independent copy of the current state.
+        """
+        clone = RollingHairpinChecker.__new__(RollingHairpinChecker)
+        clone.__dict__.update(self.__dict__)
+        clone.hairpins = list(self.hairpins)
+        return clone
+
+    def extend(self, dna):
+        """
+        Appends bases to the sequence and judges every window they complete.
+
+        Parameters:
+            dna (str or DNASequence): The bases to append.
+
+        Returns:
+            tuple: (bool, str or None)
+                - True and None if no judged window so far has too many hairpins.
+                - False and the hairpin string of the first failing window otherwise.
+        """
+        if not self.passed:
+            return False, self.hairpin_string
+
+        stem = self.min_stem
+        dna = str(dna)
+        buffer = self.buffer + dna
+        offset = self.offset
+        rc = buffer.translate(STEM_COMPLEMENT_TABLE)[::-1]
+        buffer_len = len(buffer)
+
+        for end in range(self.length + 1, self.length + len(dna) + 1):
+            # A hairpin is discovered when the last base of its second stem arrives
+            j = end - stem - offset
+            first = max(self.next_window - offset, j - stem - self.max_loop)
+            last = j - self.min_loop
+            if last - first >= stem:
+                # The first stem must be the reverse complement of the second and end min_loop bases before it
+                target = rc[buffer_len - j - stem:buffer_len - j]
+                i = buffer.find(target, first, last)
+                while i != -1:
+                    self.hairpins.append((i + offset, j + offset))
+                    i = buffer.find(target, i + 1, last)
+
+            # The oldest open window is complete once its last base has arrived
+            if end == self.next_window + self.chunk_size:
+                start = self.next_window
+                if len(self.hairpins) > self.max_hairpins:
+                    window = buffer[start - offset:end - offset]
+                    local = sorted((i - start, j - start) for i, j in self.hairpins)
+                    self.passed = False
+                    self.hairpin_string = format_hairpins(window, local, stem)
+                    self.length = end
+                    self.buffer = ""
+                    self.hairpins = []
+                    return False, self.hairpin_string
+
+                self.next_window += self.overlap
+                self.hairpins = [(i, j) for i, j in self.hairpins if i >= self.next_window]
+
+        # Keep only the bases of the windows that are still open
+        self.length += len(dna)
+        self.offset = min(self.next_window, self.length)
+        self.buffer = buffer[self.offset - offset:]
+        return True, None
 
 def hairpin_checker(dna):
     """
     Checks for bad hairpin structures in the DNA sequence by splitting it into 50 bp chunks with
-    an overlap of 25 bp, and passing each chunk to hairpin_counter. If any chunk has more than
+    an overlap of 25 bp, and counting the hairpins in each chunk. If any chunk has more than
     1 hairpin, it returns False and the problematic hairpin string. Otherwise, it returns True and None.
 
+    Each hairpin is found once in a single sweep over the sequence (see RollingHairpinChecker) rather
+    than by re-counting every overlapping chunk.
+
     Parameters:
-        dna (str): The DNA sequence to analyze.
+        dna (str or DNASequence): The DNA sequence to analyze.
 
     Returns:
         tuple: (bool, str or None)
             - True and None if no problematic hairpins are found.
             - False and the problematic hairpin string if more than one hairpin is found in any chunk.
     """
-    chunk_size = 50  # 50 bp window
-    overlap = 25     # Overlap by 25 bp
-    min_stem = 3     # Minimum number of bases in the stem
-    min_loop = 4     # Minimum number of bases in the loop
-    max_loop = 9     # Maximum number of bases in the loop
-    
-    # Iterate over the sequence in 50 bp chunks with 25 bp overlap
-    for i in range(0, len(dna) - chunk_size + 1, overlap):
-        chunk = dna[i:i + chunk_size]
-        
-        # Get the count of hairpins and the hairpin string from hairpin_counter
-        hairpin_count, hairpin_string = hairpin_counter(chunk, min_stem, min_loop, max_loop)
-        
-        # If more than 1 hairpin is found, return False and the problematic hairpin string
-        if hairpin_count > 1:
-            return False, hairpin_string
-    
-    # If no problematic hairpin chunk is found, return True and None
-    return True, None
+    # The default settings: 50 bp windows overlapping by 25 bp, stems of at least 3 bases, loops of 4 to 9 bases
+    # and at most 1 hairpin per window
+    checker = RollingHairpinChecker()
+    return checker.extend(dna)
 
 # Example usage
 if __name__ == "__main__":
     result, hairpin = hairpin_checker("AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACCCCAAAAAAAGGGGAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA")
     print(result, hairpin)
+
+    # The same check, fed one codon at a time
+    checker = RollingHairpinChecker()
+    for codon in ["ATG", "CCC", "AAA", "AAA", "GGG", "AAA"] * 10:
+        result, hairpin = checker.extend(codon)
+    print(result, hairpin)
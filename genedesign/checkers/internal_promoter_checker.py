@@ -1,5 +1,6 @@
 import math
-from genedesign.seq_utils.reverse_complement import reverse_complement
+import numpy as np
+from genedesign.seq_utils.dna_sequence import COMPLEMENT_CODES, COMPLEMENT_TABLE, encode_sequence
 
 class PromoterChecker:
     """
@@ -9,8 +10,14 @@ class PromoterChecker:
     to scan a sequence of DNA and evaluate whether a constitutive promoter is present. The `run` method
     evaluates both the input sequence and its reverse complement.
 
+    Sequences are encoded once into uint8 arrays and every window on both strands is scored with
+    vectorized NumPy lookups, one PWM column at a time.
+
     Attributes:
         pwm: A 2D list representing the Position Weight Matrix (PWM) used to score sequences.
+        pwm_array: The PWM as a (5, 29) array whose last row scores unknown bases as 0.
+        sliding_frame: The width of the scanned window in nucleotides.
+        threshold: The score at or above which a window is considered a promoter.
     """
 
     def __init__(self):
@@ -19,6 +26,9 @@ class PromoterChecker:
         The PWM will be computed later in the initiate method.
         """
         self.pwm = None
+        self.pwm_array = None
+        self.sliding_frame = 29  # The sliding window size is 29 nucleotides.
+        self.threshold = 9.134   # A threshold score for detecting promoter activity.
 
     def initiate(self):
         """
@@ -48,6 +58,44 @@ class PromoterChecker:
                 w = (math.log((freq + math.sqrt(total) * prob_base) / (total + math.sqrt(total)) / prob_base)) / math.log(2)
                 self.pwm[y][x] = w
 
+        # Row 4 scores bases other than A, C, G and T, which contribute nothing to a window's score.
+        self.pwm_array = np.zeros((5, ncols))
+        self.pwm_array[:4] = self.pwm
+
+    def settings(self):
+        """
+        Returns every setting that decides a verdict, e.g. for cache fingerprints.
+        """
+        return self.sliding_frame, self.threshold, tuple(map(tuple, self.pwm))
+
+    def window_scores(self, combined):
+        """
+        Scores every window of the encoded sequence(s) against the PWM.
+
+        The scores are accumulated column by column in the same order as a scalar loop over the window,
+        so they are bit-for-bit identical to summing the PWM weights one base at a time.
+
+        Parameters:
+            combined (np.ndarray): Encoded sequence (1-D) or equal-length sequences (2-D, one per row).
+
+        Returns:
+            np.ndarray: The score of each window start, along the last axis.
+        """
+        n_windows = combined.shape[-1] - self.sliding_frame + 1
+        scores = np.zeros(combined.shape[:-1] + (max(n_windows, 0),))
+        if n_windows <= 0:
+            return scores
+        for x in range(self.sliding_frame):
+            scores += self.pwm_array[:, x][combined[..., x:x + n_windows]]
+        return scores
+
+    def _combine(self, codes):
+        """
+        Lays out encoded sequence(s) as seq + "x" + reverse complement, matching the strings scanned by `run`.
+        """
+        separator = np.full(codes.shape[:-1] + (1,), 4, dtype=np.uint8)
+        return np.concatenate((codes, separator, COMPLEMENT_CODES[codes[..., ::-1]]), axis=-1)
+
     def run(self, seq):
         """
         Checks if the given DNA sequence contains a constitutive sigma70 promoter.
@@ -56,35 +104,92 @@ class PromoterChecker:
         If a windowed sequence has a score above a certain threshold, it is considered to contain a promoter.
 
         Parameters:
-            seq (str): A DNA sequence to check.
+            seq (str or DNASequence): A DNA sequence to check.
 
         Returns:
             tuple: (bool, str or None)
                 - bool: True if no promoter is found, False if a promoter is found.
                 - str: The promoter sequence if found, None otherwise.
         """
-        # Convert the sequence to uppercase and compute its reverse complement.
-        seq = seq.upper()
-        rc = reverse_complement(seq)
-        combined = seq + "x" + rc  # Concatenate the original sequence and its reverse complement.
-
-        sliding_frame = 29  # The sliding window size is 29 nucleotides.
-        threshold = 9.134   # A threshold score for detecting promoter activity.
-
-        # Slide over the sequence and calculate the score for each window.
-        for i in range(len(combined) - sliding_frame + 1):
-            score = 0.0
-            partseq = combined[i:i + sliding_frame]
-            for x, base in enumerate(partseq):
-                # Map the base to its corresponding row in the PWM
-                y = {'A': 0, 'C': 1, 'G': 2, 'T': 3}.get(base, -1)
-                if y != -1:
-                    score += self.pwm[y][x]
-            # If the score exceeds the threshold, the sequence likely contains a constitutive promoter.
-            if score >= threshold:
-                return False, partseq  # Promoter found, return the sequence
+        scores = self.window_scores(self._combine(encode_sequence(seq)))
+        hits = np.flatnonzero(scores >= self.threshold)
+
+        # If a score exceeds the threshold, the sequence likely contains a constitutive promoter.
+        if hits.size:
+            i = hits[0]
+            seq = str(seq).upper()
+            combined = seq + "x" + seq.translate(COMPLEMENT_TABLE)[::-1]
+            return False, combined[i:i + self.sliding_frame]  # Promoter found, return the sequence
         return True, None  # No promoter detected in the sequence
 
+    def run_suffix(self, seq, suffix_len):
+        """
+        Checks only the windows, on either strand, that overlap the last `suffix_len` bases of a sequence.
+
+        This lets a sequence that grows piece by piece be checked at the cost of the new piece plus a lookback
+        of one window width, without re-scoring windows that were already checked.
+
+        Parameters:
+            seq (str or DNASequence): Lookback context followed by the new bases.
+            suffix_len (int): Number of new bases at the end of seq.
+
+        Returns:
+            tuple: (bool, str or None)
+                - bool: True if no promoter overlaps the new bases, False otherwise.
+                - str: The promoter window (as read on its strand) if found, None otherwise.
+        """
+        # Only the last window width of lookback can share a window with the new bases
+        frame = self.sliding_frame
+        seq = seq[-(suffix_len + frame - 1):] if suffix_len else ""
+        codes = encode_sequence(seq)
+
+        # Every window of the trimmed sequence, on either strand, overlaps the new bases
+        hits = np.flatnonzero(self.window_scores(codes) >= self.threshold)
+        if hits.size:
+            return False, str(seq).upper()[hits[0]:hits[0] + frame]
+        hits = np.flatnonzero(self.window_scores(COMPLEMENT_CODES[codes[::-1]]) >= self.threshold)
+        if hits.size:
+            rc = str(seq).upper().translate(COMPLEMENT_TABLE)[::-1]
+            return False, rc[hits[0]:hits[0] + frame]
+        return True, None
+
+    def run_batch(self, seqs):
+        """
+        Checks many equal-length DNA sequences for constitutive sigma70 promoters at once.
+
+        The candidates are encoded into a single 2-D array and all windows of all candidates are
+        scored together.
+
+        Parameters:
+            seqs (list[str or DNASequence]): DNA sequences of identical length.
+
+        Returns:
+            list[tuple]: One (bool, str or None) result per sequence, as returned by `run`.
+
+        Raises:
+            ValueError: If the sequences do not all have the same length.
+        """
+        if not seqs:
+            return []
+        length = len(seqs[0])
+        if any(len(seq) != length for seq in seqs):
+            raise ValueError("All sequences passed to run_batch must have the same length.")
+
+        codes = encode_sequence(''.join(map(str, seqs))).reshape(len(seqs), length)
+        scores = self.window_scores(self._combine(codes))
+        passing = scores >= self.threshold
+
+        results = []
+        for seq, row, hit in zip(seqs, passing, passing.any(axis=1)):
+            if hit:
+                i = int(np.argmax(row))
+                seq = str(seq).upper()
+                combined = seq + "x" + seq.translate(COMPLEMENT_TABLE)[::-1]
+                results.append((False, combined[i:i + self.sliding_frame]))
+            else:
+                results.append((True, None))
+        return results
+
 
 if __name__ == "__main__":
     checker = PromoterChecker()
@@ -15,33 +15,61 @@ class InternalRBSChecker:
         self.shine_dalgarno_motifs = ["AGGAGG", "GGAGG"]  # Common Shine-Dalgarno sequences
         self.start_codons = ["ATG", "GTG", "TTG"]
 
+    def settings(self):
+        """
+        Returns every setting that decides a verdict, e.g. for cache fingerprints.
+        """
+        return tuple(self.shine_dalgarno_motifs), tuple(self.start_codons)
+
     def run(self, dna_sequence):
         """
         Checks for internal RBS (Shine-Dalgarno sequence + start codon) in a given DNA sequence.
 
         Parameters:
-            dna_sequence (str): DNA sequence to check for internal RBS.
+            dna_sequence (str or DNASequence): DNA sequence to check for internal RBS.
 
         Returns:
             tuple: (bool, str or None)
                 - True and None if no internal RBS is found.
                 - False and the problematic sequence if an internal RBS is detected.
         """
-        dna_sequence = dna_sequence.upper()
-        
+        return self._find(str(dna_sequence).upper(), 0)
+
+    def run_suffix(self, dna_sequence, suffix_len):
+        """
+        Checks only for internal RBSs whose start codon ends within the last `suffix_len` bases of a sequence.
+
+        This lets a sequence that grows piece by piece be checked at the cost of the new piece plus a short
+        lookback (at most the motif length plus 10 bases), without re-reporting sites that were already checked.
+
+        Parameters:
+            dna_sequence (str or DNASequence): Lookback context followed by the new bases.
+            suffix_len (int): Number of new bases at the end of dna_sequence.
+
+        Returns:
+            tuple: (bool, str or None)
+                - True and None if no internal RBS ends in the new bases.
+                - False and the problematic sequence if one does.
+        """
+        return self._find(str(dna_sequence).upper(), len(dna_sequence) - suffix_len)
+
+    def _find(self, dna_sequence, boundary):
+        """
+        Searches for Shine-Dalgarno motifs followed 5-10 bases downstream by a start codon ending after `boundary`.
+        """
         # Search for each Shine-Dalgarno motif in the sequence
         for motif in self.shine_dalgarno_motifs:
-            position = dna_sequence.find(motif)
+            # A motif further upstream than this cannot have a start codon ending after the boundary
+            position = dna_sequence.find(motif, max(0, boundary - len(motif) - 10))
             
             # If motif is found, check for a start codon within 5-10 bases downstream
             while position != -1:
                 # Define the search window for the start codon (5-10 bases downstream of the Shine-Dalgarno motif)
                 start_search_position = position + len(motif) + 5
                 end_search_position = position + len(motif) + 10
-                downstream_sequence = dna_sequence[start_search_position:end_search_position]
                 
                 for codon in self.start_codons:
-                    if codon in downstream_sequence:
+                    if dna_sequence.find(codon, max(start_search_position, boundary - 2), end_search_position) != -1:
                         # Internal RBS found, return False with the problematic sequence
                         return False, dna_sequence[position:start_search_position + 3]
                 
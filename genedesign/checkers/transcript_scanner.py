@@ -0,0 +1,215 @@
+import numpy as np
+
+from genedesign.models.violation import Violation
+from genedesign.seq_utils.aho_corasick import build_automaton
+from genedesign.seq_utils.hairpin_counter import find_hairpins, format_hairpins
+from genedesign.checkers.forbidden_sequence_checker import ForbiddenSequenceChecker
+from genedesign.checkers.hairpin_checker import RollingHairpinChecker
+from genedesign.seq_utils.dna_sequence import COMPLEMENT_CODES, COMPLEMENT_TABLE, encode_sequence
+from genedesign.checkers.internal_promoter_checker import PromoterChecker
+from genedesign.checkers.internal_rbs_checker import InternalRBSChecker
+
+class TranscriptScanner:
+    """
+    Runs the forbidden sequence, internal RBS, promoter and hairpin checks over a sequence in one go and
+    reports every violation rather than only the first.
+
+    The sequence is uppercased and encoded once. Forbidden sites (both strands) and Shine-Dalgarno motifs
+    share a single Aho-Corasick automaton, so one pass over the string finds all of them; promoter windows
+    on both strands are scored from the encoded array, and hairpins are located once and tallied per window.
+
+    The checks follow the individual checkers, except that promoter windows are scored on each strand
+    separately: PromoterChecker.run also scores windows straddling the artificial seq + "x" + reverse
+    complement junction, which are not sites on either strand.
+    """
+
+    CHECKERS = ("forbidden", "internal_rbs", "promoter", "hairpin")
+
+    def __init__(self, checkers=CHECKERS):
+        """
+        Parameters:
+            checkers (Iterable[str]): The checks to run, a subset of CHECKERS.
+        """
+        unknown = set(checkers) - set(self.CHECKERS)
+        if unknown:
+            raise ValueError(f"Unknown checkers: {sorted(unknown)}")
+        self.checkers = tuple(name for name in self.CHECKERS if name in checkers)
+
+        self.forbiddenChecker = None
+        self.promoterChecker = None
+        self.rbsChecker = None
+        self.patterns = []
+        self.transitions = None
+        self.outputs = None
+
+        # Hairpin windows, taken from RollingHairpinChecker so both judge hairpins alike
+        self.hairpinChecker = RollingHairpinChecker()
+        (self.chunk_size, self.overlap, self.min_stem, self.min_loop, self.max_loop,
+         self.max_hairpins) = self.hairpinChecker.settings()
+
+    def initiate(self):
+        self.forbiddenChecker = ForbiddenSequenceChecker()
+        self.forbiddenChecker.initiate()
+        self.promoterChecker = PromoterChecker()
+        self.promoterChecker.initiate()
+        self.rbsChecker = InternalRBSChecker()
+        self.rbsChecker.initiate()
+
+        # One automaton for forbidden sites on either strand and Shine-Dalgarno motifs on the forward strand
+        self.patterns = []
+        if "forbidden" in self.checkers:
+            self.patterns += [("forbidden", site, strand, pattern) for site, strand, pattern in self.forbiddenChecker.patterns]
+        if "internal_rbs" in self.checkers:
+            self.patterns += [("internal_rbs", motif, "+", motif) for motif in self.rbsChecker.shine_dalgarno_motifs]
+        self.transitions, self.outputs = build_automaton([pattern for *_, pattern in self.patterns])
+
+    def settings(self):
+        """
+        Returns every setting that decides a verdict, e.g. for cache fingerprints.
+        """
+        return (self.checkers, self.forbiddenChecker.settings(), self.rbsChecker.settings(),
+                self.promoterChecker.settings(), self.hairpinChecker.settings())
+
+    def run(self, dna, limit=None):
+        """
+        Scans a DNA sequence with every enabled checker.
+
+        Parameters:
+            dna (str or DNASequence): The DNA sequence to scan (case-insensitive). A DNASequence is used
+                without re-encoding.
+            limit (int or None): Stop each checker after this many violations (e.g. 1 when only a verdict and the
+                first site are needed); None reports them all.
+
+        Returns:
+            list[Violation]: Every violation, grouped by checker in CHECKERS order. Within a checker they come
+            in the order that checker finds them: forbidden sites and internal RBSs by where the motif ends,
+            hairpin windows from 5' to 3', and promoter windows on the forward strand before the reverse strand.
+        """
+        seq = str(dna).upper()
+        codes = encode_sequence(dna)
+        found = {name: [] for name in self.checkers}
+
+        # Single pass for forbidden sites and Shine-Dalgarno motifs. Motifs only become violations once a start
+        # codon is found downstream, so the pass can only end early when internal RBSs are not being checked.
+        if self.patterns:
+            transitions = self.transitions
+            outputs = self.outputs
+            patterns = self.patterns
+            forbidden = found.get("forbidden")
+            stop_early = limit is not None and "internal_rbs" not in found
+            state = 0
+            for end, char in enumerate(seq, start=1):
+                state = transitions[state].get(char, 0)
+                for index in outputs[state]:
+                    checker, site, strand, pattern = patterns[index]
+                    found[checker].append((end - len(pattern), strand, site))
+                if stop_early and len(forbidden) >= limit:
+                    break
+
+        if "internal_rbs" in found:
+            found["internal_rbs"] = self._internal_rbs(seq, found["internal_rbs"], limit)
+        if "forbidden" in found:
+            found["forbidden"] = [Violation("forbidden", position, strand, site) for position, strand, site in found["forbidden"][:limit]]
+        if "promoter" in found:
+            found["promoter"] = self._promoters(seq, codes, limit)
+        if "hairpin" in found:
+            found["hairpin"] = self._hairpins(seq, codes, limit)
+
+        return [violation for name in self.checkers for violation in found[name]]
+
+    def _internal_rbs(self, seq, motifs, limit=None):
+        """
+        Keeps the Shine-Dalgarno motifs followed 5-10 bases downstream by a start codon.
+        """
+        violations = []
+        for position, strand, motif in motifs:
+            start_search_position = position + len(motif) + 5
+            end_search_position = position + len(motif) + 10
+            if any(seq.find(codon, start_search_position, end_search_position) != -1 for codon in self.rbsChecker.start_codons):
+                violations.append(Violation("internal_rbs", position, strand, seq[position:start_search_position + 3]))
+                if len(violations) == limit:
+                    break
+        return violations
+
+    def _promoters(self, seq, codes, limit=None):
+        """
+        Scores every promoter window on both strands of the encoded sequence.
+        """
+        checker = self.promoterChecker
+        frame = checker.sliding_frame
+        n = len(seq)
+
+        violations = []
+        for i in np.flatnonzero(checker.window_scores(codes) >= checker.threshold).tolist():
+            violations.append(Violation("promoter", i, "+", seq[i:i + frame]))
+        if limit is not None and len(violations) >= limit:
+            return violations[:limit]
+
+        rc_codes = COMPLEMENT_CODES[codes[::-1]]
+        hits = np.flatnonzero(checker.window_scores(rc_codes) >= checker.threshold).tolist()
+        if hits:
+            rc = seq.translate(COMPLEMENT_TABLE)[::-1]
+            for r in hits:
+                violations.append(Violation("promoter", n - r - frame, "-", rc[r:r + frame]))
+        return violations[:limit]
+
+    def find_hairpins(self, codes):
+        """
+        Locates every hairpin in the encoded sequence, exactly as seq_utils.hairpin_counter.find_hairpins does.
+
+        Each loop length is tested for all positions at once: a hairpin with its first stem at i pairs every
+        stem base i + k with base j + stem - 1 - k of the second stem.
+
+        Returns:
+            tuple: (np.ndarray, np.ndarray) stem start positions i and j, ordered by i and then j.
+        """
+        stem = self.min_stem
+        n = len(codes)
+        complement = COMPLEMENT_CODES[codes]
+        pairable = codes < 4
+
+        first_stems = []
+        second_stems = []
+        for loop in range(self.min_loop, self.max_loop + 1):
+            starts = n - 2 * stem - loop + 1
+            if starts <= 0:
+                break
+            match = np.ones(starts, dtype=bool)
+            for k in range(stem):
+                partner = 2 * stem + loop - 1 - k
+                match &= pairable[k:k + starts] & (complement[k:k + starts] == codes[partner:partner + starts])
+            i = np.flatnonzero(match)
+            first_stems.append(i)
+            second_stems.append(i + stem + loop)
+
+        if not first_stems:
+            return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp)
+        i = np.concatenate(first_stems)
+        j = np.concatenate(second_stems)
+        order = np.lexsort((j, i))
+        return i[order], j[order]
+
+    def _hairpins(self, seq, codes, limit=None):
+        """
+        Reports every 50 bp window (25 bp step) holding more than one hairpin, as hairpin_checker judges them.
+        """
+        stem = self.min_stem
+        first_stems, second_stems = self.find_hairpins(codes)
+
+        violations = []
+        for start in range(0, len(seq) - self.chunk_size + 1, self.overlap):
+            end = start + self.chunk_size
+            lo, hi = np.searchsorted(first_stems, (start, end))
+            inside = np.flatnonzero(second_stems[lo:hi] + stem <= end) + lo
+            if len(inside) > self.max_hairpins:
+                local = [(i - start, j - start) for i, j in zip(first_stems[inside].tolist(), second_stems[inside].tolist())]
+                violations.append(Violation("hairpin", start, "+", format_hairpins(seq[start:end], local, stem)))
+                if len(violations) == limit:
+                    break
+        return violations
+
+if __name__ == "__main__":
+    scanner = TranscriptScanner()
+    scanner.initiate()
+    for violation in scanner.run("TTGACAATTAATCATCGAACTAGTATAATGAATTCAAGGAGGTAAAACATGAAA"):
+        print(violation)
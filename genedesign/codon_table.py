@@ -0,0 +1,201 @@
+import os
+import random
+import numpy as np
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Tuple
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+DEFAULT_CODON_USAGE = os.path.join(DATA_DIR, 'codon_usage.txt')
+
+def build_alias_table(weights) -> Tuple[Tuple[float, ...], Tuple[int, ...]]:
+    """
+    Builds a Walker/Vose alias table so that an index can be drawn with probability proportional to its
+    weight in constant time.
+
+    Parameters:
+        weights (Sequence[float]): Non-negative weights with a positive sum.
+
+    Returns:
+        Tuple[Tuple[float, ...], Tuple[int, ...]]: The acceptance probability and the alias of each index.
+    """
+    n = len(weights)
+    total = sum(weights)
+    scaled = [weight * n / total for weight in weights]
+    prob = [1.0] * n
+    alias = list(range(n))
+
+    small = [i for i, value in enumerate(scaled) if value < 1.0]
+    large = [i for i, value in enumerate(scaled) if value >= 1.0]
+    while small and large:
+        s = small.pop()
+        l = large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] += scaled[s] - 1.0
+        (small if scaled[l] < 1.0 else large).append(l)
+
+    return tuple(prob), tuple(alias)
+
+@dataclass(frozen=True, eq=False)
+class CodonTable:
+    """
+    Immutable codon usage table shared by the designers and checkers of a process.
+
+    Attributes:
+        codons (Tuple[str, ...]): Every codon, in the order of the usage file. Codon indices refer to this order.
+        codon_index (Mapping[str, int]): Index of each codon in `codons`.
+        frequencies (Mapping[str, float]): Usage frequency of each codon among its synonymous codons.
+        synonymous (Mapping[str, Tuple[Tuple[str, float], ...]]): (codon, frequency) options for each amino acid.
+        alias_tables (Mapping[str, Tuple[Tuple[float, ...], Tuple[int, ...]]]): Alias table for each amino acid.
+        aa_index (Mapping[str, int]): Row of each amino acid in the batch sampling arrays.
+        option_ids (np.ndarray): (amino acids, max options) codon indices of each amino acid's options.
+        cumulative (np.ndarray): (amino acids, max options) cumulative option probabilities, padded with 2.0.
+    """
+    codons: Tuple[str, ...]
+    codon_index: Mapping[str, int]
+    frequencies: Mapping[str, float]
+    synonymous: Mapping[str, Tuple[Tuple[str, float], ...]]
+    alias_tables: Mapping[str, Tuple[Tuple[float, ...], Tuple[int, ...]]]
+    aa_index: Mapping[str, int]
+    option_ids: np.ndarray
+    cumulative: np.ndarray
+
+    @classmethod
+    def from_file(cls, filepath: str) -> "CodonTable":
+        """
+        Parses a codon usage file (codon, amino acid, frequency, ... per line) into a CodonTable.
+
+        Parameters:
+            filepath (str): Path to the codon usage file.
+
+        Returns:
+            CodonTable: The compiled table.
+        """
+        codons = []
+        frequencies = {}
+        synonymous = {}
+
+        with open(filepath, 'r') as f:
+            for line in f:
+                parts = line.strip().split()
+                if len(parts) < 3:
+                    continue  # Skip invalid rows
+                codon, aa, frequency = parts[0], parts[1], float(parts[2])
+                codons.append(codon)
+                frequencies[codon] = frequency
+                synonymous.setdefault(aa, []).append((codon, frequency))
+
+        alias_tables = {aa: build_alias_table([freq for _, freq in options]) for aa, options in synonymous.items()}
+
+        # Padded per-amino-acid arrays for drawing whole candidate matrices at once
+        aa_index = {aa: row for row, aa in enumerate(synonymous)}
+        width = max(len(options) for options in synonymous.values())
+        option_ids = np.zeros((len(synonymous), width), dtype=np.int16)
+        cumulative = np.full((len(synonymous), width), 2.0)
+        for row, options in enumerate(synonymous.values()):
+            weights = np.array([freq for _, freq in options])
+            option_ids[row, :len(options)] = [codons.index(codon) for codon, _ in options]
+            cumulative[row, :len(options)] = np.cumsum(weights) / weights.sum()
+            cumulative[row, len(options) - 1] = 1.0  # Guard against rounding below 1
+        option_ids.flags.writeable = False
+        cumulative.flags.writeable = False
+
+        return cls(
+            codons=tuple(codons),
+            codon_index=MappingProxyType({codon: i for i, codon in enumerate(codons)}),
+            frequencies=MappingProxyType(frequencies),
+            synonymous=MappingProxyType({aa: tuple(options) for aa, options in synonymous.items()}),
+            alias_tables=MappingProxyType(alias_tables),
+            aa_index=MappingProxyType(aa_index),
+            option_ids=option_ids,
+            cumulative=cumulative,
+        )
+
+    def sample(self, aa: str, rng: random.Random) -> str:
+        """
+        Draws a codon for an amino acid with probability proportional to its usage frequency, in O(1).
+
+        Parameters:
+            aa (str): Amino acid single-letter code.
+            rng (random.Random): The random number generator to draw from.
+
+        Returns:
+            str: The selected codon.
+
+        Raises:
+            ValueError: If the table has no codons for the amino acid.
+        """
+        options = self.synonymous.get(aa)
+        if not options:
+            raise ValueError(f"No codons available for amino acid {aa}")
+
+        prob, alias = self.alias_tables[aa]
+        u = rng.random() * len(options)
+        i = int(u)
+        return options[i][0] if u - i < prob[i] else options[alias[i]][0]
+
+    def sample_batch(self, peptide: str, n_candidates: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Draws a whole (candidates x amino acids) matrix of codons in one vectorized step, each codon chosen with
+        probability proportional to its usage frequency.
+
+        Parameters:
+            peptide (str): The amino acids to draw codons for.
+            n_candidates (int): Number of candidate codon sequences to draw.
+            rng (np.random.Generator): The random number generator to draw from.
+
+        Returns:
+            np.ndarray: (n_candidates, len(peptide)) codon indices into `codons`.
+
+        Raises:
+            ValueError: If the table has no codons for one of the amino acids.
+        """
+        try:
+            rows = np.array([self.aa_index[aa] for aa in peptide], dtype=np.intp)
+        except KeyError as e:
+            raise ValueError(f"No codons available for amino acid {e.args[0]}") from None
+
+        u = rng.random((n_candidates, len(peptide)))
+        choice = (u[:, :, None] >= self.cumulative[rows][None, :, :]).sum(axis=2)
+        return self.option_ids[rows[None, :], choice]
+
+    def codons_for(self, codon_ids) -> Tuple[str, ...]:
+        """
+        Converts codon indices (e.g. one row drawn by sample_batch) back into codon strings.
+        """
+        codons = self.codons
+        return tuple(codons[i] for i in codon_ids.tolist())
+
+    def ids_for(self, codons) -> np.ndarray:
+        """
+        Converts codon strings (or a list of equal-length codon lists) into codon indices, the inverse of codons_for.
+
+        Raises:
+            KeyError: If a codon is not in the table.
+        """
+        if codons and not isinstance(codons[0], str):
+            return np.array([[self.codon_index[codon] for codon in row] for row in codons], dtype=np.intp)
+        return np.array([self.codon_index[codon] for codon in codons], dtype=np.intp)
+
+@lru_cache(maxsize=None)
+def load_codon_table(filepath: str = DEFAULT_CODON_USAGE) -> CodonTable:
+    """
+    Loads a codon usage table once per process; later calls with the same path return the same object.
+
+    Parameters:
+        filepath (str): Path to the codon usage file; defaults to the packaged E. coli table.
+
+    Returns:
+        CodonTable: The shared table.
+    """
+    return CodonTable.from_file(filepath)
+
+if __name__ == "__main__":
+    table = load_codon_table()
+    rng = random.Random(42)
+    print("Leucine options:", table.synonymous['L'])
+    print("Ten leucine draws:", [table.sample('L', rng) for _ in range(10)])
+    for row in table.sample_batch("MYP", 3, np.random.default_rng(42)):
+        print("Candidate for MYP:", table.codons_for(row))
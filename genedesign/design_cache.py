@@ -0,0 +1,246 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+from typing import Iterable, Optional
+
+from genedesign.models.rbs_option import RBSOption
+from genedesign.models.transcript import Transcript
+from genedesign.rbs_library import cache_dir
+from genedesign.window_index import INDEX_VERSION
+
+# Bump whenever the designers produce different transcripts for the same inputs and settings, e.g. after a
+# change to the search algorithms, since code changes cannot be detected from the configuration
+DESIGN_VERSION = 2
+
+# Enough for several proteomes while keeping the database to a few hundred MB
+DEFAULT_MAX_ENTRIES = 1 << 17
+
+def default_cache_path() -> str:
+    """
+    Returns the default location of the design cache, inside the compiled cache directory (see rbs_library.cache_dir).
+    """
+    return os.path.join(cache_dir(), 'designs.sqlite')
+
+def design_fingerprint(designer) -> str:
+    """
+    Digests every setting of an initiated TranscriptDesigner that can change its designs: the search mode and
+    beam settings, the candidate weights, the codon usage table, the settings of every checker and the RBS library.
+
+    Parameters:
+        designer (TranscriptDesigner): An initiated designer.
+
+    Returns:
+        str: A hex digest; designers with different settings get different fingerprints.
+    """
+    settings = (
+        DESIGN_VERSION, INDEX_VERSION,
+        designer.mode, designer.beamWidth, designer.beamCandidates,
+        sorted(designer.CHECKER_WEIGHTS.items()), designer.INDEXED_CHECKS,
+        sorted(designer.codonTable.frequencies.items()),
+        designer.checker_settings(),
+        [(rbs.gene_name, rbs.utr, rbs.cds) for rbs in designer.rbsChooser.rbs_library],
+    )
+    return hashlib.sha256(repr(settings).encode()).hexdigest()
+
+def transcript_to_record(transcript: Transcript) -> str:
+    """
+    Serializes a Transcript as the JSON text stored in the cache.
+    """
+    rbs = transcript.rbs
+    return json.dumps({
+        'rbs': [rbs.utr, rbs.cds, rbs.gene_name, rbs.first_six_aas],
+        'peptide': transcript.peptide,
+        'codons': list(transcript.codons),
+    })
+
+def record_to_transcript(record: str) -> Transcript:
+    """
+    Rebuilds the Transcript stored by transcript_to_record.
+    """
+    data = json.loads(record)
+    utr, cds, gene_name, first_six_aas = data['rbs']
+    rbs = RBSOption(utr=utr, cds=cds, gene_name=gene_name, first_six_aas=first_six_aas)
+    return Transcript(rbs, data['peptide'], data['codons'])
+
+class DesignCache:
+    """
+    Persistent, content-addressed cache of designed transcripts in an SQLite database.
+
+    Entries are keyed by a digest of the peptide, the ignored RBS options, the seed and the fingerprint of
+    the designer's settings (see design_fingerprint), so changing the codon table, a checker or a weight
+    never serves a stale design; orphaned entries simply age out. Only seeded designs are worth caching, as
+    an unseeded design is random by definition.
+
+    Several processes may read and write the same database at once: it runs in write-ahead-log mode, each
+    process opens its own connection, and writers wait up to `timeout` seconds for one another. Once more
+    than `max_entries` designs are stored, the least recently used ones are evicted. Like the compiled caches
+    of rbs_library, the cache is only an optimization, so database errors and an unwritable cache directory
+    are treated as misses (and failed stores are dropped), as are records that no longer decode, which are
+    deleted. The number of stored designs is kept up to date by triggers, so stores never count the table.
+
+    Attributes:
+        path (str): Location of the database file.
+        max_entries (int): Number of designs kept.
+        hits (int): Lookups answered by this process from the cache.
+        misses (int): Lookups of this process that found no design.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = DEFAULT_MAX_ENTRIES, timeout: float = 30.0):
+        """
+        Parameters:
+            path (str or None): Database file; None uses default_cache_path().
+            max_entries (int): Number of designs to keep.
+            timeout (float): Seconds to wait for another process holding the write lock.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.path = path or default_cache_path()
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._connection = None
+        self._pid = None
+
+    def __getstate__(self):
+        # Connections cannot cross processes; the receiving process opens its own
+        state = self.__dict__.copy()
+        state['_connection'] = None
+        state['_pid'] = None
+        return state
+
+    def connection(self) -> sqlite3.Connection:
+        """
+        Returns this process's connection, opening it (and creating the database) on first use.
+        """
+        if self._connection is None or self._pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute("CREATE TABLE IF NOT EXISTS designs "
+                                   "(key TEXT PRIMARY KEY, transcript TEXT NOT NULL, last_used INTEGER NOT NULL)")
+                connection.execute("CREATE INDEX IF NOT EXISTS designs_last_used ON designs (last_used)")
+                # Triggers keep the number of designs at hand, so stores need not count the table
+                connection.execute("CREATE TABLE IF NOT EXISTS design_count "
+                                   "(id INTEGER PRIMARY KEY CHECK (id = 0), entries INTEGER NOT NULL)")
+                connection.execute("INSERT INTO design_count (id, entries) SELECT 0, (SELECT COUNT(*) FROM designs) "
+                                   "WHERE NOT EXISTS (SELECT 1 FROM design_count)")
+                connection.execute("CREATE TRIGGER IF NOT EXISTS designs_insert AFTER INSERT ON designs "
+                                   "BEGIN UPDATE design_count SET entries = entries + 1; END")
+                connection.execute("CREATE TRIGGER IF NOT EXISTS designs_delete AFTER DELETE ON designs "
+                                   "BEGIN UPDATE design_count SET entries = entries - 1; END")
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def close(self) -> None:
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+        self._pid = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    @staticmethod
+    def key(fingerprint: str, peptide: str, ignores: Iterable[RBSOption], seed: int) -> str:
+        """
+        Builds the cache key of a design.
+
+        Parameters:
+            fingerprint (str): The designer's design_fingerprint.
+            peptide (str): The protein sequence.
+            ignores (Iterable[RBSOption]): The RBS options the design must avoid.
+            seed (int): The seed the designer was reset with before designing.
+
+        Returns:
+            str: A hex digest.
+        """
+        ignored = sorted((rbs.gene_name, rbs.utr) for rbs in ignores)
+        return hashlib.sha256(json.dumps([fingerprint, peptide, ignored, seed]).encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Transcript]:
+        """
+        Returns the design stored under a key and marks it as recently used, or None on a miss.
+        """
+        try:
+            connection = self.connection()
+            row = connection.execute("SELECT transcript FROM designs WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                try:
+                    transcript = record_to_transcript(row[0])
+                except (ValueError, KeyError, TypeError):
+                    # A corrupt record is dropped, so the next store replaces it
+                    connection.execute("DELETE FROM designs WHERE key = ?", (key,))
+                    row = None
+                else:
+                    connection.execute("UPDATE designs SET last_used = ? WHERE key = ?", (time.time_ns(), key))
+        except (sqlite3.Error, OSError):
+            row = None
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return transcript
+
+    def put(self, key: str, transcript: Transcript) -> None:
+        """
+        Stores a design, then evicts the least recently used designs beyond max_entries.
+        """
+        try:
+            connection = self.connection()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                # An upsert rather than INSERT OR REPLACE, whose implicit delete would not fire designs_delete
+                connection.execute("INSERT INTO designs (key, transcript, last_used) VALUES (?, ?, ?) "
+                                   "ON CONFLICT (key) DO UPDATE SET transcript = excluded.transcript, "
+                                   "last_used = excluded.last_used",
+                                   (key, transcript_to_record(transcript), time.time_ns()))
+                excess = connection.execute("SELECT entries FROM design_count").fetchone()[0] - self.max_entries
+                if excess > 0:
+                    connection.execute("DELETE FROM designs WHERE key IN "
+                                       "(SELECT key FROM designs ORDER BY last_used LIMIT ?)", (excess,))
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        except (sqlite3.Error, OSError):
+            pass
+
+    def __len__(self) -> int:
+        return self.connection().execute("SELECT entries FROM design_count").fetchone()[0]
+
+    def clear(self) -> None:
+        """
+        Removes every stored design.
+        """
+        self.connection().execute("DELETE FROM designs")
+
+if __name__ == "__main__":
+    import tempfile
+    from genedesign.transcript_designer import TranscriptDesigner
+
+    with tempfile.TemporaryDirectory() as directory, DesignCache(os.path.join(directory, 'designs.sqlite')) as cache:
+        designer = TranscriptDesigner(design_cache=cache)
+        designer.initiate()
+        for _ in range(2):
+            designer.reseed(42)
+            start = time.perf_counter()
+            transcript = designer.run("MYPFIRTARMTV", set())
+            print(f"{transcript.rbs.gene_name} {''.join(transcript.codons)} in {(time.perf_counter() - start) * 1e3:.1f} ms")
+        print(f"{cache.hits} hits, {cache.misses} misses, {len(cache)} stored")
@@ -0,0 +1,412 @@
+import os
+import json
+import asyncio
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from genedesign.transcript_designer import TranscriptDesigner
+
+# Each worker process keeps one initialized designer for every request it serves
+_designer = None
+
+def init_worker(mode="sliding"):
+    """
+    Process-pool initializer: builds and initiates the worker's TranscriptDesigner once.
+    """
+    global _designer
+    _designer = TranscriptDesigner(mode=mode)
+    _designer.initiate()
+
+def warm_up():
+    """
+    No-op task whose only purpose is to make the pool start a worker (and so run its initializer).
+    """
+    return os.getpid()
+
+def transcript_to_json(transcript):
+    """
+    Converts a Transcript into a JSON-serializable dict.
+    """
+    return {
+        'peptide': transcript.peptide,
+        'rbs': transcript.rbs.gene_name,
+        'utr': transcript.rbs.utr,
+        'codons': list(transcript.codons),
+    }
+
+def design_request(request):
+    """
+    Designs one request with the worker's designer.
+
+    Parameters:
+        request (dict): 'peptide', plus optional 'ignores' (RBS gene names to avoid) and 'seed'.
+
+    Returns:
+        dict: {'ok': True, 'transcript': {...}} or {'ok': False, 'error': message}.
+    """
+    try:
+        ignored_names = set(request.get('ignores', ()))
+        ignores = {rbs for rbs in _designer.rbsChooser.rbs_library if rbs.gene_name in ignored_names}
+        _designer.reseed(request.get('seed'))
+        transcript = _designer.run(request['peptide'], ignores)
+        return {'ok': True, 'transcript': transcript_to_json(transcript)}
+    except Exception as e:
+        return {'ok': False, 'error': f"{type(e).__name__}: {e}"}
+
+def design_batch(requests):
+    """
+    Designs a micro-batch of requests in a worker, so one inter-process round trip serves several requests.
+    """
+    return [design_request(request) for request in requests]
+
+def parse_request(line):
+    """
+    Decodes and validates one JSON request line.
+
+    Returns:
+        dict: The request.
+
+    Raises:
+        ValueError: If the line is not a JSON object with a string 'peptide'.
+    """
+    request = json.loads(line)
+    if not isinstance(request, dict) or not isinstance(request.get('peptide'), str):
+        raise ValueError("A request must be a JSON object with a string 'peptide'")
+    if not isinstance(request.get('ignores', []), list):
+        raise ValueError("'ignores' must be a list of RBS gene names")
+    seed = request.get('seed')
+    if seed is not None and not isinstance(seed, int):
+        raise ValueError("'seed' must be an integer")
+    return request
+
+async def read_line(reader):
+    """
+    Reads one newline-terminated line from a stream, skipping lines longer than the reader's limit.
+
+    Returns:
+        bytes or None: The line (empty at the end of the stream), or None if the line was too long, in which case
+        all of it has been consumed.
+    """
+    try:
+        return await reader.readuntil(b"\n")
+    except asyncio.IncompleteReadError as e:
+        return e.partial
+    except asyncio.LimitOverrunError as e:
+        consumed = e.consumed
+    # Drop the buffered part of the line, then the rest of it up to the next newline
+    while True:
+        await reader.readexactly(consumed)
+        try:
+            await reader.readuntil(b"\n")
+            return None
+        except asyncio.IncompleteReadError:
+            return None
+        except asyncio.LimitOverrunError as e:
+            consumed = e.consumed
+
+class DesignService:
+    """
+    Local asyncio server that designs transcripts on request with a pool of warm designers.
+
+    Clients send newline-delimited JSON requests, {"id": ..., "peptide": "MYP...", "ignores": [...], "seed": 1},
+    over a local TCP or Unix socket and receive one JSON response line per request, carrying the same id:
+    {"id": ..., "ok": true, "transcript": {"peptide", "rbs", "utr", "codons"}} or {"id": ..., "ok": false, "error": ...}.
+    Responses on a connection may arrive out of order; requests without a seed get a random design.
+
+    Designers are initiated once per worker process when the service starts, so requests never pay the cold
+    start. Concurrent requests are gathered into micro-batches of up to `max_batch` requests (waiting at most
+    `batch_delay` seconds for a batch to fill) and each batch is designed in one worker round trip. Requests
+    wait in a queue of at most `max_queue` entries; once it is full, connections stop being read until it
+    drains, which pushes back on clients through the socket.
+    """
+
+    def __init__(self, workers=2, max_batch=8, batch_delay=0.005, max_queue=256, mode="sliding"):
+        """
+        Parameters:
+            workers (int): Number of designer processes.
+            max_batch (int): Largest number of requests designed in one worker round trip.
+            batch_delay (float): Longest wait, in seconds, for more requests to join a batch.
+            max_queue (int): Number of requests that may wait for a designer before reading stops.
+            mode (str): Design mode of the workers' TranscriptDesigners.
+        """
+        if workers < 1 or max_batch < 1 or max_queue < 1:
+            raise ValueError("workers, max_batch and max_queue must be at least 1")
+        if mode not in TranscriptDesigner.MODES:
+            raise ValueError(f"Unknown design mode '{mode}', expected one of {TranscriptDesigner.MODES}")
+        self.workers = workers
+        self.max_batch = max_batch
+        self.batch_delay = batch_delay
+        self.max_queue = max_queue
+        self.mode = mode
+
+        self.executor = None
+        self.queue = None
+        self.server = None
+        self.batcher = None
+        self.in_flight = None
+        self.batch_tasks = set()
+        self.batches = 0        # Worker round trips made so far
+        self.requests = 0       # Requests designed so far
+
+    async def start(self, host="127.0.0.1", port=0, path=None):
+        """
+        Starts the worker pool, waits until every designer is initiated, then starts listening.
+
+        Parameters:
+            host (str): Interface to listen on for TCP (local only by default).
+            port (int): TCP port; 0 picks a free one (see `address`).
+            path (str or None): Listen on this Unix socket instead of TCP.
+        """
+        loop = asyncio.get_running_loop()
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker, initargs=(self.mode,))
+        await asyncio.gather(*(loop.run_in_executor(self.executor, warm_up) for _ in range(self.workers)))
+
+        self.queue = asyncio.Queue(maxsize=self.max_queue)
+        self.in_flight = asyncio.Semaphore(self.workers)
+        self.batcher = asyncio.create_task(self._batch_loop())
+        if path is not None:
+            self.server = await asyncio.start_unix_server(self._handle_connection, path=path)
+        else:
+            self.server = await asyncio.start_server(self._handle_connection, host=host, port=port)
+
+    @property
+    def address(self):
+        """
+        The (host, port) or Unix socket path the service listens on.
+        """
+        return self.server.sockets[0].getsockname()
+
+    async def stop(self):
+        """
+        Stops listening, answers every queued or in-flight request with an error and shuts down the worker pool.
+        """
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.batcher is not None:
+            self.batcher.cancel()
+            await asyncio.gather(self.batcher, return_exceptions=True)
+        for task in self.batch_tasks:
+            task.cancel()
+        await asyncio.gather(*self.batch_tasks, return_exceptions=True)
+        if self.queue is not None:
+            while not self.queue.empty():
+                self._fail([self.queue.get_nowait()], "Design service stopped")
+        if self.executor is not None:
+            # Waiting for running designs to finish must not block the event loop
+            await asyncio.to_thread(self.executor.shutdown, wait=True, cancel_futures=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+        return False
+
+    async def submit(self, request):
+        """
+        Queues a parsed request from within the service's event loop and waits for its response (without the id).
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((request, future))
+        return await future
+
+    async def _batch_loop(self):
+        """
+        Gathers queued requests into batches and hands each batch to a free worker.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = []
+            try:
+                batch.append(await self.queue.get())
+                deadline = loop.time() + self.batch_delay
+                while len(batch) < self.max_batch:
+                    try:
+                        batch.append(self.queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        remaining = deadline - loop.time()
+                        if remaining <= 0:
+                            break
+                        try:
+                            batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+                        except asyncio.TimeoutError:
+                            break
+
+                # Wait for a free worker, so requests keep batching up in the queue while all workers are busy
+                await self.in_flight.acquire()
+            except asyncio.CancelledError:
+                self._fail(batch, "Design service stopped")
+                raise
+            task = asyncio.create_task(self._run_batch(batch))
+            self.batch_tasks.add(task)
+            task.add_done_callback(self.batch_tasks.discard)
+
+    @staticmethod
+    def _fail(batch, error):
+        """
+        Answers every request of a batch that is still waiting with an error.
+        """
+        for _, future in batch:
+            if not future.done():
+                future.set_result({'ok': False, 'error': error})
+
+    async def _run_batch(self, batch):
+        loop = asyncio.get_running_loop()
+        try:
+            responses = await loop.run_in_executor(self.executor, design_batch, [request for request, _ in batch])
+        except asyncio.CancelledError:
+            self._fail(batch, "Design service stopped")
+            raise
+        except Exception as e:
+            responses = [{'ok': False, 'error': f"{type(e).__name__}: {e}"}] * len(batch)
+        finally:
+            self.in_flight.release()
+        self.batches += 1
+        self.requests += len(batch)
+        for (_, future), response in zip(batch, responses):
+            if not future.done():
+                future.set_result(response)
+
+    async def _handle_connection(self, reader, writer):
+        write_lock = asyncio.Lock()
+        tasks = set()
+
+        async def respond(request_id, response):
+            async with write_lock:
+                writer.write(json.dumps({'id': request_id, **response}).encode() + b"\n")
+                await writer.drain()
+
+        try:
+            while True:
+                line = await read_line(reader)
+                if line is None:
+                    await respond(None, {'ok': False, 'error': "Bad request: line too long"})
+                    continue
+                if not line:
+                    break
+                request_id = None
+                try:
+                    raw = json.loads(line)
+                    request_id = raw.get('id') if isinstance(raw, dict) else None
+                    request = parse_request(line)
+                except ValueError as e:
+                    await respond(request_id, {'ok': False, 'error': f"Bad request: {e}"})
+                    continue
+                # Waiting here while the queue is full stops reading from this client
+                future = asyncio.get_running_loop().create_future()
+                await self.queue.put((request, future))
+                task = asyncio.create_task(self._reply(respond, request_id, future))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _reply(respond, request_id, future):
+        await respond(request_id, await future)
+
+class DesignClient:
+    """
+    Asyncio client for a DesignService; several requests may be outstanding on the one connection.
+    """
+
+    def __init__(self):
+        self.reader = None
+        self.writer = None
+        self.pending = {}
+        self.next_id = 0
+        self.listener = None
+
+    @classmethod
+    async def connect(cls, host="127.0.0.1", port=None, path=None):
+        """
+        Connects to a service over TCP (host, port) or a Unix socket (path).
+        """
+        client = cls()
+        if path is not None:
+            client.reader, client.writer = await asyncio.open_unix_connection(path)
+        else:
+            client.reader, client.writer = await asyncio.open_connection(host, port)
+        client.listener = asyncio.create_task(client._listen())
+        return client
+
+    async def _listen(self):
+        try:
+            while True:
+                line = await self.reader.readline()
+                if not line:
+                    break
+                response = json.loads(line)
+                future = self.pending.pop(response.pop('id', None), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        finally:
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Design service closed the connection"))
+            self.pending.clear()
+
+    async def design(self, peptide, ignores=(), seed=None):
+        """
+        Requests a design and waits for it.
+
+        Parameters:
+            peptide (str): The protein sequence.
+            ignores (Iterable[str]): Gene names of RBS options to avoid.
+            seed (int or None): Seed for a reproducible design.
+
+        Returns:
+            dict: The response: 'ok' and either 'transcript' or 'error'.
+        """
+        request_id = self.next_id
+        self.next_id += 1
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = future
+        request = {'id': request_id, 'peptide': peptide, 'ignores': list(ignores)}
+        if seed is not None:
+            request['seed'] = seed
+        self.writer.write(json.dumps(request).encode() + b"\n")
+        await self.writer.drain()
+        return await future
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+        if self.listener is not None:
+            await asyncio.gather(self.listener, return_exceptions=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+        return False
+
+async def serve(host, port, path, workers, max_batch, batch_delay, max_queue, mode):
+    service = DesignService(workers, max_batch, batch_delay, max_queue, mode)
+    await service.start(host, port, path)
+    print(f"Design service listening on {service.address} with {workers} warm designers")
+    async with service:
+        await service.server.serve_forever()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve transcript designs over a local socket.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port (default: 8765)")
+    parser.add_argument("--unix", metavar="PATH", help="Listen on a Unix socket instead of TCP")
+    parser.add_argument("--workers", type=int, default=2, help="Number of designer processes (default: 2)")
+    parser.add_argument("--max-batch", type=int, default=8, help="Requests per worker round trip (default: 8)")
+    parser.add_argument("--batch-delay", type=float, default=0.005, help="Seconds to wait for a batch to fill")
+    parser.add_argument("--max-queue", type=int, default=256, help="Queued requests before reading stops")
+    parser.add_argument("--mode", choices=TranscriptDesigner.MODES, default="sliding", help="Design mode")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.workers, args.max_batch, args.batch_delay,
+                          args.max_queue, args.mode))
+    except KeyboardInterrupt:
+        pass
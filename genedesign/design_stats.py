@@ -0,0 +1,125 @@
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional
+
+@dataclass
+class TimingStats:
+    """
+    Call count, wall time and verdict tally of one instrumented operation.
+
+    Attributes:
+        calls (int): Number of timed calls.
+        total_time (float): Cumulative wall time in seconds.
+        max_time (float): Longest single call in seconds.
+        passed (int): Calls whose verdict was a pass.
+        failed (int): Calls whose verdict was a failure.
+    """
+    calls: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    passed: int = 0
+    failed: int = 0
+
+    def record(self, elapsed: float, verdict: Optional[bool] = None) -> None:
+        """
+        Adds one call; a verdict of None (e.g. for RBS selection) is counted as neither pass nor fail.
+        """
+        self.calls += 1
+        self.total_time += elapsed
+        if elapsed > self.max_time:
+            self.max_time = elapsed
+        if verdict is not None:
+            if verdict:
+                self.passed += 1
+            else:
+                self.failed += 1
+
+    def merge(self, other: "TimingStats") -> None:
+        self.calls += other.calls
+        self.total_time += other.total_time
+        self.max_time = max(self.max_time, other.max_time)
+        self.passed += other.passed
+        self.failed += other.failed
+
+class DesignStats:
+    """
+    Instrumentation collected by a TranscriptDesigner: per-checker timings and verdicts, RBS selection time and
+    the timings of the RBS chooser's own checks, counts of windows processed, candidates drawn and fallbacks to
+    candidate_scorer, and design cache hits.
+
+    Designers only record into a DesignStats when given one, so instrumentation costs nothing when disabled.
+    Stats from several designers (e.g. one per worker process) can be combined with `merge`.
+
+    Attributes:
+        timings (Dict[str, TimingStats]): Timings keyed by checker name (as in CHECKER_WEIGHTS), "rbs_chooser"
+            for whole RBS selections, or the name of an RBSChooser check (see RBSChooser).
+        counters (Dict[str, int]): Event counts keyed by name, see COUNTERS.
+    """
+
+    # genes designed, windows processed, candidate windows drawn, and windows where no candidate passed every
+    # check (so candidate_scorer picked the least bad one, or the beam carried on with failing windows), and
+    # transcripts served from a DesignCache without designing
+    COUNTERS = ("genes", "windows", "candidates", "fallbacks", "cached")
+
+    def __init__(self):
+        self.timings: Dict[str, TimingStats] = {}
+        self.counters: Dict[str, int] = dict.fromkeys(self.COUNTERS, 0)
+
+    def record(self, name: str, elapsed: float, verdict: Optional[bool] = None) -> None:
+        """
+        Records one timed call of an operation.
+
+        Parameters:
+            name (str): The operation, e.g. a checker name.
+            elapsed (float): Wall time of the call in seconds.
+            verdict (bool or None): Whether the check passed, or None if the operation has no verdict.
+        """
+        timing = self.timings.get(name)
+        if timing is None:
+            timing = self.timings[name] = TimingStats()
+        timing.record(elapsed, verdict)
+
+    def count(self, name: str, n: int = 1) -> None:
+        """
+        Adds n to a counter.
+        """
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def merge(self, other: "DesignStats") -> None:
+        """
+        Adds another designer's stats into these.
+        """
+        for name, timing in other.timings.items():
+            self.timings.setdefault(name, TimingStats()).merge(timing)
+        for name, value in other.counters.items():
+            self.count(name, value)
+
+    def as_dict(self) -> dict:
+        """
+        Returns the stats as plain dictionaries, e.g. for JSON output.
+        """
+        return {
+            'timings': {name: asdict(timing) for name, timing in self.timings.items()},
+            'counters': dict(self.counters),
+        }
+
+    def format_report(self) -> List[str]:
+        """
+        Formats the stats as report lines, slowest operation first.
+        """
+        lines = [f"- {name}: {value}" for name, value in self.counters.items()]
+        for name, timing in sorted(self.timings.items(), key=lambda item: item[1].total_time, reverse=True):
+            mean = timing.total_time / timing.calls if timing.calls else 0.0
+            line = (f"- {name}: {timing.calls} calls, {timing.total_time:.2f} s total, "
+                    f"{mean * 1e6:.1f} us mean, {timing.max_time * 1e3:.2f} ms max")
+            if timing.passed or timing.failed:
+                line += f", {timing.passed} passed, {timing.failed} failed"
+            lines.append(line)
+        return lines
+
+if __name__ == "__main__":
+    stats = DesignStats()
+    stats.count("windows", 2)
+    stats.record("forbidden", 2e-6, True)
+    stats.record("promoter", 1.5e-4, False)
+    stats.record("rbs_chooser", 4e-3)
+    print("\n".join(stats.format_report()))
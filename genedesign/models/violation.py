@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class Violation:
+    """
+    A single problem found in a DNA sequence by one of the checkers.
+
+    Attributes:
+        checker (str): Name of the checker that reported it ("forbidden", "internal_rbs", "promoter" or "hairpin").
+        position (int): 0-based forward-strand coordinate of the first base involved.
+        strand (str): '+' or '-', the strand the site reads on.
+        detail (str): The offending site, as the checker reports it (e.g. the forbidden site or promoter window).
+    """
+    checker: str
+    position: int
+    strand: str
+    detail: str
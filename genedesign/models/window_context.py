@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class WindowContext:
+    """
+    Checker state carried over from the part of a CDS that has already been committed, so that a new
+    window can be checked for motifs spanning the junction without rescanning the whole sequence.
+
+    Attributes:
+        tail (str): The last committed bases, as many as the widest motif needs for lookback.
+        forbidden_state (int): The forbidden-sequence automaton state after the committed bases.
+    """
+    tail: str = ""
+    forbidden_state: int = 0
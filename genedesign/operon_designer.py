@@ -1,16 +1,66 @@
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from genedesign.transcript_designer import TranscriptDesigner
 from genedesign.operon_to_seq import operon_to_seq
 from genedesign.models.composition import Composition
 from genedesign.models.operon import Operon
+from genedesign.models.transcript import Transcript
+
+# Each worker process keeps one initialized designer for every CDS it designs
+_designer = None
+
+def init_worker():
+    """
+    Process-pool initializer: builds the worker's TranscriptDesigner once.
+    """
+    global _designer
+    _designer = TranscriptDesigner()
+    _designer.initiate()
+
+def design_cds(task):
+    """
+    Designs one CDS with the worker's designer, reseeded with the protein's own seed, and ranks the RBS options for it.
+
+    Returns:
+        tuple: (CDS, RBS options best first)
+    """
+    peptide, seed = task
+    _designer.reseed(seed)
+    cds = _designer.design_cds(peptide)
+    return cds, _designer.rbsChooser.rank(cds)
+
+def protein_seed(base_seed, index, peptide):
+    """
+    Derives a deterministic seed for one protein of a composition, so designs do not depend on which worker runs them.
+    """
+    if base_seed is None:
+        return None
+    digest = hashlib.sha256(f"{base_seed}:{index}:{peptide}".encode()).digest()
+    return int.from_bytes(digest[:8], 'big')
 
 class OperonDesigner:
     """
     https://chatgpt.com/share/66ea2d49-213c-8006-96be-c19a84fcde6e
     Constructs a DNA sequence for a (co)cistronic operon based on a Composition object that specifies an engineered organism.
+
+    The CDS of a protein does not depend on its RBS, so every CDS is designed, and the RBS options ranked for
+    it, independently, on a pool of `workers` processes when there is more than one. The RBSs are then
+    assigned in one step that gives each transcript a distinct option (see RBSChooser.assign_ranked), exactly
+    as choosing them gene by gene would. The pool is started on first use and kept until `close`.
     """
 
-    def __init__(self):
+    def __init__(self, workers=1, seed=None):
+        """
+        Parameters:
+            workers (int): Number of processes designing CDSs concurrently; 1 designs them in this process.
+            seed (int or None): Base seed from which each protein's seed is derived, for reproducible operons.
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
         self.td = None
+        self.workers = workers
+        self.seed = seed
+        self.executor = None
 
     def initiate(self) -> None:
         """
@@ -19,6 +69,45 @@ class OperonDesigner:
         self.td = TranscriptDesigner()
         self.td.initiate()
 
+    def close(self) -> None:
+        """
+        Shuts down the worker pool, if one was started.
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def design_cdss(self, proteins) -> list:
+        """
+        Designs the CDS of every protein and ranks the RBS options for it, concurrently when there are several workers.
+
+        Parameters:
+            proteins (List[str]): The protein sequences.
+
+        Returns:
+            List[tuple]: One (CDS, RBS options best first) pair per protein, in order.
+        """
+        tasks = [(peptide, protein_seed(self.seed, index, peptide)) for index, peptide in enumerate(proteins)]
+        if self.workers == 1 or len(tasks) == 1:
+            designs = []
+            for peptide, seed in tasks:
+                if seed is not None:
+                    self.td.reseed(seed)
+                cds = self.td.design_cds(peptide)
+                designs.append((cds, self.td.rbsChooser.rank(cds)))
+            return designs
+
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker)
+        return list(self.executor.map(design_cds, tasks))
+
     def run(self, comp: Composition) -> Operon:
         """
         Constructs a DNA sequence based on the composition input.
@@ -30,15 +119,16 @@ class OperonDesigner:
             Construct: The resulting DNA construct.
         """
         proteins = comp.proteins
-        organism = comp.host
-        
+
+        designs = self.design_cdss(proteins)
+
+        # Give every transcript its own RBS option
+        rbss = self.td.rbsChooser.assign_ranked([ranking for _, ranking in designs])
+
         mRNAs = []
-        ignores = set()  # To track RBS options to ignore
-        
-        for peptide in proteins:
-            mrna = self.td.run(peptide, ignores)
-            ignores.add(mrna.rbs)  # Avoid repeated RBS
-            mRNAs.append(mrna)
+        for peptide, (cds, _), rbs in zip(proteins, designs, rbss):
+            codons = [cds[i:i + 3] for i in range(0, len(cds), 3)]
+            mRNAs.append(Transcript(rbs, peptide, codons))
         
         return Operon(mRNAs, comp.promoter, comp.terminator)
 
@@ -1,41 +1,76 @@
+import time
 from genedesign.models.rbs_option import RBSOption
-from genedesign.seq_utils.calc_edit_distance import calculate_edit_distance
-from genedesign.seq_utils.hairpin_counter import hairpin_counter
+from genedesign.rbs_library import load_rbs_library
+from genedesign.seq_utils.calc_edit_distance import myers_edit_distances
+from genedesign.seq_utils.hairpin_counter import hairpin_counter, junction_hairpin_count
 from genedesign.seq_utils.Translate import Translate
-import pandas as pd  # type:ignore
 
-df = pd.read_csv('/Users/haripartha/Documents/bioe134-234-transcriptdesigner-project-3-hari-partha/genedesign/data/top_5_percent_gene_data')
-
-from typing import Set
+from typing import Dict, List, Set, Tuple
 
 class RBSChooser:
     """
     A class to choose the best RBS for a given CDS sequence.
+
+    Given a DesignStats in `stats`, the chooser records the time of its checks: "rbs_cds_hairpin" (hairpins
+    inside the CDS, once per selection), "rbs_edit_distance" (translating the CDS start and comparing it with
+    every option) and "rbs_hairpin" (junction hairpins of one option, passing if the UTR + CDS holds at most
+    4 hairpins).
     """
 
     rbs_options: Set[RBSOption] = set()
+    rbs_library: List[RBSOption] = []
     translator: Translate = Translate()
+    utr_hairpin_counts: Dict[RBSOption, int] = {}
+    stats = None  # DesignStats or None
 
     def initiate(self) -> None:
         """
         Initialization method for RBSChooser.
+
+        The RBS options come from the packaged library (see rbs_library.load_rbs_library), which is compiled
+        once into a binary cache together with the first six amino acids and UTR hairpin count of each option.
         """
+        self.translator = Translate()
         self.translator.initiate()
 
-        # Populate RBS options from the provided dataset
-        for _, value in df.iterrows():
-            gene_name = value['gene']
-            utr = value['UTR']
-            cds = value['CDS']
-            first_six_aas = self.translator.run(cds)[:6]
-
-            rbs_option = RBSOption(
-                utr=utr,
-                cds=cds,
-                gene_name=gene_name,
-                first_six_aas=first_six_aas
-            )
-            self.rbs_options.add(rbs_option)
+        # Populate RBS options from the packaged dataset, keeping library order for deterministic tie-breaking
+        library = load_rbs_library()
+        self.rbs_library = [rbs_option for rbs_option, _ in library]
+        self.rbs_options = set(self.rbs_library)
+
+        # The hairpins inside each UTR are the same whatever CDS it is paired with
+        self.utr_hairpin_counts = {rbs_option: utr_hairpin_count for rbs_option, utr_hairpin_count in library}
+
+    def _cds_features(self, cds: str, options: List[RBSOption]) -> Tuple[int, List[int]]:
+        """
+        Computes what does not depend on pairing: the hairpins inside the CDS and the edit distance between its
+        first six amino acids and those of every option.
+        """
+        stats = self.stats
+        start = time.perf_counter() if stats is not None else 0.0
+        cds_hairpin_count = hairpin_counter(cds, report=False)[0]
+        if stats is not None:
+            middle = time.perf_counter()
+            stats.record("rbs_cds_hairpin", middle - start)
+            start = middle
+
+        translated_input_peptide = self.translator.run(cds[:18])[:6]
+        # Calculate peptide similarity (edit distance) with the translated CDS for every option in one batch
+        distances = myers_edit_distances(translated_input_peptide, [rbs.first_six_aas for rbs in options])
+        if stats is not None:
+            stats.record("rbs_edit_distance", time.perf_counter() - start)
+        return cds_hairpin_count, distances
+
+    def _hairpin_count(self, rbs: RBSOption, cds: str, cds_hairpin_count: int) -> int:
+        """
+        Hairpin count of UTR + CDS: only the hairpins spanning the junction need to be found per option.
+        """
+        if self.stats is None:
+            return self.utr_hairpin_counts[rbs] + cds_hairpin_count + junction_hairpin_count(rbs.utr, cds)
+        start = time.perf_counter()
+        hairpin_count = self.utr_hairpin_counts[rbs] + cds_hairpin_count + junction_hairpin_count(rbs.utr, cds)
+        self.stats.record("rbs_hairpin", time.perf_counter() - start, hairpin_count <= 4)
+        return hairpin_count
 
     def run(self, cds: str, ignores: Set[RBSOption]) -> RBSOption:
         """
@@ -49,7 +84,7 @@ class RBSChooser:
         - RBSOption: The selected RBSOption that best pairs with the given CDS.
         """
         # Exclude RBS options in the ignore set
-        valid_rbs_options = [rbs for rbs in self.rbs_options if rbs not in ignores]
+        valid_rbs_options = [rbs for rbs in self.rbs_library if rbs not in ignores]
 
         # Check if valid options remain after exclusion
         if not valid_rbs_options:
@@ -60,14 +95,15 @@ class RBSChooser:
         fallback_rbs = None
         fallback_score = float("inf")  # Fallback option with lowest peptide edit distance
 
-        for rbs in valid_rbs_options:
-            # Combine UTR and CDS sequences to evaluate hairpin structure
-            combined_sequence = rbs.utr + cds
-            hairpin_count = hairpin_counter(combined_sequence)[0]
+        # Hairpins inside the CDS and its first six amino acids do not depend on the RBS option
+        cds_hairpin_count, peptide_edit_distances = self._cds_features(cds, valid_rbs_options)
 
-            # Calculate peptide similarity (edit distance) with the translated CDS
-            translated_input_peptide = self.translator.run(cds)[:6]
-            peptide_edit_distance = calculate_edit_distance(translated_input_peptide, rbs.first_six_aas)
+        for rbs, peptide_edit_distance in zip(valid_rbs_options, peptide_edit_distances):
+            # The fallback score never exceeds the best score, so an option no closer than the best cannot win either way
+            if peptide_edit_distance >= best_score:
+                continue
+
+            hairpin_count = self._hairpin_count(rbs, cds, cds_hairpin_count)
 
             # Fallback: Track the RBS with the lowest peptide edit distance for use if no RBS meets all criteria
             if peptide_edit_distance < fallback_score:
@@ -81,3 +117,70 @@ class RBSChooser:
 
         # Return the best RBS if found; otherwise, use the fallback RBS with the lowest peptide edit distance
         return best_rbs if best_rbs is not None else fallback_rbs
+
+    def rank(self, cds: str, ignores: Set[RBSOption] = frozenset()) -> List[RBSOption]:
+        """
+        Orders every RBS option not ignored from most to least suitable for the given CDS.
+
+        Options whose UTR + CDS holds at most 4 hairpins come first, each group ordered by peptide edit distance
+        and then library order, so the first option is the one `run` selects.
+
+        Parameters:
+        - cds (str): The coding sequence to pair with an RBS.
+        - ignores (Set[RBSOption]): RBSOption instances to leave out.
+
+        Returns:
+        - List[RBSOption]: The remaining options, best first.
+        """
+        valid_rbs_options = [rbs for rbs in self.rbs_library if rbs not in ignores]
+        if not valid_rbs_options:
+            raise ValueError("No valid RBS options remaining after exclusion.")
+
+        cds_hairpin_count, peptide_edit_distances = self._cds_features(cds, valid_rbs_options)
+
+        keys = []
+        for index, (rbs, peptide_edit_distance) in enumerate(zip(valid_rbs_options, peptide_edit_distances)):
+            hairpin_count = self._hairpin_count(rbs, cds, cds_hairpin_count)
+            keys.append((hairpin_count > 4, peptide_edit_distance, index))
+        return [valid_rbs_options[index] for *_, index in sorted(keys)]
+
+    def assign(self, cdss: List[str], ignores: Set[RBSOption] = frozenset()) -> List[RBSOption]:
+        """
+        Picks a distinct RBS option for each of several coding sequences, e.g. the genes of an operon.
+
+        Every CDS's options are ranked independently, then each CDS in turn takes its best-ranked option not
+        already taken. This gives the same RBSs as calling `run` gene by gene while adding each choice to the
+        ignores, but the ranking of each CDS no longer waits for the choices before it.
+
+        Parameters:
+        - cdss (List[str]): The coding sequences, in the order they take their pick.
+        - ignores (Set[RBSOption]): RBSOption instances none of them may use.
+
+        Returns:
+        - List[RBSOption]: One distinct option per CDS.
+
+        Raises:
+        - ValueError: If there are fewer options than coding sequences.
+        """
+        if len(self.rbs_library) - len(set(ignores) & self.rbs_options) < len(cdss):
+            raise ValueError("Not enough RBS options to give every transcript a distinct one.")
+        return self.assign_ranked([self.rank(cds, ignores) for cds in cdss])
+
+    @staticmethod
+    def assign_ranked(rankings: List[List[RBSOption]]) -> List[RBSOption]:
+        """
+        Gives each transcript in turn its best-ranked option not already taken, from rankings made by `rank`
+        (possibly in other processes).
+
+        Raises:
+        - ValueError: If a ranking runs out of options not taken by earlier transcripts.
+        """
+        taken = set()
+        assigned = []
+        for ranking in rankings:
+            rbs = next((rbs for rbs in ranking if rbs not in taken), None)
+            if rbs is None:
+                raise ValueError("Not enough RBS options to give every transcript a distinct one.")
+            taken.add(rbs)
+            assigned.append(rbs)
+        return assigned
@@ -0,0 +1,110 @@
+import csv
+import hashlib
+import os
+import pickle
+import tempfile
+from functools import lru_cache
+from typing import List, Tuple
+
+from genedesign.models.rbs_option import RBSOption
+from genedesign.seq_utils.hairpin_counter import hairpin_counter
+from genedesign.seq_utils.Translate import Translate
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+DEFAULT_RBS_LIBRARY = os.path.join(DATA_DIR, 'top_5_percent_gene_data')
+
+# Bump whenever the cached record layout or the precomputed features change
+CACHE_VERSION = 1
+
+def cache_dir() -> str:
+    """
+    Returns the directory holding compiled caches, taken from GENEDESIGN_CACHE_DIR or defaulting to ~/.cache/genedesign.
+    """
+    return os.environ.get('GENEDESIGN_CACHE_DIR') or os.path.join(os.path.expanduser('~'), '.cache', 'genedesign')
+
+def write_cache(path: str, version: int, payload) -> None:
+    """
+    Pickles a versioned payload to a cache file atomically, so concurrent processes never see a partial file.
+    Failures (e.g. a read-only cache directory) are ignored, since the cache is only an optimization.
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump((version, payload), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def read_cache(path: str, version: int):
+    """
+    Loads a payload written by write_cache, or returns None if it is missing, unreadable or from another version.
+    """
+    try:
+        with open(path, 'rb') as f:
+            cached_version, payload = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        return None
+    return payload if cached_version == version else None
+
+def compile_rbs_library(source: bytes) -> List[Tuple[str, str, str, str, int]]:
+    """
+    Parses the RBS library table (columns: index, gene, UTR, CDS) and precomputes per-option features.
+
+    Parameters:
+        source (bytes): The raw contents of the library file.
+
+    Returns:
+        List[Tuple[str, str, str, str, int]]: (gene_name, utr, cds, first_six_aas, utr_hairpin_count) per option.
+    """
+    translator = Translate()
+    translator.initiate()
+
+    records = []
+    reader = csv.DictReader(source.decode('utf-8').splitlines())
+    for row in reader:
+        utr = row['UTR']
+        cds = row['CDS']
+        first_six_aas = translator.run(cds[:18])[:6]
+        utr_hairpin_count = hairpin_counter(utr, report=False)[0]
+        records.append((row['gene'], utr, cds, first_six_aas, utr_hairpin_count))
+    return records
+
+@lru_cache(maxsize=None)
+def load_rbs_library(path: str = DEFAULT_RBS_LIBRARY) -> Tuple[Tuple[RBSOption, int], ...]:
+    """
+    Loads the RBS library, compiling it on first use into a binary cache that later processes load directly.
+
+    The cache file is named after a digest of the library contents, so editing the library never serves stale
+    options. Within a process the result is memoized.
+
+    Parameters:
+        path (str): Path to the library file; defaults to the packaged top 5% gene table.
+
+    Returns:
+        Tuple[Tuple[RBSOption, int], ...]: Each RBS option with the hairpin count of its UTR, in library order.
+    """
+    with open(path, 'rb') as f:
+        source = f.read()
+    digest = hashlib.sha256(source).hexdigest()[:16]
+    cache_path = os.path.join(cache_dir(), f'rbs_library_{digest}.pkl')
+
+    records = read_cache(cache_path, CACHE_VERSION)
+    if records is None:
+        records = compile_rbs_library(source)
+        write_cache(cache_path, CACHE_VERSION, records)
+
+    return tuple(
+        (RBSOption(utr=utr, cds=cds, gene_name=gene_name, first_six_aas=first_six_aas), utr_hairpin_count)
+        for gene_name, utr, cds, first_six_aas, utr_hairpin_count in records
+    )
+
+if __name__ == "__main__":
+    library = load_rbs_library()
+    print(f"Loaded {len(library)} RBS options from {DEFAULT_RBS_LIBRARY}")
+    option, utr_hairpins = library[0]
+    print(f"{option.gene_name}: UTR {option.utr}, first six AAs {option.first_six_aas}, UTR hairpins {utr_hairpins}")
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from genedesign.seq_utils.dna_sequence import DNASequence
 
 @dataclass
 class Translate:
@@ -38,7 +39,8 @@ class Translate:
         Translates a DNA sequence into a protein sequence using the codon table.
 
         Parameters:
-            dna_sequence (str): The DNA sequence to translate.
+            dna_sequence (str or DNASequence): The DNA sequence to translate. Codons of a DNASequence are
+                read straight from its packed bytes.
 
         Returns:
             str: The corresponding amino acid sequence.
@@ -49,6 +51,11 @@ class Translate:
         if len(dna_sequence) % 3 != 0:
             raise ValueError("The DNA sequence length must be a multiple of 3.")
 
+        # Plain strings are sliced directly, which is what nearly every caller passes
+        if isinstance(dna_sequence, DNASequence):
+            codons = map(dna_sequence.codon, range(len(dna_sequence) // 3))
+            return self._translate_codons(codons, len(dna_sequence) // 3)
+
         protein = []
         for i in range(0, len(dna_sequence), 3):
             codon = dna_sequence[i:i+3]
@@ -63,6 +70,23 @@ class Translate:
 
         return ''.join(protein)
 
+    def _translate_codons(self, codons, n_codons: int) -> str:
+        """
+        Translates codons one by one, with the same checks as `run`.
+        """
+        protein = []
+        for k, codon in enumerate(codons, start=1):
+            if codon not in self.codon_table:
+                raise ValueError(f"Invalid codon '{codon}' encountered in DNA sequence.")
+            amino_acid = self.codon_table[codon]
+            if amino_acid == "Stop":
+                if k != n_codons:
+                    raise ValueError("Untranslated sequence after stop codon.")
+                break
+            protein.append(amino_acid)
+
+        return ''.join(protein)
+
 def main():
     # Example usage
     translator = Translate()
@@ -0,0 +1,80 @@
+from collections import deque
+
+def build_automaton(patterns, alphabet="ACGT"):
+    """
+    Compiles a list of patterns into an Aho-Corasick automaton so that every pattern can be located
+    in a single left-to-right pass over a sequence.
+
+    The failure links are folded into a complete transition table, so scanning a sequence costs one
+    dictionary lookup per character. Lowercase characters share the transitions of their uppercase
+    counterparts, and any character outside the alphabet sends the automaton back to the root state.
+
+    Parameters:
+        patterns (list[str]): The patterns to compile (uppercase, drawn from the alphabet).
+        alphabet (str): The characters that can appear in a pattern.
+
+    Returns:
+        tuple: (list[dict], list[tuple])
+            - The transition table: transitions[state][char] is the next state.
+            - The outputs: outputs[state] is a tuple of the indices of every pattern ending in that state.
+    """
+    goto = [{}]
+    outputs = [[]]
+
+    # Build the trie of all patterns
+    for index, pattern in enumerate(patterns):
+        state = 0
+        for char in pattern:
+            if char not in alphabet:
+                raise ValueError(f"Invalid character '{char}' in pattern '{pattern}'.")
+            if char not in goto[state]:
+                goto.append({})
+                outputs.append([])
+                goto[state][char] = len(goto) - 1
+            state = goto[state][char]
+        outputs[state].append(index)
+
+    # Breadth-first pass to compute failure links and fold them into a full transition table
+    transitions = [dict() for _ in goto]
+    fail = [0] * len(goto)
+    queue = deque()
+    for char in alphabet:
+        child = goto[0].get(char, 0)
+        transitions[0][char] = child
+        if child:
+            queue.append(child)
+
+    while queue:
+        state = queue.popleft()
+        outputs[state].extend(outputs[fail[state]])
+        for char in alphabet:
+            child = goto[state].get(char)
+            if child is None:
+                transitions[state][char] = transitions[fail[state]][char]
+            else:
+                fail[child] = transitions[fail[state]][char]
+                transitions[state][char] = child
+                queue.append(child)
+
+    # Lowercase input follows the same transitions as uppercase input
+    for table in transitions:
+        for char in alphabet:
+            table[char.lower()] = table[char]
+
+    return transitions, [tuple(out) for out in outputs]
+
+def main():
+    # Example usage
+    patterns = ["GAATTC", "AATT", "TTC"]
+    transitions, outputs = build_automaton(patterns)
+
+    sequence = "CCGAATTCGG"
+    state = 0
+    for position, char in enumerate(sequence):
+        state = transitions[state].get(char, 0)
+        for index in outputs[state]:
+            pattern = patterns[index]
+            print(f"{pattern} found at position {position - len(pattern) + 1}")
+
+if __name__ == "__main__":
+    main()
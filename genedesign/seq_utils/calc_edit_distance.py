@@ -1,33 +1,113 @@
-def calculate_edit_distance(s1, s2):
+def calculate_edit_distance(s1, s2, max_distance=None):
     """
     Compute the edit distance between two strings using a dynamic programming approach based on the Smith-Waterman algorithm for local alignment.
 
+    With a cutoff, only the band of cells within `max_distance` of the diagonal is computed, one row at a time,
+    and the computation stops as soon as every cell of a row exceeds the cutoff.
+
     Parameters:
         s1 (str): The first string to compare.
         s2 (str): The second string to compare.
+        max_distance (int or None): Largest distance of interest; None computes the exact distance however large.
 
     Returns:
         int: The edit distance between the two strings, defined as the minimum number of edits (insertions, deletions, or substitutions) required to transform one string into the other.
+        With a cutoff, any distance above it is reported as max_distance + 1.
     """
     s1_len = len(s1)
     s2_len = len(s2)
-    dist = [[0] * (s2_len + 1) for _ in range(s1_len + 1)]
+    if max_distance is None:
+        max_distance = max(s1_len, s2_len)
+    elif max_distance < 0 or abs(s1_len - s2_len) > max_distance:
+        return max_distance + 1  # The length difference alone needs more edits than allowed
 
-    # Initialize distances for transformations involving empty strings
-    for i in range(s1_len + 1):
-        dist[i][0] = i
-    for j in range(s2_len + 1):
-        dist[0][j] = j
+    over = max_distance + 1  # Stands in for every distance above the cutoff
+    # Distances for transformations of the empty prefix of s1; cells outside the band hold `over`
+    previous = [j if j <= max_distance else over for j in range(s2_len + 1)]
 
-    # Compute distances
+    # Compute distances row by row, within the band |i - j| <= max_distance
     for i in range(1, s1_len + 1):
-        for j in range(1, s2_len + 1):
-            if s1[i - 1] == s2[j - 1]:
-                dist[i][j] = dist[i - 1][j - 1]
+        lo = max(1, i - max_distance)
+        hi = min(s2_len, i + max_distance)
+        current = [over] * (s2_len + 1)
+        current[0] = i if i <= max_distance else over
+        row_min = current[0]
+        c1 = s1[i - 1]
+        for j in range(lo, hi + 1):
+            if c1 == s2[j - 1]:
+                d = previous[j - 1]
             else:
-                dist[i][j] = 1 + min(dist[i - 1][j], dist[i][j - 1], dist[i - 1][j - 1])
+                d = 1 + min(previous[j], current[j - 1], previous[j - 1])
+            d = min(d, over)
+            current[j] = d
+            if d < row_min:
+                row_min = d
+        if row_min > max_distance:
+            return over  # Distances never decrease from one row to the next along any alignment
+        previous = current
+
+    return previous[s2_len]
+
+def myers_edit_distances(pattern, targets, max_distance=None):
+    """
+    Compute the edit distance between one pattern and many targets with Myers' bit-parallel algorithm.
+
+    The pattern's match bitmasks are built once, and each target is then processed one character at a time, with
+    a whole column of the dynamic programming table held in the bits of two integers. With a cutoff, a target is
+    abandoned as soon as the remaining characters could no longer bring its distance back within it.
+
+    Parameters:
+        pattern (str): The string every target is compared with.
+        targets (Iterable[str]): The strings to compare with the pattern.
+        max_distance (int or None): Largest distance of interest; None computes exact distances.
+
+    Returns:
+        list[int]: The edit distance of each target, in order. With a cutoff, distances above it are reported
+        as max_distance + 1.
+    """
+    m = len(pattern)
+    mask = (1 << m) - 1
+    high_bit = 1 << (m - 1) if m else 0
+
+    # Bit i of peq[c] is set when pattern[i] == c
+    peq = {}
+    for i, c in enumerate(pattern):
+        peq[c] = peq.get(c, 0) | (1 << i)
+
+    distances = []
+    for target in targets:
+        n = len(target)
+        if max_distance is not None and abs(m - n) > max_distance:
+            distances.append(max_distance + 1)
+            continue
+        if not m:
+            distances.append(n if max_distance is None or n <= max_distance else max_distance + 1)
+            continue
 
-    return dist[s1_len][s2_len]
+        # Vertical deltas of the current column are all +1 (D[i][0] = i); score tracks D[m][j]
+        vp, vn, score = mask, 0, m
+        for j, c in enumerate(target, start=1):
+            eq = peq.get(c, 0)
+            xv = eq | vn
+            xh = (((eq & vp) + vp) ^ vp) | eq
+            hp = vn | ~(xh | vp)
+            hn = vp & xh
+            if hp & high_bit:
+                score += 1
+            elif hn & high_bit:
+                score -= 1
+            # The top row D[0][j] = j increases by one per column
+            hp = ((hp << 1) | 1) & mask
+            hn = (hn << 1) & mask
+            vp = hn | (~(xv | hp) & mask)
+            vn = hp & xv
+            # The last row can only drop by one per remaining column
+            if max_distance is not None and score - (n - j) > max_distance:
+                score = max_distance + 1
+                break
+        distances.append(score if max_distance is None else min(score, max_distance + 1))
+
+    return distances
 
 def main():
     # Example usage
@@ -35,10 +115,16 @@ def main():
         ("AACAAGATAT", "AACATGATAT", "Edit distance 1"),
         ("AACAAGTTAT", "ATCAAGTTCT", "Edit distance 2")
     ]
-    
+
     for s1, s2, label in pairs:
         distance = calculate_edit_distance(s1, s2)
         print(f"{label}: {distance}")
 
+    # Stop as soon as the distance is known to exceed 1
+    print("Cutoff 1:", calculate_edit_distance("AACAAGTTAT", "ATCAAGTTCT", max_distance=1))
+
+    # One pattern against many targets
+    print("Bit-parallel:", myers_edit_distances("AACAAGATAT", [s2 for _, s2, _ in pairs]))
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,165 @@
+import numpy as np
+
+# Lookup tables mapping ASCII characters to base codes (A=0, C=1, G=2, T=3, anything else=4)
+BASES = "ACGT"
+BASE_CODES = np.full(256, 4, dtype=np.uint8)
+for _code, _base in enumerate(BASES):
+    BASE_CODES[ord(_base)] = _code
+    BASE_CODES[ord(_base.lower())] = _code
+COMPLEMENT_CODES = np.array([3, 2, 1, 0, 4], dtype=np.uint8)
+COMPLEMENT_TABLE = str.maketrans("ACGT", "TGCA")
+
+# ASCII byte of each base code, and the four base codes packed into each byte (first base in the high bits)
+_BASE_BYTES = np.frombuffer(BASES.encode("ascii"), dtype=np.uint8)
+_SHIFTS = np.array([6, 4, 2, 0], dtype=np.uint8)
+_UNPACKED = (np.arange(256, dtype=np.uint8)[:, None] >> _SHIFTS) & 3
+
+def encode_sequence(seq):
+    """
+    Encodes a DNA sequence as a uint8 array of base codes (A=0, C=1, G=2, T=3, other=4).
+
+    Parameters:
+        seq (str or DNASequence): The DNA sequence to encode (case-insensitive).
+
+    Returns:
+        np.ndarray: The encoded sequence.
+    """
+    if isinstance(seq, DNASequence):
+        return seq.codes()
+    return BASE_CODES[np.frombuffer(seq.encode("latin-1", "replace"), dtype=np.uint8)]
+
+class DNASequence:
+    """
+    An immutable DNA sequence stored 2 bits per base, four bases to a byte.
+
+    Slicing returns a view sharing the packed bytes, the reverse complement is computed on first use and
+    cached, and single codons are read straight from the packed bytes. str(seq) gives the uppercase string,
+    and sequences compare equal to the strings they hold, so the checkers, Translate and hairpin_counter
+    accept either.
+
+    Only A, C, G and T (in either case) can be stored.
+    """
+
+    __slots__ = ("_data", "_start", "_length", "_rc")
+
+    def __init__(self, seq=""):
+        """
+        Parameters:
+            seq (str or DNASequence): The bases to store.
+
+        Raises:
+            ValueError: If the sequence contains anything other than A, C, G and T.
+        """
+        if isinstance(seq, DNASequence):
+            self._data, self._start, self._length, self._rc = seq._data, seq._start, seq._length, seq._rc
+            return
+        codes = BASE_CODES[np.frombuffer(seq.encode("latin-1", "replace"), dtype=np.uint8)]
+        if codes.size and codes.max() > 3:
+            raise ValueError("DNASequence can only hold the bases A, C, G and T.")
+        self._data = DNASequence._pack(codes)
+        self._start = 0
+        self._length = len(codes)
+        self._rc = None
+
+    @staticmethod
+    def _pack(codes):
+        padded = np.zeros(-(-len(codes) // 4) * 4, dtype=np.uint8)
+        padded[:len(codes)] = codes
+        return (padded.reshape(-1, 4) << _SHIFTS).sum(axis=1, dtype=np.uint8).tobytes()
+
+    @classmethod
+    def _view(cls, data, start, length):
+        view = cls.__new__(cls)
+        view._data, view._start, view._length, view._rc = data, start, length, None
+        return view
+
+    @classmethod
+    def from_codes(cls, codes):
+        """
+        Builds a sequence from base codes (A=0, C=1, G=2, T=3).
+        """
+        codes = np.asarray(codes, dtype=np.uint8)
+        return cls._view(cls._pack(codes), 0, len(codes))
+
+    def codes(self):
+        """
+        Returns the bases as a uint8 array of base codes (A=0, C=1, G=2, T=3).
+        """
+        first = self._start >> 2
+        last = (self._start + self._length + 3) >> 2
+        unpacked = _UNPACKED[np.frombuffer(self._data, dtype=np.uint8, count=last - first, offset=first)].ravel()
+        offset = self._start & 3
+        return unpacked[offset:offset + self._length]
+
+    def base_code(self, i):
+        """
+        Returns the code of the base at position i (which must be in range), read from the packed bytes.
+        """
+        p = self._start + i
+        return (self._data[p >> 2] >> (6 - 2 * (p & 3))) & 3
+
+    def codon(self, i):
+        """
+        Returns codon i (bases 3i to 3i + 2) in constant time.
+
+        Raises:
+            IndexError: If the sequence has fewer than i + 1 whole codons.
+        """
+        if i < 0 or 3 * i + 3 > self._length:
+            raise IndexError("codon index out of range")
+        p = 3 * i
+        return BASES[self.base_code(p)] + BASES[self.base_code(p + 1)] + BASES[self.base_code(p + 2)]
+
+    def reverse_complement(self):
+        """
+        Returns the reverse complement, computed on first use and cached on both sequences.
+        """
+        if self._rc is None:
+            rc = DNASequence.from_codes(3 - self.codes()[::-1])
+            rc._rc = self
+            self._rc = rc
+        return self._rc
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._length)
+            if step != 1:
+                return DNASequence(str(self)[index])
+            return DNASequence._view(self._data, self._start + start, max(stop - start, 0))
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("DNASequence index out of range")
+        return BASES[self.base_code(index)]
+
+    def __str__(self):
+        return _BASE_BYTES[self.codes()].tobytes().decode("ascii")
+
+    def __repr__(self):
+        return f"DNASequence('{self}')"
+
+    def __iter__(self):
+        return iter(str(self))
+
+    def __eq__(self, other):
+        if isinstance(other, (DNASequence, str)):
+            return len(self) == len(other) and str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __add__(self, other):
+        if isinstance(other, (DNASequence, str)):
+            return DNASequence(str(self) + str(other))
+        return NotImplemented
+
+if __name__ == "__main__":
+    seq = DNASequence("ATGCGACGTTAA")
+    print(seq, len(seq), "bases in", len(seq._data), "bytes")
+    print("Codon 1:", seq.codon(1))
+    print("View [3:9]:", seq[3:9], "sharing bytes:", seq[3:9]._data is seq._data)
+    print("Reverse complement:", seq.reverse_complement())
@@ -1,49 +1,122 @@
-from genedesign.seq_utils.reverse_complement import reverse_complement
+from bisect import bisect_left
 
-def hairpin_counter(sequence, min_stem=3, min_loop=4, max_loop=9):
+# Complements A, C, G and T; every other character maps to NUL so it never pairs with anything
+STEM_COMPLEMENT_TABLE = {code: "\0" for code in range(256)}
+STEM_COMPLEMENT_TABLE.update(str.maketrans("ACGT", "TGCA"))
+
+def find_hairpins(sequence, min_stem=3, min_loop=4, max_loop=9):
     """
-    Counts the number of potential hairpin structures in a DNA sequence and returns a simple linear
-    representation of the hairpins (stem1(loop)stem2_rc), or None if no hairpins are found.
+    Locates potential hairpin structures in a DNA sequence.
+
+    The reverse complement is computed once and every stem k-mer is indexed by its start positions, so
+    complementary partners for a stem are found by a hash lookup and a bisect into the allowed loop range
+    instead of by comparing every pair of positions.
 
     Parameters:
-        sequence (str): The DNA sequence to analyze.
+        sequence (str or DNASequence): The DNA sequence to analyze.
         min_stem (int): Minimum number of bases in the stem for stable hairpin.
         min_loop (int): Minimum number of bases in the loop.
         max_loop (int): Maximum number of bases in the loop.
 
     Returns:
-        tuple: (int, str or None)
-            - The count of potential hairpin structures.
-            - A single string showing the detected hairpins in the format 'stem1(loop)stem2_rc', or None if no hairpins are found.
+        list[tuple]: (i, j) start positions of the two stems of every hairpin, ordered by i and then j.
     """
-    count = 0
+    sequence = str(sequence)
     seq_len = len(sequence)
-    hairpin_string = ""
+    rc = sequence.translate(STEM_COMPLEMENT_TABLE)[::-1]
+
+    # Index the start positions of every stem-sized k-mer
+    kmer_positions = {}
+    for j in range(seq_len - min_stem + 1):
+        kmer = sequence[j:j + min_stem]
+        if kmer in kmer_positions:
+            kmer_positions[kmer].append(j)
+        else:
+            kmer_positions[kmer] = [j]
+
+    hairpins = []
+    for i in range(seq_len - min_stem + 1):
+        # The partner stem must equal the reverse complement of this stem
+        partners = kmer_positions.get(rc[seq_len - i - min_stem:seq_len - i])
+        if not partners:
+            continue
+        last = i + min_stem + max_loop
+        k = bisect_left(partners, i + min_stem + min_loop)
+        while k < len(partners) and partners[k] <= last:
+            hairpins.append((i, partners[k]))
+            k += 1
+
+    return hairpins
+
+def junction_hairpin_count(left, right, min_stem=3, min_loop=4, max_loop=9):
+    """
+    Counts the hairpins of left + right that span the junction between the two sequences.
+
+    A hairpin is at most 2 * min_stem + max_loop bases wide, so only that many bases on either side of
+    the junction need to be examined. Together with the counts for left and right on their own this gives
+    the count for the joined sequence without rescanning it.
 
-    # Iterate through each base to consider it as a start of a stem
-    for i in range(seq_len):
-        # Only consider end points that would fit within the loop constraints
-        for j in range(i + min_stem + min_loop, min(i + min_stem + max_loop + 1, seq_len)):
-            stem1 = sequence[i:i+min_stem]
-            stem2 = sequence[j:j+min_stem]
+    Parameters:
+        left (str or DNASequence): The upstream sequence.
+        right (str or DNASequence): The downstream sequence.
+        min_stem (int): Minimum number of bases in the stem for stable hairpin.
+        min_loop (int): Minimum number of bases in the loop.
+        max_loop (int): Maximum number of bases in the loop.
+
+    Returns:
+        int: The number of hairpins with bases on both sides of the junction.
+    """
+    reach = 2 * min_stem + max_loop - 1
+    left, right = str(left), str(right)
+    tail = left[-reach:] if left else ""
+    boundary = len(tail)
+    hairpins = find_hairpins(tail + right[:reach], min_stem, min_loop, max_loop)
+    return sum(1 for i, j in hairpins if i < boundary < j + min_stem)
+
+def format_hairpins(sequence, hairpins, min_stem=3):
+    """
+    Builds the linear representation (stem1(loop)stem2, one hairpin per line) of a list of hairpins.
 
-            # Check if the stems are complementary (reverse complement match)
-            stem2_rc = reverse_complement(stem2)
+    Parameters:
+        sequence (str or DNASequence): The DNA sequence the hairpins were found in.
+        hairpins (list[tuple]): (i, j) stem start positions as returned by find_hairpins.
+        min_stem (int): Number of bases in the stem.
 
-            if stem1 == stem2_rc:
-                count += 1
+    Returns:
+        str: One 'Hairpin n: stem1(loop)stem2' line per hairpin.
+    """
+    sequence = str(sequence)
+    return ''.join(
+        f"Hairpin {count}: {sequence[i:i + min_stem]}({sequence[i + min_stem:j]}){sequence[j:j + min_stem]}\n"
+        for count, (i, j) in enumerate(hairpins, start=1)
+    )
 
-                # Extract the loop sequence
-                loop = sequence[i+min_stem:j]
+def hairpin_counter(sequence, min_stem=3, min_loop=4, max_loop=9, report=True):
+    """
+    Counts the number of potential hairpin structures in a DNA sequence and returns a simple linear
+    representation of the hairpins (stem1(loop)stem2_rc), or None if no hairpins are found.
 
-                # Create the linear representation (now correctly reversed for output)
-                hairpin_representation = f"{stem1}({loop}){stem2}"
+    Parameters:
+        sequence (str or DNASequence): The DNA sequence to analyze.
+        min_stem (int): Minimum number of bases in the stem for stable hairpin.
+        min_loop (int): Minimum number of bases in the loop.
+        max_loop (int): Maximum number of bases in the loop.
+        report (bool): Whether to build the hairpin string; callers that only need the count can pass False.
 
-                # Append the linear hairpin representation to the string
-                hairpin_string += f"Hairpin {count}: {hairpin_representation}\n"
+    Returns:
+        tuple: (int, str or None)
+            - The count of potential hairpin structures.
+            - A single string showing the detected hairpins in the format 'stem1(loop)stem2_rc', or None if no
+              hairpins are found or no report was requested.
+    """
+    sequence = str(sequence)
+    hairpins = find_hairpins(sequence, min_stem, min_loop, max_loop)
+    count = len(hairpins)
 
     # Return count and the formatted hairpin string, or None if no hairpins found
-    return count, hairpin_string if count > 0 else None
+    if count == 0 or not report:
+        return count, None
+    return count, format_hairpins(sequence, hairpins, min_stem)
 
 
 def main():
@@ -1,17 +1,28 @@
-def reverse_complement(dna_sequence: str) -> str:
+from genedesign.seq_utils.dna_sequence import DNASequence, COMPLEMENT_TABLE
+
+# Deletes the four bases, leaving only the characters that have no complement
+_STRIP_BASES = str.maketrans("", "", "ACGT")
+
+def reverse_complement(dna_sequence):
     """
     Returns the reverse complement of a DNA sequence.
 
     Parameters:
-        dna_sequence (str): The DNA sequence to reverse complement.
+        dna_sequence (str or DNASequence): The DNA sequence to reverse complement.
 
     Returns:
-        str: The reverse complement of the DNA sequence.
+        str or DNASequence: The reverse complement, of the same type as the input. A DNASequence returns
+        its cached reverse complement.
+
+    Raises:
+        KeyError: If a string contains a character other than A, C, G and T.
     """
-    complement = {
-        'A': 'T', 'T': 'A', 'C': 'G', 'G': 'C'
-    }
-    return ''.join(complement[base] for base in reversed(dna_sequence))
+    if isinstance(dna_sequence, DNASequence):
+        return dna_sequence.reverse_complement()
+    invalid = dna_sequence.translate(_STRIP_BASES)
+    if invalid:
+        raise KeyError(invalid[0])
+    return dna_sequence.translate(COMPLEMENT_TABLE)[::-1]
 
 def main():
     # Example usage of reverse_complement
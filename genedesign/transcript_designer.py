@@ -1,8 +1,17 @@
+import math
+import time
+import hashlib
 import random
+import numpy as np
 from genedesign.rbs_chooser import RBSChooser
+from genedesign.codon_table import load_codon_table
+from genedesign.design_cache import design_fingerprint
 from genedesign.models.transcript import Transcript
+from genedesign.models.window_context import WindowContext
+from genedesign.verdict_cache import shared_verdict_cache
+from genedesign.window_index import load_window_index
 
-from genedesign.checkers.hairpin_checker import hairpin_checker
+from genedesign.checkers.hairpin_checker import RollingHairpinChecker, hairpin_checker
 from genedesign.checkers.forbidden_sequence_checker import ForbiddenSequenceChecker
 from genedesign.checkers.internal_promoter_checker import PromoterChecker
 from genedesign.checkers.codon_checker import CodonChecker
@@ -13,14 +22,79 @@ class TranscriptDesigner:
     Reverse translates a protein sequence into a DNA sequence using a hybrid 
     Guided Random + Sliding Window approach for optimal codon selection satisfying
     high CAI, low hairpin count, and the absence of internal promoters & forbidden sequences.
+
+    Each window is checked together with a short lookback into the CDS committed so far (a WindowContext),
+    so forbidden sites, internal RBSs and promoters that span window junctions are caught as they appear.
+
+    Two search modes are available: "sliding" commits each window greedily (first passing candidate, or the
+    best-scoring one), while "beam" keeps the `beam_width` best partial CDSs and extends them window by window.
+
+    The codon usage metrics of the CDS being designed can be read from `codonUsage` (a RollingCodonChecker)
+    at any time without rescanning it. Given a DesignStats, the designer also records per-checker timings and
+    verdicts, RBS selection time and counts of windows, candidates and fallbacks into `stats`.
+
+    Given a DesignCache, the first `run` after each `reseed` with an integer seed is looked up in the cache
+    (keyed by the peptide, the ignored RBSs, the seed and the designer's settings) and designed only on a miss.
+    Later runs without reseeding depend on the generator's state and are never cached; after a hit that state
+    has not advanced, so they differ from those of an uncached designer, although they are just as valid.
     """
 
-    def __init__(self):
+    MODES = ("sliding", "beam")
+
+    # Weights used to score candidates that fail validation
+    CHECKER_WEIGHTS = {
+        "forbidden": 6,
+        "hairpin": 4,
+        "promoter": 1,
+        "internal_rbs": 2,
+        "codon_usage": 4
+    }
+
+    # Checks decided by the window alone, so windows drawn from the WindowIndex always pass them
+    INDEXED_CHECKS = ("hairpin", "codon_usage")
+
+    # Appended to every CDS by design_cds
+    STOP_CODON = ("TAA",)
 
+    # Rounds of candidates drawn for the last window of sliding mode before it settles for one that fails next to
+    # the stop codon
+    STOP_REDRAWS = 3
+
+    def __init__(self, seed=None, mode="sliding", beam_width=4, beam_candidates=10, verdict_cache=None, stats=None,
+                 design_cache=None):
+        """
+        Parameters:
+            seed (int or None): Seed for the designer's random number generator, for reproducible designs.
+            mode (str): "sliding" for the greedy sliding window search, "beam" for beam search.
+            beam_width (int): Number of partial CDSs kept between windows in beam mode.
+            beam_candidates (int): Number of candidate windows drawn per partial CDS in beam mode.
+            verdict_cache (VerdictCache or None): Cache of checker verdicts on windows; None shares the process-wide one.
+            stats (DesignStats or None): Where to record instrumentation; None disables it.
+            design_cache (DesignCache or None): Persistent cache of seeded designs; None disables it.
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown design mode '{mode}', expected one of {self.MODES}")
+        if beam_width < 1 or beam_candidates < 1:
+            raise ValueError("beam_width and beam_candidates must be at least 1")
+
+        self.seed = seed
+        self.mode = mode
+        self.beamWidth = beam_width
+        self.beamCandidates = beam_candidates
+        self.verdictCache = verdict_cache
+        self.stats = stats
+        self.designCache = design_cache
+        self.designFingerprint = None
+        self.checkerFingerprint = None  # Digest of checker_settings, part of every verdict cache key
+        self.freshSeed = False  # Whether the random state is exactly as `reseed` left it
+        self.rng = None
+        self.npRng = None
+        self.codonTable = None
         self.aminoAcidToCodon = {}
         self.rbsChooser = None
 
         self.codonChecker = None
+        self.codonUsage = None  # RollingCodonChecker over the CDS being designed
         self.forbiddenSequenceChecker = None
         self.internalPromoterChecker = None
         self.InternalRBSChecker = None
@@ -45,10 +119,60 @@ class TranscriptDesigner:
         self.codonChecker.initiate()
         self.InternalRBSChecker.initiate()
 
-        # Load codon usage data from the provided text file
-        self.aminoAcidToCodon = self.parse_codon_usage('genedesign/data/codon_usage.txt')
+        # Promoters are the widest motif checked across window junctions
+        self.lookback = self.promoterChecker.sliding_frame - 1
+        # Window verdicts recur across genes, so they are shared by every designer of the process; keys carry
+        # the checker fingerprint, so designers with different checker settings never read each other's verdicts
+        if self.verdictCache is None:
+            self.verdictCache = shared_verdict_cache()
+
+        # Share the process-wide codon usage table and seed our own random number generators
+        self.codonTable = load_codon_table()
+        self.aminoAcidToCodon = self.codonTable.synonymous
+        self.logFrequencies = {codon: math.log(freq) for codon, freq in self.codonTable.frequencies.items()}
+        self.windowIndex = load_window_index()
+        self.refresh_fingerprints()
+        self.reseed(self.seed)
+
+
+    def reseed(self, seed) -> None:
+        """
+        Resets the designer's random number generator, e.g. to give each gene its own deterministic seed.
+
+        Parameters:
+            seed (int or None): The new seed.
+        """
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.npRng = np.random.default_rng(seed)
+        self.freshSeed = True
+
+
+    def checker_settings(self) -> tuple:
+        """
+        Returns the settings of every checker run on windows, keyed by checker name, e.g. for cache fingerprints.
+        """
+        return (
+            ("forbidden", self.forbiddenChecker.settings()),
+            ("hairpin", RollingHairpinChecker().settings()),
+            ("internal_rbs", self.InternalRBSChecker.settings()),
+            ("codon_usage", self.codonChecker.settings(), sorted(self.codonChecker.codon_frequencies.items())),
+            ("promoter", self.promoterChecker.settings()),
+        )
+
+
+    def refresh_fingerprints(self) -> None:
+        """
+        Recomputes the checker fingerprint, and the design fingerprint when it changed, so checker settings changed
+        after `initiate` take effect in the verdict and design cache keys. Called at the start of every design.
+        """
+        checker_fingerprint = hashlib.sha256(repr(self.checker_settings()).encode()).hexdigest()[:16]
+        if checker_fingerprint != self.checkerFingerprint or self.designFingerprint is None:
+            self.checkerFingerprint = checker_fingerprint
+            if self.designCache is not None:
+                self.designFingerprint = design_fingerprint(self)
+
 
-    
     def parse_codon_usage(self, filepath: str) -> dict:
         """
         Parses a codon usage file and returns a dictionary mapping amino acids to their codons and frequencies.
@@ -59,23 +183,8 @@ class TranscriptDesigner:
         Returns:
             dict: A dictionary where keys are amino acids and values are lists of tuples (codon, frequency).
         """
-        amino_acid_to_codon = {}
-
-        with open(filepath, 'r') as f:
-            for line in f:
-                parts = line.strip().split()
-            
-                if len(parts) >= 3:
-                    codon = parts[0].strip()  # Codon (e.g., TTT)
-                    aa = parts[1].strip()     # Amino acid (e.g., F)
-                    frequency = float(parts[2])  # Frequency (e.g., 0.58)
-
-                # Add codon and frequency to the corresponding amino acid entry
-                    if aa not in amino_acid_to_codon:
-                        amino_acid_to_codon[aa] = []
-                    amino_acid_to_codon[aa].append((codon, frequency))
-        
-        return amino_acid_to_codon
+        table = load_codon_table(filepath)
+        return {aa: list(options) for aa, options in table.synonymous.items()}
      
     
     def guided_random_codon(self, aa: str) -> str:
@@ -88,32 +197,89 @@ class TranscriptDesigner:
         Returns:
             str: Selected codon
         """
-        # Get list of (codon, frequency) tuples for this amino acid
-        codons = self.aminoAcidToCodon.get(aa)
-        
-        if not codons:
-            raise ValueError(f"No codons available for amino acid {aa}")
-        
-        # Normalize frequencies and select based on random value
-        total_freq = sum(freq for _, freq in codons)
-        rand_val = random.uniform(0, total_freq)
-        
-        cumulative_freq = 0
-        for codon, freq in codons:
-            cumulative_freq += freq
-            if rand_val <= cumulative_freq:
-                return codon
-        
-        return codons[-1][0]  # Fallback to last option
+        # Constant-time draw from the precomputed alias table for this amino acid
+        return self.codonTable.sample(aa, self.rng)
    
     
-    def candidate_scorer(self, candidates):
+    def check_window(self, candidate, context=None, stop_at_failure=False, skip=()):
+        """
+        Runs the checkers on a candidate window, in the context of the committed CDS.
+
+        Forbidden sites, internal RBSs and promoters are only reported if they end inside the candidate,
+        since everything ending earlier was already checked when it was committed.
+
+        Parameters:
+            candidate (List[str]): A list of codons representing a potential solution.
+            context (WindowContext or None): Checker state over the committed CDS; None for a standalone window.
+            stop_at_failure (bool): Skip the remaining checkers once one has failed.
+            skip (Iterable[str]): Checks already known to pass, e.g. INDEXED_CHECKS for windows from the WindowIndex.
+
+        Returns:
+            dict: Whether the candidate passes each checker that was run, keyed like CHECKER_WEIGHTS.
+        """
+        context = context or WindowContext()
+        dna_seq = ''.join(candidate)
+        extended = context.tail + dna_seq
+
+        # Cheapest checks first, so failing candidates are rejected early. The costlier verdicts are cached
+        # under everything they depend on; the forbidden and internal RBS scans cost less than a lookup.
+        checks = (
+            ("forbidden", None,
+             lambda: self.forbiddenChecker.scan(dna_seq, context.forbidden_state)[1] is None),
+            ("hairpin", dna_seq,
+             lambda: hairpin_checker(dna_seq)[0]),
+            ("internal_rbs", None,
+             lambda: self.InternalRBSChecker.run_suffix(extended, len(dna_seq))[0]),
+            ("codon_usage", tuple(candidate),
+             lambda: self.codonChecker.run(candidate)[0]),
+            ("promoter", (context.tail, dna_seq),
+             lambda: self.promoterChecker.run_suffix(extended, len(dna_seq))[0]),
+        )
+
+        stats = self.stats
+        fingerprint = self.checkerFingerprint
+        results = {}
+        for name, key, check in checks:
+            if name in skip:
+                results[name] = True
+                continue
+            if stats is None:
+                results[name] = check() if key is None else self.verdictCache.lookup((fingerprint, name, key), check)
+            else:
+                start = time.perf_counter()
+                results[name] = check() if key is None else self.verdictCache.lookup((fingerprint, name, key), check)
+                stats.record(name, time.perf_counter() - start, results[name])
+            if stop_at_failure and not results[name]:
+                break
+        return results
+
+
+    def advance_context(self, context, candidate):
+        """
+        Commits a candidate window and returns the checker state over the extended CDS.
+
+        Parameters:
+            context (WindowContext): Checker state over the CDS committed so far.
+            candidate (List[str]): The codons being committed.
+
+        Returns:
+            WindowContext: The checker state after the candidate.
+        """
+        dna_seq = ''.join(candidate)
+        return WindowContext(
+            tail=(context.tail + dna_seq)[-self.lookback:],
+            forbidden_state=self.forbiddenChecker.advance(dna_seq, context.forbidden_state),
+        )
+
+
+    def candidate_scorer(self, candidates, context=None):
         """
         Scores candidate solutions based on various criteria like forbidden sequences,
         secondary structure formation, RNase E cleavage sites, etc.
         
         Parameters:
             candidates (List[List[str]]): List of candidate solutions (codons).
+            context (WindowContext or None): Checker state over the committed CDS.
         
         Returns:
             List[str]: Best candidate solution that passes the most checks.
@@ -121,42 +287,10 @@ class TranscriptDesigner:
         
         scored_candidates = []
 
-        # Define weights for each checker 
-        weights = {
-            "forbidden": 6,
-            "hairpin": 4,
-            "promoter": 1,
-            "internal_rbs": 2,
-            "codon_usage": 4
-        }
-
         for candidate in candidates:
-            # Convert list of codons to DNA sequence string
-            dna_seq = ''.join(candidate)
-
-            # Initialize score for this candidate
-            score = 0
-
-            # Run all checkers on the candidate DNA sequence and accumulate scores
-            forbidden_okay = self.forbiddenChecker.run(dna_seq)
-            if forbidden_okay:
-                score += weights["forbidden"]
-
-            hairpin_okay = hairpin_checker(dna_seq)
-            if hairpin_okay:
-                score += weights["hairpin"]
-
-            promoter_okay = self.promoterChecker.run(dna_seq)
-            if promoter_okay:
-                score += weights["promoter"]
-
-            internal_okay = self.InternalRBSChecker.run(dna_seq)
-            if internal_okay:
-                score += weights["internal_rbs"]
-
-            codon_okay = self.codonChecker.run(candidate)
-            if codon_okay:
-                score += weights["codon_usage"]
+            # Run all checkers on the candidate and add the weight of every check it passes
+            results = self.check_window(candidate, context)
+            score = sum(self.CHECKER_WEIGHTS[name] for name, okay in results.items() if okay)
 
             # Append the candidate and its score to the list
             scored_candidates.append((candidate, score))
@@ -170,43 +304,19 @@ class TranscriptDesigner:
         return best_candidate
     
     
-    def validate_window(self, candidate):
+    def validate_window(self, candidate, context=None, skip=()):
         """
         Validates a candidate solution by running it through all checkers.
         
         Parameters:
             candidate (List[str]): A list of codons representing a potential solution.
+            context (WindowContext or None): Checker state over the committed CDS.
+            skip (Iterable[str]): Checks already known to pass.
         
         Returns:
             bool: True if the candidate passes all checks; False otherwise.
         """
-        
-        dna_seq = ''.join(candidate)
-
-        # Run all checkers on the candidate DNA sequence
-        
-        forbidden_okay = self.forbiddenChecker.run(dna_seq)
-        if not forbidden_okay:
-            return False
-
-        hairpin_okay = hairpin_checker(dna_seq)
-        if not hairpin_okay:
-            return False
-
-        promoter_okay = self.promoterChecker.run(dna_seq)
-        if not promoter_okay:
-            return False
-
-        internal_okay = self.InternalRBSChecker.run(dna_seq)
-        if not internal_okay:
-            return False
-
-        codon_okay = self.codonChecker.run(candidate)
-        if not codon_okay:
-            return False
-
-        # If all checks pass
-        return True
+        return all(self.check_window(candidate, context, stop_at_failure=True, skip=skip).values())
     
     
     def sliding_window_optimization(self, peptide: str) -> str:
@@ -217,51 +327,190 @@ class TranscriptDesigner:
             peptide (str): The protein sequence
         
         Returns:
-            str: Optimized DNA coding sequence including dynamically growing preamble.
+            str: Optimized DNA coding sequence.
         """
         
-        # Initialize an empty preamble 
-        preamble = []
+        # Checker state over the committed CDS, used to catch motifs spanning window junctions
+        context = WindowContext()
 
         cds = []  # Start with an empty coding sequence
+        self.codonUsage = self.codonChecker.rolling()
         
         # Sliding window size (3 amino acids / 9 nucleotides)
         window_size = 3
+        stats = self.stats
 
         for i in range(0, len(peptide), window_size):
-            # Get current window of amino acids and next 6 downstream ones if available
+            # Get current window of amino acids
             window_peptide = peptide[i:i + window_size]
-            downstream_peptide = peptide[i + window_size:i + window_size + 6]
 
-            # Generate multiple possible solutions using guided random selection
-            candidate_codons = [
-                [self.guided_random_codon(aa) for aa in window_peptide]
-                for _ in range(10)  # Generate 10 candidates per window
-            ]
-
-            # Validate each candidate until we find one that passes all checks
+            # The last window must also pass next to the TAA stop codon that design_cds appends
+            last = i + window_size >= len(peptide)
+            candidate_codons = []
             best_candidate = None
-            for candidate in candidate_codons:
-                if self.validate_window(candidate):
-                    best_candidate = candidate
+            drawn = 0
+
+            for _ in range(self.STOP_REDRAWS if last else 1):
+                # Draw 10 candidates from the windows known to pass the window-local checks, so only checks spanning
+                # the junction with the committed CDS remain; codon strings are only built for candidates we look at
+                candidate_ids = self.windowIndex.sample(window_peptide, 10, self.npRng)
+                skip = self.INDEXED_CHECKS
+                if candidate_ids is None:
+                    # No codon window passes on its own, so draw freely and let the scorer pick the least bad
+                    candidate_ids = self.codonTable.sample_batch(window_peptide, 10, self.npRng)
+                    skip = ()
+                drawn += len(candidate_ids)
+
+                # Validate each candidate until we find one that passes all checks
+                for row in candidate_ids:
+                    candidate = list(self.codonTable.codons_for(row))
+                    if self.validate_window(candidate, context, skip) and (
+                            not last or self.validate_window(self.STOP_CODON, self.advance_context(context, candidate))):
+                        best_candidate = candidate
+                        break
+                    candidate_codons.append(candidate)
+                if best_candidate is not None:
                     break
             
             # If no valid candidates are found after validation retries, get candidate with highest score
-            if best_candidate is None:
-                best_candidate = self.candidate_scorer(candidate_codons)  # Fallback option
+            fell_back = best_candidate is None
+            if fell_back:
+                best_candidate = self.candidate_scorer(candidate_codons, context)  # Fallback option (all failed)
+
+            if stats is not None:
+                stats.count("windows")
+                stats.count("candidates", drawn)
+                stats.count("fallbacks", fell_back)
 
             # Retain only middle part of this candidate (for overlap), or all if it's at the end of the sequence
             if len(window_peptide) == window_size:
                 cds.extend(best_candidate[:window_size])
             else:
                 cds.extend(best_candidate[:len(window_peptide)])  # Handle end of sequence
+            self.codonUsage.extend(best_candidate[:len(window_peptide)])
 
-            # Update preamble with newly optimized middle part of this candidate 
-            preamble += best_candidate[:window_size]
+            # Carry the checker state over the newly committed codons into the next window
+            context = self.advance_context(context, best_candidate)
 
         return ''.join(cds)
+
+
+    def beam_search_optimization(self, peptide: str) -> str:
+        """
+        Optimizes peptide translation with a beam search over 3-amino-acid windows.
+
+        Partial CDSs in the beam are extended, best first, with `beamCandidates` sampled windows each, until
+        `beamWidth` extensions pass every check. Each extension is scored incrementally from the checker
+        state of its parent (a WindowContext): the weight of a failed check is added to a penalty, and the
+        log codon frequencies of its codons to a log-CAI sum. Extensions with the same checker state can only
+        be told apart by their past, so only the best of them is kept. The `beamWidth` extensions with the
+        lowest penalty, then highest log-CAI, form the next beam.
+
+        Parameters:
+            peptide (str): The protein sequence
+
+        Returns:
+            str: Optimized DNA coding sequence.
+        """
+        window_size = 3
+        weights = self.CHECKER_WEIGHTS
+        log_frequencies = self.logFrequencies
+        stats = self.stats
+
+        # Beam entries: (penalty, negative log-CAI sum, history, context); history is a (parent, codons) chain
+        beam = [(0, 0.0, None, WindowContext())]
+
+        for i in range(0, len(peptide), window_size):
+            window_peptide = peptide[i:i + window_size]
+            extensions = {}
+
+            clean = 0  # Extensions whose new window passed every check
+
+            # Expand the best entries first and stop once enough clean extensions exist to refill the beam;
+            # extensions of worse entries could only rank behind them
+            for penalty, cost, history, context in beam:
+                if clean >= self.beamWidth:
+                    break
+
+                # Duplicate draws are checked once
+                candidate_ids = np.unique(self.codonTable.sample_batch(window_peptide, self.beamCandidates, self.npRng), axis=0)
+                if stats is not None:
+                    stats.count("candidates", len(candidate_ids))
+                for row in candidate_ids:
+                    if clean >= self.beamWidth:
+                        break
+                    candidate = self.codonTable.codons_for(row)
+                    # A failing window is charged for its first failed check only, which ranks it behind
+                    # every clean extension of the same entry without paying for the remaining checks
+                    results = self.check_window(candidate, context, stop_at_failure=True)
+                    added = sum(weights[name] for name, okay in results.items() if not okay)
+                    clean += added == 0
+                    entry = (
+                        penalty + added,
+                        cost - sum(log_frequencies[codon] for codon in candidate),
+                        (history, candidate),
+                        self.advance_context(context, candidate),
+                    )
+                    best = extensions.get(entry[3])
+                    if best is None or entry[:2] < best[:2]:
+                        extensions[entry[3]] = entry
+
+            beam = sorted(extensions.values(), key=lambda entry: entry[:2])[:self.beamWidth]
+            if stats is not None:
+                # No extension passed every check, so the beam carries on with failing windows
+                stats.count("windows")
+                stats.count("fallbacks", clean == 0)
+
+        # run appends a TAA stop codon; charge every finished entry for the sites it would complete
+        beam = sorted(
+            ((penalty + sum(weights[name] for name, okay in self.check_window(self.STOP_CODON, context).items() if not okay),
+              cost, history, context) for penalty, cost, history, context in beam),
+            key=lambda entry: entry[:2],
+        )
+
+        # Walk the winning history back to the first window
+        windows = []
+        history = beam[0][2]
+        while history is not None:
+            history, candidate = history
+            windows.append(candidate)
+        windows.reverse()
+
+        self.codonUsage = self.codonChecker.rolling()
+        for candidate in windows:
+            self.codonUsage.extend(candidate)
+        return ''.join(''.join(candidate) for candidate in windows)
     
     
+    def design_cds(self, peptide: str) -> str:
+        """
+        Designs the coding sequence of a peptide, stop codon included, without choosing an RBS.
+
+        The CDS does not depend on the RBS, so callers designing several transcripts (e.g. OperonDesigner) can
+        design every CDS independently and assign RBSs afterwards.
+
+        Parameters:
+            peptide (str): The protein sequence to translate.
+
+        Returns:
+            str: The CDS, ending with a TAA stop codon.
+        """
+        # Optimize CDS using sliding window + guided random approach, or beam search
+        self.refresh_fingerprints()
+        self.freshSeed = False
+        if self.mode == "beam":
+            cds_sequence = self.beam_search_optimization(peptide)
+        else:
+            cds_sequence = self.sliding_window_optimization(peptide)
+
+        # Append stop codon (TAA)
+        cds_sequence += "TAA"
+        self.codonUsage.append("TAA")
+        if self.stats is not None:
+            self.stats.count("genes")
+        return cds_sequence
+
+
     def run(self, peptide: str, ignores: set) -> Transcript:
         """
         Translates the peptide sequence to DNA using hybrid algorithm and selects an RBS.
@@ -273,18 +522,36 @@ class TranscriptDesigner:
         Returns:
             Transcript: The transcript object with selected RBS and translated codons.
         """
-        
-        # Optimize CDS using sliding window + guided random approach
-        cds_sequence = self.sliding_window_optimization(peptide)
-
-        # Append stop codon (TAA)
-        cds_sequence += "TAA"
-
-        # Choose an RBS using RBSChooser while ignoring specified options
-        selected_rbs = self.rbsChooser.run(cds_sequence, ignores)
+        cache_key = None
+        if self.designCache is not None and self.freshSeed and isinstance(self.seed, int):
+            self.refresh_fingerprints()
+            cache_key = self.designCache.key(self.designFingerprint, peptide, ignores, self.seed)
+            transcript = self.designCache.get(cache_key)
+            if transcript is not None:
+                self.freshSeed = False
+                self.codonUsage = self.codonChecker.rolling()
+                self.codonUsage.extend(transcript.codons)
+                if self.stats is not None:
+                    self.stats.count("cached")
+                return transcript
+
+        cds_sequence = self.design_cds(peptide)
+
+        # Choose an RBS using RBSChooser while ignoring specified options; the chooser records its own checks
+        self.rbsChooser.stats = self.stats
+        if self.stats is None:
+            selected_rbs = self.rbsChooser.run(cds_sequence, ignores)
+        else:
+            start = time.perf_counter()
+            selected_rbs = self.rbsChooser.run(cds_sequence, ignores)
+            self.stats.record("rbs_chooser", time.perf_counter() - start)
 
         # Return transcript object with selected RBS and translated CDS as a list of codons
-        return Transcript(selected_rbs, peptide, cds_sequence.split())
+        codons = [cds_sequence[i:i + 3] for i in range(0, len(cds_sequence), 3)]
+        transcript = Transcript(selected_rbs, peptide, codons)
+        if cache_key is not None:
+            self.designCache.put(cache_key, transcript)
+        return transcript
 
 if __name__ == "__main__":
     peptide = "MYPFIRTARMTV"
@@ -0,0 +1,90 @@
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Hashable
+
+# Enough for the distinct windows of a large proteome while keeping memory to a few tens of MB
+DEFAULT_MAXSIZE = 1 << 18
+
+class VerdictCache:
+    """
+    Bounded least-recently-used cache of checker verdicts on short sequences.
+
+    Candidate windows are a few codons long and recur constantly across a proteome, so designers look up
+    each checker's verdict here before running the checker. Keys must capture everything a verdict depends
+    on, e.g. the checker name, the window and any lookback into the committed sequence.
+
+    Attributes:
+        maxsize (int): Number of verdicts kept; the least recently used one is evicted beyond it.
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that had to run the checker.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        """
+        Parameters:
+            maxsize (int): Number of verdicts to keep.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._verdicts = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._verdicts)
+
+    def lookup(self, key: Hashable, compute: Callable[[], object]):
+        """
+        Returns the cached verdict for a key, computing and storing it on a miss.
+
+        Parameters:
+            key (Hashable): Everything the verdict depends on.
+            compute (Callable[[], object]): Runs the checker; only called on a miss.
+
+        Returns:
+            object: The verdict.
+        """
+        verdicts = self._verdicts
+        try:
+            verdict = verdicts[key]
+        except KeyError:
+            self.misses += 1
+            verdict = verdicts[key] = compute()
+            if len(verdicts) > self.maxsize:
+                verdicts.popitem(last=False)
+            return verdict
+
+        verdicts.move_to_end(key)
+        self.hits += 1
+        return verdict
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Fraction of lookups answered from the cache (0.0 before the first lookup).
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self) -> None:
+        """
+        Drops every cached verdict and resets the counters.
+        """
+        self._verdicts.clear()
+        self.hits = 0
+        self.misses = 0
+
+@lru_cache(maxsize=None)
+def shared_verdict_cache() -> VerdictCache:
+    """
+    Returns the verdict cache shared by every designer of the process. Designers may differ in their checker
+    settings, so they key verdicts by their checker fingerprint as well (see TranscriptDesigner.checker_settings).
+    """
+    return VerdictCache()
+
+if __name__ == "__main__":
+    cache = shared_verdict_cache()
+    for window in ["ATGGCTAAA", "ATGGCTAAA", "GAATTCAAA"]:
+        print(window, cache.lookup(("forbidden", window), lambda: "GAATTC" not in window))
+    print(f"{cache.hits} hits, {cache.misses} misses, {len(cache)} cached verdicts")
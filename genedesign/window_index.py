@@ -0,0 +1,191 @@
+import hashlib
+import itertools
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+import numpy as np
+
+from genedesign.codon_table import CodonTable, DEFAULT_CODON_USAGE, load_codon_table
+from genedesign.rbs_library import cache_dir, read_cache, write_cache
+from genedesign.checkers.codon_checker import CodonChecker
+from genedesign.checkers.forbidden_sequence_checker import ForbiddenSequenceChecker
+from genedesign.checkers.hairpin_checker import RollingHairpinChecker, hairpin_checker
+from genedesign.checkers.internal_rbs_checker import InternalRBSChecker
+
+# Bump whenever the index layout or the checks deciding validity change
+INDEX_VERSION = 1
+
+# Designers work on windows of up to three amino acids; shorter windows only occur at the end of a peptide
+MAX_WINDOW = 3
+
+@dataclass(frozen=True, eq=False)
+class WindowIndex:
+    """
+    Every codon window that passes the window-local checks (forbidden sites, internal RBS, hairpins and codon
+    usage) for every amino-acid window of one to three residues, ready to be sampled by codon frequency.
+
+    The valid codon windows of all amino-acid windows are stored back to back in `windows`, each encoded as
+    a base-64 number of codon indices (see CodonTable.codons). Checks spanning the junction with neighbouring
+    windows cannot be known in advance and are left to the designer.
+
+    Attributes:
+        aa_index (Mapping[str, int]): Digit of each amino acid in an amino-acid window id.
+        offsets (np.ndarray): windows[offsets[w]:offsets[w + 1]] are the valid codon windows of window id w.
+        windows (np.ndarray): Encoded valid codon windows.
+        cumulative (np.ndarray): Cumulative sampling probability of each codon window within its amino-acid window.
+    """
+    aa_index: Mapping[str, int]
+    offsets: np.ndarray
+    windows: np.ndarray
+    cumulative: np.ndarray
+
+    def window_id(self, peptide: str) -> int:
+        """
+        Numbers amino-acid windows so that those of each length follow all shorter ones.
+
+        Raises:
+            ValueError: If the window holds a residue without codons, like CodonTable.sample_batch.
+        """
+        base = len(self.aa_index)
+        window_id = sum(base ** length for length in range(1, len(peptide)))
+        digits = 0
+        try:
+            for aa in peptide:
+                digits = digits * base + self.aa_index[aa]
+        except KeyError as e:
+            raise ValueError(f"No codons available for amino acid {e.args[0]}") from None
+        return window_id + digits
+
+    def valid_count(self, peptide: str) -> int:
+        """
+        Returns the number of valid codon windows for an amino-acid window.
+        """
+        window_id = self.window_id(peptide)
+        return int(self.offsets[window_id + 1] - self.offsets[window_id])
+
+    def sample(self, peptide: str, n_candidates: int, rng: np.random.Generator) -> Optional[np.ndarray]:
+        """
+        Draws valid codon windows for an amino-acid window, each with probability proportional to the product
+        of its codon frequencies.
+
+        Parameters:
+            peptide (str): The amino-acid window (one to three residues).
+            n_candidates (int): Number of codon windows to draw.
+            rng (np.random.Generator): The random number generator to draw from.
+
+        Returns:
+            np.ndarray or None: (n_candidates, len(peptide)) codon indices, or None if no codon window is valid.
+        """
+        window_id = self.window_id(peptide)
+        start, end = self.offsets[window_id], self.offsets[window_id + 1]
+        if start == end:
+            return None
+
+        picks = np.searchsorted(self.cumulative[start:end], rng.random(n_candidates), side='right')
+        encoded = self.windows[start + np.minimum(picks, end - start - 1)]
+        shifts = 6 * np.arange(len(peptide) - 1, -1, -1)
+        return (encoded[:, None] >> shifts) & 63
+
+def compile_window_index(table: CodonTable) -> dict:
+    """
+    Enumerates every codon window of every amino-acid window and keeps those passing the window-local checks.
+
+    Parameters:
+        table (CodonTable): The codon usage table to enumerate codons and weights from.
+
+    Returns:
+        dict: The 'offsets', 'windows' and 'cumulative' arrays of a WindowIndex.
+    """
+    forbidden_checker = ForbiddenSequenceChecker()
+    forbidden_checker.initiate()
+    rbs_checker = InternalRBSChecker()
+    rbs_checker.initiate()
+    codon_checker = CodonChecker()
+    codon_checker.initiate()
+
+    codon_ids = {codon: i for i, codon in enumerate(table.codons)}
+    offsets = [0]
+    windows = []
+    cumulative = []
+
+    for length in range(1, MAX_WINDOW + 1):
+        for peptide in itertools.product(table.aa_index, repeat=length):
+            options = [table.synonymous[aa] for aa in peptide]
+            valid = []
+            weights = []
+            for choice in itertools.product(*options):
+                candidate = [codon for codon, _ in choice]
+                dna = ''.join(candidate)
+                if (forbidden_checker.run(dna)[0] and rbs_checker.run(dna)[0] and hairpin_checker(dna)[0]
+                        and codon_checker.run(candidate)[0]):
+                    encoded = 0
+                    for codon in candidate:
+                        encoded = encoded * 64 + codon_ids[codon]
+                    valid.append(encoded)
+                    weights.append(float(np.prod([freq for _, freq in choice])))
+
+            if valid:
+                windows.extend(valid)
+                cumulative.extend(np.cumsum(weights) / sum(weights))
+                cumulative[-1] = 1.0  # Guard against rounding below 1
+            offsets.append(len(windows))
+
+    return {
+        'offsets': np.array(offsets, dtype=np.int64),
+        'windows': np.array(windows, dtype=np.int32),
+        'cumulative': np.array(cumulative, dtype=np.float64),
+    }
+
+def index_fingerprint(codon_usage_path: str) -> str:
+    """
+    Digests everything that decides which windows are valid: the codon usage file and the settings of every
+    checker compile_window_index filters on.
+    """
+    forbidden_checker = ForbiddenSequenceChecker()
+    forbidden_checker.initiate()
+    rbs_checker = InternalRBSChecker()
+    rbs_checker.initiate()
+    codon_checker = CodonChecker()
+    codon_checker.initiate()
+
+    digest = hashlib.sha256()
+    with open(codon_usage_path, 'rb') as f:
+        digest.update(f.read())
+    digest.update(repr((INDEX_VERSION, MAX_WINDOW, forbidden_checker.settings(), rbs_checker.settings(),
+                        codon_checker.settings(), RollingHairpinChecker().settings())).encode())
+    return digest.hexdigest()[:16]
+
+@lru_cache(maxsize=None)
+def load_window_index(codon_usage_path: str = DEFAULT_CODON_USAGE) -> WindowIndex:
+    """
+    Loads the window index, building it on first use into a binary cache that later processes load directly.
+
+    Parameters:
+        codon_usage_path (str): Path to the codon usage file; defaults to the packaged E. coli table.
+
+    Returns:
+        WindowIndex: The shared index.
+    """
+    table = load_codon_table(codon_usage_path)
+    cache_path = os.path.join(cache_dir(), f'window_index_{index_fingerprint(codon_usage_path)}.pkl')
+
+    arrays = read_cache(cache_path, INDEX_VERSION)
+    if arrays is None:
+        arrays = compile_window_index(table)
+        write_cache(cache_path, INDEX_VERSION, arrays)
+
+    for array in arrays.values():
+        array.flags.writeable = False
+    return WindowIndex(aa_index=MappingProxyType(dict(table.aa_index)), **arrays)
+
+if __name__ == "__main__":
+    # Build (or load) the index ahead of time, e.g. when provisioning workers
+    index = load_window_index()
+    table = load_codon_table()
+    print(f"{len(index.windows)} valid codon windows across {len(index.offsets) - 1} amino-acid windows")
+    for peptide in ["MYP", "KKK", "LLL"]:
+        print(peptide, index.valid_count(peptide), "valid, e.g.",
+              [table.codons_for(row) for row in index.sample(peptide, 2, np.random.default_rng(0))])
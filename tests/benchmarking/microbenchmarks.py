@@ -0,0 +1,288 @@
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import timeit
+from statistics import median
+from genedesign.rbs_chooser import RBSChooser
+from genedesign.seq_utils.Translate import Translate
+from genedesign.seq_utils.hairpin_counter import hairpin_counter
+from genedesign.seq_utils.calc_edit_distance import calculate_edit_distance
+from genedesign.checkers.hairpin_checker import RollingHairpinChecker
+from genedesign.checkers.internal_promoter_checker import PromoterChecker
+from genedesign.checkers.forbidden_sequence_checker import ForbiddenSequenceChecker
+from genedesign.checkers.internal_rbs_checker import InternalRBSChecker
+from genedesign.checkers.codon_checker import CodonChecker
+
+RESULTS_VERSION = 1
+
+# Back-to-back runs of unchanged code differ by up to 1.8x on a busy machine, so only a median more than twice
+# the baseline's is flagged by default
+DEFAULT_THRESHOLD = 1.0
+
+STOP_CODONS = ("TAA", "TAG", "TGA")
+SENSE_CODONS = tuple(a + b + c for a in "ACGT" for b in "ACGT" for c in "ACGT" if a + b + c not in STOP_CODONS)
+AMINO_ACIDS = "ACDEFGHIKLMNPQRSTVWY"
+
+def initiated(cls):
+    def setup():
+        instance = cls()
+        instance.initiate()
+        return instance
+    return setup
+
+_input_checkers = None
+
+def input_checkers():
+    """
+    The checkers used to clean benchmark inputs, initiated on first use.
+    """
+    global _input_checkers
+    if _input_checkers is None:
+        _input_checkers = (initiated(ForbiddenSequenceChecker)(), initiated(InternalRBSChecker)())
+    return _input_checkers
+
+def clean_cds(length, rng):
+    """
+    Builds a random open reading frame of about `length` bp without forbidden sites or internal RBSs, so checkers
+    that stop at the first violation scan the whole sequence, as they do on designed transcripts.
+    """
+    forbidden_checker, rbs_checker = input_checkers()
+    cds = "ATG"
+    state = forbidden_checker.advance(cds)
+    while len(cds) < length - 3:
+        codon = rng.choice(SENSE_CODONS)
+        next_state, site = forbidden_checker.scan(codon, state)
+        if site is None and rbs_checker.run_suffix(cds[-30:] + codon, 3)[0]:
+            cds += codon
+            state = next_state
+    return cds + "TAA"
+
+def random_peptide(length, rng):
+    return ''.join(rng.choice(AMINO_ACIDS) for _ in range(length))
+
+class Microbenchmark:
+    """
+    A named operation to time over a sweep of input lengths.
+
+    `setup` is called once per benchmark with no arguments and returns shared state (e.g. an initiated checker);
+    `prepare(state, length, rng)` returns the zero-argument callable that is timed.
+    """
+
+    def __init__(self, name, lengths, prepare, setup=lambda: None, unit="bp"):
+        self.name = name
+        self.lengths = lengths
+        self.prepare = prepare
+        self.setup = setup
+        self.unit = unit
+
+def prepare_rbs_chooser(chooser, length, rng):
+    cds = clean_cds(length, rng)
+    return lambda: chooser.run(cds, set())
+
+def prepare_codon_checker(checker, length, rng):
+    cds = clean_cds(length, rng)
+    codons = [cds[i:i + 3] for i in range(0, len(cds), 3)]
+    return lambda: checker.run(codons)
+
+def prepare_edit_distance(_, length, rng):
+    # Peptide-sized inputs, as compared by RBSChooser; the full table grows with the square of the length
+    s1, s2 = random_peptide(length, rng), random_peptide(length, rng)
+    return lambda: calculate_edit_distance(s1, s2)
+
+def dna_benchmark(run):
+    """
+    Times `run(state, dna)` on a random coding sequence of each length, free of forbidden sites and internal RBSs.
+    """
+    def prepare(state, length, rng):
+        dna = clean_cds(length, rng)
+        return lambda: run(state, dna)
+    return prepare
+
+BENCHMARKS = [
+    Microbenchmark("hairpin_counter", (100, 1000, 5000),
+                   dna_benchmark(lambda _, dna: hairpin_counter(dna))),
+    # Random sequences hold hairpins in nearly every 50 bp window, so hairpin_checker would stop at the first
+    # one; allowing any number of hairpins per window times the sweep over every window instead
+    Microbenchmark("RollingHairpinChecker.extend", (100, 1000, 5000),
+                   dna_benchmark(lambda _, dna: RollingHairpinChecker(max_hairpins=len(dna)).extend(dna))),
+    Microbenchmark("PromoterChecker.run", (100, 1000, 5000),
+                   dna_benchmark(lambda checker, dna: checker.run(dna)), initiated(PromoterChecker)),
+    Microbenchmark("ForbiddenSequenceChecker.run", (100, 1000, 5000),
+                   dna_benchmark(lambda checker, dna: checker.run(dna)), initiated(ForbiddenSequenceChecker)),
+    Microbenchmark("InternalRBSChecker.run", (100, 1000, 5000),
+                   dna_benchmark(lambda checker, dna: checker.run(dna)), initiated(InternalRBSChecker)),
+    Microbenchmark("CodonChecker.run", (100, 1000, 5000),
+                   prepare_codon_checker, initiated(CodonChecker)),
+    Microbenchmark("Translate.run", (100, 1000, 5000),
+                   dna_benchmark(lambda translator, dna: translator.run(dna)), initiated(Translate)),
+    Microbenchmark("calculate_edit_distance", (6, 30, 100),
+                   prepare_edit_distance, unit="aa"),
+    Microbenchmark("RBSChooser.run", (100, 1000, 5000),
+                   prepare_rbs_chooser, initiated(RBSChooser)),
+]
+
+def time_call(func, repeat, min_time):
+    """
+    Times a callable like `python -m timeit`: calls are batched until a batch takes at least `min_time`,
+    then the batch is repeated `repeat` times.
+
+    Returns:
+        tuple: (calls per batch, list of seconds per call for each batch)
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    return number, [t / number for t in timer.repeat(repeat, number)]
+
+def run_benchmarks(names=None, lengths=None, repeat=7, min_time=0.1, seed=0):
+    """
+    Runs the selected microbenchmarks over their length sweeps.
+
+    Parameters:
+        names (list[str] or None): Benchmarks to run; None runs them all.
+        lengths (list[int] or None): Lengths to sweep instead of each benchmark's default sweep.
+        repeat (int): Number of timed batches per length.
+        min_time (float): Minimum duration of one batch in seconds.
+        seed (int): Seed for the random inputs, so runs time the same sequences.
+
+    Returns:
+        dict: Run metadata and one result per benchmark and length, ready to be written as JSON.
+    """
+    selected = [b for b in BENCHMARKS if names is None or b.name in names]
+    unknown = set(names or ()) - {b.name for b in BENCHMARKS}
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {sorted(unknown)}")
+
+    results = []
+    for benchmark in selected:
+        state = benchmark.setup()
+        for length in lengths or benchmark.lengths:
+            func = benchmark.prepare(state, length, random.Random(f"{seed}:{benchmark.name}:{length}"))
+            number, per_call = time_call(func, repeat, min_time)
+            result = {
+                "benchmark": benchmark.name,
+                "length": length,
+                "unit": benchmark.unit,
+                "number": number,
+                "repeat": repeat,
+                "best": min(per_call),
+                "median": median(per_call),
+            }
+            results.append(result)
+            print(f"{benchmark.name:<30} {length:>6} {benchmark.unit}  best {format_seconds(result['best']):>10}"
+                  f"  median {format_seconds(result['median']):>10}")
+
+    return {
+        "version": RESULTS_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "seed": seed,
+        "results": results,
+    }
+
+def format_seconds(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+def compare_results(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    Compares the median time per call of every benchmark and length present in both runs.
+
+    Medians over the repeats are compared rather than best times, as they are less sensitive to one lucky batch.
+    Both runs should come from the same machine, and the threshold should stay above the run-to-run noise
+    measured there.
+
+    Parameters:
+        baseline (dict): Results loaded from the baseline file.
+        current (dict): Results of the run being checked.
+        threshold (float): Relative slowdown above which a result counts as a regression (1.0 = twice as slow).
+
+    Returns:
+        list[dict]: One row per common benchmark and length with the baseline and current median times, their
+        ratio and a 'status' of "regression", "improvement" or "ok".
+    """
+    baseline_median = {(r["benchmark"], r["length"]): r["median"] for r in baseline["results"]}
+    rows = []
+    for result in current["results"]:
+        key = (result["benchmark"], result["length"])
+        if key not in baseline_median:
+            continue
+        ratio = result["median"] / baseline_median[key]
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 / (1 + threshold):
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append({"benchmark": key[0], "length": key[1], "baseline": baseline_median[key],
+                     "current": result["median"], "ratio": ratio, "status": status})
+    return rows
+
+def load_results(path):
+    with open(path, 'r') as f:
+        results = json.load(f)
+    if results.get("version") != RESULTS_VERSION:
+        raise ValueError(f"{path} holds results of format version {results.get('version')}, expected {RESULTS_VERSION}")
+    return results
+
+def write_results(results, path):
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the checkers and sequence utilities over a sweep of input lengths.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the microbenchmarks and write their results as JSON")
+    run_parser.add_argument("--output", default="microbenchmark_results.json", help="Where to write the results")
+    run_parser.add_argument("--only", nargs="+", metavar="NAME", help="Benchmarks to run (default: all)")
+    run_parser.add_argument("--lengths", nargs="+", type=int, help="Lengths to sweep instead of each benchmark's defaults")
+    run_parser.add_argument("--repeat", type=int, default=7, help="Timed batches per length (default: 7)")
+    run_parser.add_argument("--min-time", type=float, default=0.1, help="Minimum seconds per batch (default: 0.1)")
+    run_parser.add_argument("--seed", type=int, default=0, help="Seed for the random inputs")
+    run_parser.add_argument("--compare", action="store_true", help="Compare against the baseline after running")
+    run_parser.add_argument("--baseline", help="Baseline results from the same machine (required with --compare)")
+    run_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                            help=f"Relative slowdown of the median flagged as a regression (default: {DEFAULT_THRESHOLD})")
+
+    compare_parser = commands.add_parser("compare", help="Flag regressions of stored results against a baseline")
+    compare_parser.add_argument("results", help="Results written by 'run'")
+    compare_parser.add_argument("--baseline", required=True, help="Baseline results from the same machine")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help=f"Relative slowdown of the median flagged as a regression (default: {DEFAULT_THRESHOLD})")
+
+    args = parser.parse_args(argv)
+    if args.command == "run" and args.compare and args.baseline is None:
+        parser.error("--compare requires --baseline")
+
+    if args.command == "run":
+        current = run_benchmarks(args.only, args.lengths, args.repeat, args.min_time, args.seed)
+        write_results(current, args.output)
+        print(f"Results written to {args.output}")
+        if not args.compare:
+            return 0
+    else:
+        current = load_results(args.results)
+
+    rows = compare_results(load_results(args.baseline), current, args.threshold)
+    for row in rows:
+        print(f"{row['benchmark']:<30} {row['length']:>6}  {format_seconds(row['baseline']):>10} -> "
+              f"{format_seconds(row['current']):>10}  x{row['ratio']:.2f}  {row['status']}")
+    regressions = [row for row in rows if row["status"] == "regression"]
+    print(f"{len(rows)} results compared, {len(regressions)} regressions beyond {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
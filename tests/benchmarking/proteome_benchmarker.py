@@ -1,20 +1,25 @@
 import os
+import argparse
+import hashlib
 import traceback
 import csv
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from statistics import mean
 from genedesign.seq_utils.Translate import Translate
 from genedesign.transcript_designer import TranscriptDesigner
-from genedesign.checkers.forbidden_sequence_checker import ForbiddenSequenceChecker
-from genedesign.checkers.internal_promoter_checker import PromoterChecker
-from genedesign.checkers.hairpin_checker import hairpin_checker
+from genedesign.design_stats import DesignStats, TimingStats
+from genedesign.design_cache import DesignCache
+from genedesign.checkers.transcript_scanner import TranscriptScanner
 from genedesign.checkers.codon_checker import CodonChecker
 
-def parse_fasta(fasta_file):
+def iter_fasta(fasta_file):
     """
-    Parses the FASTA file to extract gene names and protein sequences.
+    Reads the FASTA file one record at a time, yielding (gene name, protein sequence) pairs in file order.
+
+    Only the record being read is held in memory, and records sharing a gene name are all yielded.
     """
-    sequences = {}
     current_gene = None
     current_sequence = []
 
@@ -23,7 +28,7 @@ def parse_fasta(fasta_file):
             line = line.strip()
             if line.startswith(">"):
                 if current_gene:
-                    sequences[current_gene] = ''.join(current_sequence)
+                    yield current_gene, ''.join(current_sequence)
                 gene_name = None
                 parts = line.split()
                 for part in parts:
@@ -37,37 +42,157 @@ def parse_fasta(fasta_file):
             else:
                 current_sequence.append(line)
         if current_gene:
-            sequences[current_gene] = ''.join(current_sequence)
-    
-    return sequences
+            yield current_gene, ''.join(current_sequence)
+
+def parse_fasta(fasta_file):
+    """
+    Parses the FASTA file to extract gene names and protein sequences.
+    Later records with a duplicate gene name replace earlier ones; use iter_fasta to keep them all.
+    """
+    return dict(iter_fasta(fasta_file))
+
+def gene_seed(base_seed, gene, protein):
+    """
+    Derives a deterministic seed for one gene from the run's base seed, its name and its protein sequence, so that
+    each design is reproducible no matter which worker handles it. The seed does not depend on the gene's position
+    in the input, so inserting or removing a protein leaves the seeds (and cached designs) of all others unchanged.
+    """
+    digest = hashlib.sha256(f"{base_seed}:{gene}:{protein}".encode()).digest()
+    return int.from_bytes(digest[:8], 'big')
+
+# Each worker process keeps one initialized designer for all the genes it handles
+_designer = None
+
+def init_designer(stats=None, design_cache=None):
+    """
+    Process-pool initializer: builds the worker's TranscriptDesigner once, instrumented if given a DesignStats
+    and serving repeated designs from a DesignCache if given one.
+    """
+    global _designer
+    _designer = TranscriptDesigner(stats=stats, design_cache=design_cache)
+    _designer.initiate()
+
+def design_gene(task):
+    """
+    Designs one gene with the worker's designer, reseeded with the gene's own seed. An instrumented designer
+    also records the time of the whole design under "design".
+
+    Returns:
+        tuple: (result, None) on success or (None, error) if the designer raised.
+    """
+    gene, protein, seed = task
+    try:
+        start = time.perf_counter()
+        _designer.reseed(seed)
+        transcript = _designer.run(protein, set())
+        if _designer.stats is not None:
+            _designer.stats.record("design", time.perf_counter() - start)
+        return {
+            'gene': gene,
+            'protein': protein,
+            'transcript': transcript
+        }, None
+    except Exception as e:
+        return None, {
+            'gene': gene,
+            'protein': protein,
+            'error': f"Error: {str(e)}\nTraceback: {traceback.format_exc()}"
+        }
+
+def design_chunk(tasks):
+    """
+    Designs a chunk of genes in a worker, so that one inter-process round trip covers several genes.
+
+    Returns:
+        tuple: (list of (result, error) pairs, DesignStats of the chunk or None if the designer is not instrumented)
+    """
+    results = [design_gene(task) for task in tasks]
+    stats = _designer.stats
+    if stats is not None:
+        _designer.stats = DesignStats()  # Each chunk reports only its own stats
+    return results, stats
+
+def iter_timed(items, timing):
+    """
+    Yields the items of an iterable, recording into a TimingStats the time spent producing each one.
+    """
+    iterator = iter(items)
+    while True:
+        start = time.perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        timing.record(time.perf_counter() - start)
+        yield item
+
+def iter_tasks(records, seed):
+    """
+    Pairs each (gene, protein) record with its deterministic seed.
+    """
+    for gene, protein in records:
+        yield gene, protein, gene_seed(seed, gene, protein)
+
+def iter_chunks(items, size):
+    """
+    Groups an iterable into lists of up to `size` items without materializing it.
+    """
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
 
-def benchmark_proteome(fasta_file):
+def iter_designs(records, workers=1, seed=0, chunk_size=16, stats=None, design_cache=None):
     """
-    Benchmarks the proteome using TranscriptDesigner.
+    Designs every (gene, protein) record, yielding (result, error) pairs in input order as they complete.
+
+    With more than one worker the records are sent to a process pool in chunks, one initialized designer per
+    worker. Only a bounded number of chunks is in flight at once, so memory does not grow with the input.
+    Every gene is designed with its own seed (see gene_seed), so the output does not depend on the number
+    of workers. Given a DesignStats, the designers are instrumented and their stats are merged into it as
+    chunks complete. Given a DesignCache, genes designed by an earlier run with the same seed and settings
+    are read back from it instead of being designed again.
     """
-    designer = TranscriptDesigner()
-    designer.initiate()
+    tasks = iter_tasks(records, seed)
+    if workers <= 1:
+        init_designer(stats, design_cache)
+        yield from map(design_gene, tasks)
+        return
+
+    def collect(future):
+        results, chunk_stats = future.result()
+        if chunk_stats is not None:
+            stats.merge(chunk_stats)
+        return results
 
-    proteome = parse_fasta(fasta_file)
+    max_in_flight = workers * 2
+    initargs = (None if stats is None else DesignStats(), design_cache)
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_designer, initargs=initargs) as executor:
+        pending = deque()
+        for chunk in iter_chunks(tasks, chunk_size):
+            pending.append(executor.submit(design_chunk, chunk))
+            if len(pending) >= max_in_flight:
+                yield from collect(pending.popleft())
+        while pending:
+            yield from collect(pending.popleft())
+
+def benchmark_proteome(fasta_file, workers=1, seed=0):
+    """
+    Benchmarks the proteome using TranscriptDesigner, collecting every result in memory.
+    Proteome-scale runs should use run_benchmark, which streams designs straight into the reports.
+    """
     successful_results = []
     error_results = []
 
-    for gene, protein in proteome.items():
-        try:
-            print(f"Processing gene: {gene} with protein sequence: {protein[:30]}...")
-            ignores = set()
-            transcript = designer.run(protein, ignores)
-            successful_results.append({
-                'gene': gene,
-                'protein': protein,
-                'transcript': transcript
-            })
-        except Exception as e:
-            error_results.append({
-                'gene': gene,
-                'protein': protein,
-                'error': f"Error: {str(e)}\nTraceback: {traceback.format_exc()}"
-            })
+    for result, error in iter_designs(iter_fasta(fasta_file), workers, seed):
+        if error is None:
+            successful_results.append(result)
+        else:
+            error_results.append(error)
     
     return successful_results, error_results
 
@@ -84,21 +209,32 @@ def analyze_errors(error_results):
     
     return error_summary
 
-def validate_transcripts(successful_results):
+class TranscriptValidator:
     """
-    Validate the successful transcripts using various checkers, now including CodonChecker.
+    Validates designed transcripts one at a time: translation and codon usage checks, plus a single
+    TranscriptScanner pass for hairpins, forbidden sequences and promoters.
     """
-    forbidden_checker = ForbiddenSequenceChecker()
-    forbidden_checker.initiate()
-    promoter_checker = PromoterChecker()
-    promoter_checker.initiate()
-    translator = Translate()
-    translator.initiate()
-    codon_checker = CodonChecker()  # Initialize CodonChecker
-    codon_checker.initiate()  # Load the codon usage data
 
-    validation_failures = []
-    for result in successful_results:
+    def initiate(self):
+        self.scanner = TranscriptScanner(checkers=("forbidden", "promoter", "hairpin"))
+        self.scanner.initiate()
+        self.translator = Translate()
+        self.translator.initiate()
+        self.codon_checker = CodonChecker()  # Initialize CodonChecker
+        self.codon_checker.initiate()  # Load the codon usage data
+
+    def run(self, result):
+        """
+        Validates one successful design.
+
+        Returns:
+            list: The validation failures of the transcript (empty if it passed every check).
+        """
+        scanner = self.scanner
+        translator = self.translator
+        codon_checker = self.codon_checker
+
+        validation_failures = []
         cds = ''.join(result['transcript'].codons)
         try:
             # Check if CDS length is a multiple of 3
@@ -121,13 +257,17 @@ def validate_transcripts(successful_results):
                 'cds': cds,
                 'site': f"Translation or completeness error: {str(e)}"
             })
-            continue
+            return validation_failures
 
-        # Validate against hairpins, forbidden sequences, and internal promoters
+        # Validate against hairpins, forbidden sequences, and internal promoters in one scan of the transcript.
+        # The UTR carries the intended RBS, so internal RBSs are not checked here.
         transcript_dna = result['transcript'].rbs.utr.upper() + cds
-        passed_hairpin, hairpin_string = hairpin_checker(transcript_dna)
-        if not passed_hairpin:
-            formatted_hairpin = hairpin_string.replace('\n', ' ').replace('"', "'")
+        first = {}
+        for violation in scanner.run(transcript_dna, limit=1):
+            first.setdefault(violation.checker, violation)
+
+        if "hairpin" in first:
+            formatted_hairpin = first["hairpin"].detail.replace('\n', ' ').replace('"', "'")
             validation_failures.append({
                 'gene': result['gene'],
                 'protein': result['protein'],
@@ -135,22 +275,20 @@ def validate_transcripts(successful_results):
                 'site': f"Hairpin detected: {formatted_hairpin}"
             })
 
-        passed_forbidden, forbidden_site = forbidden_checker.run(transcript_dna)
-        if not passed_forbidden:
+        if "forbidden" in first:
             validation_failures.append({
                 'gene': result['gene'],
                 'protein': result['protein'],
                 'cds': transcript_dna,
-                'site': f"Forbidden sequence: {forbidden_site}"
+                'site': f"Forbidden sequence: {first['forbidden'].detail}"
             })
 
-        passed_promoter, found_promoter = promoter_checker.run(transcript_dna)
-        if not passed_promoter:
+        if "promoter" in first:
             validation_failures.append({
                 'gene': result['gene'],
                 'protein': result['protein'],
                 'cds': transcript_dna,
-                'site': f"Constitutive promoter detected: {found_promoter}" if found_promoter else "Constitutive promoter detected"
+                'site': f"Constitutive promoter detected: {first['promoter'].detail}"
             })
 
         codons_above_board, codon_diversity, rare_codon_count, cai_value = codon_checker.run(result['transcript'].codons)
@@ -161,9 +299,86 @@ def validate_transcripts(successful_results):
                 'cds': cds,
                 'site': f"Codon usage check failed: Diversity={codon_diversity}, Rare Codons={rare_codon_count}, CAI={cai_value}"
             })
-    
+
+        return validation_failures
+
+def validate_transcripts(successful_results):
+    """
+    Validate the successful transcripts using various checkers, now including CodonChecker.
+    """
+    validator = TranscriptValidator()
+    validator.initiate()
+
+    validation_failures = []
+    for result in successful_results:
+        validation_failures.extend(validator.run(result))
     return validation_failures
 
+# Each validator process keeps one initialized TranscriptValidator for all the designs it checks
+_validator = None
+
+def init_validator():
+    """
+    Process-pool initializer: builds the validator process's TranscriptValidator once.
+    """
+    global _validator
+    _validator = TranscriptValidator()
+    _validator.initiate()
+
+def validate_chunk(results):
+    """
+    Validates a chunk of successful designs in a validator process.
+
+    Returns:
+        tuple: (validation failures of each design, in order; seconds spent validating the chunk)
+    """
+    start = time.perf_counter()
+    failures = [_validator.run(result) for result in results]
+    return failures, time.perf_counter() - start
+
+def iter_validated(designs, validators=1, chunk_size=16, timing=None):
+    """
+    Validates the (result, error) pairs of iter_designs as they arrive, yielding (result, error, validation
+    failures) triples in input order; failures are None for designs that raised.
+
+    With at least one validator, designs are validated in chunks by a process pool while the design stage keeps
+    running, so a run takes about as long as the slower of the two stages rather than their sum. At most
+    `validators * 2` chunks are in flight; until the oldest one completes, no further designs are pulled, which
+    holds back the design stage. With no validators, each design is validated in this process as it arrives.
+    Given a TimingStats, the time spent validating each chunk (or design) is recorded into it.
+    """
+    if validators <= 0:
+        init_validator()
+        for result, error in designs:
+            if error is not None:
+                yield None, error, None
+                continue
+            start = time.perf_counter()
+            failures = _validator.run(result)
+            if timing is not None:
+                timing.record(time.perf_counter() - start)
+            yield result, None, failures
+        return
+
+    def collect(chunk, future):
+        failures, elapsed = future.result()
+        if timing is not None:
+            timing.record(elapsed)
+        failures = iter(failures)
+        for result, error in chunk:
+            yield (None, error, None) if error is not None else (result, None, next(failures))
+
+    max_in_flight = validators * 2
+    with ProcessPoolExecutor(max_workers=validators, initializer=init_validator) as executor:
+        pending = deque()
+        for chunk in iter_chunks(designs, chunk_size):
+            results = [result for result, error in chunk if error is None]
+            pending.append((chunk, executor.submit(validate_chunk, results)))
+            if len(pending) >= max_in_flight:
+                yield from collect(*pending.popleft())
+        while pending:
+            yield from collect(*pending.popleft())
+
 def write_validation_report(validation_failures):
     """
     Writes validation results to a TSV file.
@@ -174,13 +389,26 @@ def write_validation_report(validation_failures):
         for failure in validation_failures:
             writer.writerow([failure['gene'], failure['protein'], failure['cds'], failure['site']])
 
-def generate_summary(total_genes, parsing_time, execution_time, errors_summary, validation_failures):
+def failure_checker(site):
     """
-    Generates a streamlined summary report categorizing validation failures by checker.
+    Returns the checker category of a validation failure, based on its site description.
+    """
+    if "Forbidden sequence" in site:
+        return 'Forbidden Sequence Checker'
+    elif "Hairpin detected" in site:
+        return 'Hairpin Checker'
+    elif "Codon usage check failed" in site:
+        return 'Codon Usage Checker'
+    elif "Constitutive promoter detected" in site:
+        return 'Promoter Checker'
+    elif "Translation or completeness error" in site:
+        return 'Translation/Completeness Checker'
+    return None
+
+def count_failures(validation_failures):
+    """
+    Categorizes validation failures by checker type.
     """
-    total_validation_failures = len(validation_failures)
-    
-    # Categorize failures by checker type
     checker_failures = {
         'Forbidden Sequence Checker': 0,
         'Hairpin Checker': 0,
@@ -188,26 +416,74 @@ def generate_summary(total_genes, parsing_time, execution_time, errors_summary,
         'Promoter Checker': 0,
         'Translation/Completeness Checker': 0
     }
-
-    # Increment the appropriate checker category based on the failure site
     for failure in validation_failures:
-        site = failure['site']
-        if "Forbidden sequence" in site:
-            checker_failures['Forbidden Sequence Checker'] += 1
-        elif "Hairpin detected" in site:
-            checker_failures['Hairpin Checker'] += 1
-        elif "Codon usage check failed" in site:
-            checker_failures['Codon Usage Checker'] += 1
-        elif "Constitutive promoter detected" in site:
-            checker_failures['Promoter Checker'] += 1
-        elif "Translation or completeness error" in site:
-            checker_failures['Translation/Completeness Checker'] += 1
+        checker = failure_checker(failure['site'])
+        if checker:
+            checker_failures[checker] += 1
+    return checker_failures
 
+class StreamingReports:
+    """
+    Writes error_summary.txt and validation_failures.tsv while the benchmark runs, one gene at a time.
+
+    Only running counts are kept in memory, so the cost of a run does not grow with the size of the proteome.
+    Use as a context manager so both files are closed when the run ends.
+    """
+
+    def __init__(self, error_path='error_summary.txt', failures_path='validation_failures.tsv'):
+        self.error_path = error_path
+        self.failures_path = failures_path
+        self.total_genes = 0
+        self.errors_summary = {}
+        self.total_validation_failures = 0
+        self.checker_failures = count_failures([])
+
+    def __enter__(self):
+        self.error_file = open(self.error_path, 'w')
+        self.failures_file = open(self.failures_path, 'w', newline='')
+        self.writer = csv.writer(self.failures_file, delimiter='\t')
+        self.writer.writerow(['gene', 'protein', 'cds', 'site'])
+        return self
+
+    def __exit__(self, *exc):
+        self.error_file.close()
+        self.failures_file.close()
+        return False
+
+    def add_error(self, error):
+        self.total_genes += 1
+        error_message = error['error'].split("\n")[0]
+        self.errors_summary[error_message] = self.errors_summary.get(error_message, 0) + 1
+        self.error_file.write(f"Gene: {error['gene']}\n{error['error']}\n\n")
+
+    def add_validated(self, validation_failures):
+        self.total_genes += 1
+        for failure in validation_failures:
+            self.writer.writerow([failure['gene'], failure['protein'], failure['cds'], failure['site']])
+            self.total_validation_failures += 1
+            checker = failure_checker(failure['site'])
+            if checker:
+                self.checker_failures[checker] += 1
+
+def generate_summary(total_genes, parsing_time, execution_time, errors_summary, total_validation_failures, checker_failures,
+                     design_stats=None, wall_time=None, design_wall_time=None):
+    """
+    Generates a streamlined summary report categorizing validation failures by checker, followed by the
+    designers' instrumentation when a DesignStats is given.
+
+    Parsing runtime is the time spent reading and designing and execution runtime the time spent validating,
+    each summed over the processes doing it. When the stages overlap, the wall time of the whole run and the
+    wall time until the last design was produced can be reported as well.
+    """
     # Generate the summary report
     with open('summary_report.txt', 'w') as f:
         f.write(f"Total genes processed: {total_genes}\n")
         f.write(f"Parsing runtime: {parsing_time:.2f} seconds\n")
         f.write(f"Execution runtime: {execution_time:.2f} seconds\n")
+        if wall_time is not None:
+            f.write(f"Wall-clock runtime: {wall_time:.2f} seconds\n")
+        if design_wall_time is not None:
+            f.write(f"Design stage wall-clock runtime: {design_wall_time:.2f} seconds\n")
         f.write(f"Total exceptions: {sum(errors_summary.values())}\n")
 
         if errors_summary:
@@ -224,32 +500,64 @@ def generate_summary(total_genes, parsing_time, execution_time, errors_summary,
         for checker, count in checker_failures.items():
             f.write(f"- {checker}: {count} occurrences\n")
 
-def run_benchmark(fasta_file):
+        if design_stats is not None:
+            f.write("\nDesigner instrumentation:\n")
+            for line in design_stats.format_report():
+                f.write(f"{line}\n")
+
+def run_benchmark(fasta_file, workers=1, seed=0, design_cache=None, validators=1):
     """
     Runs the complete benchmark process: parsing, running TranscriptDesigner, validating, and generating reports.
+
+    The proteome is streamed through two stages: designs are validated as they arrive (by a pool of
+    `validators` processes, or in this process if 0) and failures are written straight to the reports, so
+    memory stays flat however many proteins the FASTA file holds.
+
+    As when the stages ran one after the other, parsing runtime is the time spent reading the FASTA file and
+    designing, and execution runtime the time spent validating, each summed over the processes doing it. The
+    summary also reports the wall time of the whole run and of the design stage.
     """
     start_time = time.time()
-    
-    # Benchmark the proteome
-    parsing_start = time.time()
-    successful_results, error_results = benchmark_proteome(fasta_file)
-    parsing_time = time.time() - parsing_start
-    
-    # Analyze and log errors
-    errors_summary = analyze_errors(error_results)
-    
-    # Validate the successful transcripts
-    validation_start = time.time()
-    validation_failures = validate_transcripts(successful_results)
-    execution_time = time.time() - validation_start
 
-    # Write validation and error reports
-    write_validation_report(validation_failures)
-    
+    reading_timing = TimingStats()
+    validation_timing = TimingStats()
+    design_stats = DesignStats()
+    design_end_time = None
+
+    def designs():
+        nonlocal design_end_time
+        records = iter_timed(iter_fasta(fasta_file), reading_timing)
+        yield from iter_designs(records, workers, seed, stats=design_stats, design_cache=design_cache)
+        design_end_time = time.time()
+
+    with StreamingReports() as reports:
+        for result, error, validation_failures in iter_validated(designs(), validators, timing=validation_timing):
+            gene = (result or error)['gene']
+            protein = (result or error)['protein']
+            print(f"Processing gene: {gene} with protein sequence: {protein[:30]}...")
+            if error is not None:
+                reports.add_error(error)
+            else:
+                reports.add_validated(validation_failures)
+
+    wall_time = time.time() - start_time
+    design_timing = design_stats.timings.get("design", TimingStats())
+    parsing_time = reading_timing.total_time + design_timing.total_time
+
     # Generate the summary report
-    total_genes = len(successful_results) + len(error_results)
-    generate_summary(total_genes, parsing_time, execution_time, errors_summary, validation_failures)
+    generate_summary(reports.total_genes, parsing_time, validation_timing.total_time, reports.errors_summary,
+                     reports.total_validation_failures, reports.checker_failures, design_stats, wall_time,
+                     design_end_time - start_time)
 
 if __name__ == "__main__":
-    fasta_file = "tests/benchmarking/uniprotkb_proteome_UP000054015_2024_09_24.fasta"
-    run_benchmark(fasta_file)
+    parser = argparse.ArgumentParser(description="Design and validate every protein of a proteome.")
+    parser.add_argument("fasta_file", nargs="?", default="tests/benchmarking/uniprotkb_proteome_UP000054015_2024_09_24.fasta")
+    parser.add_argument("--workers", type=int, default=1, help="Number of designer processes (default: 1)")
+    parser.add_argument("--seed", type=int, default=0, help="Base seed from which every gene's seed is derived")
+    parser.add_argument("--validators", type=int, default=1,
+                        help="Number of validator processes running alongside design; 0 validates in-process (default: 1)")
+    parser.add_argument("--design-cache", metavar="PATH", nargs="?", const="",
+                        help="Reuse designs from an SQLite design cache (default location if PATH is omitted)")
+    args = parser.parse_args()
+    design_cache = None if args.design_cache is None else DesignCache(args.design_cache or None)
+    run_benchmark(args.fasta_file, args.workers, args.seed, design_cache, args.validators)
@@ -0,0 +1,12 @@
+import pytest
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_cache_dir(tmp_path_factory):
+    """
+    Compiles the window index, RBS library and other caches into a temporary directory rather than the
+    developer's ~/.cache/genedesign. Set in the environment, so worker processes started by the tests follow it.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        path = tmp_path_factory.mktemp("genedesign_cache")
+        monkeypatch.setenv("GENEDESIGN_CACHE_DIR", str(path))
+        yield path
@@ -0,0 +1,27 @@
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "benchmarking"))
+from microbenchmarks import compare_results, main
+
+def results(*medians):
+    return {"version": 1, "results": [
+        {"benchmark": name, "length": length, "best": median / 2, "median": median}
+        for name, length, median in medians
+    ]}
+
+def test_compare_results_flags_median_changes():
+    baseline = results(("a", 100, 1.0), ("a", 1000, 1.0), ("b", 100, 1.0), ("c", 100, 1.0))
+    current = results(("a", 100, 1.5), ("a", 1000, 2.5), ("b", 100, 0.4), ("d", 100, 1.0))
+    rows = compare_results(baseline, current)
+    assert [(row["benchmark"], row["length"], row["status"]) for row in rows] == [
+        ("a", 100, "ok"), ("a", 1000, "regression"), ("b", 100, "improvement")]
+    assert rows[1]["ratio"] == pytest.approx(2.5)
+    assert compare_results(baseline, current, threshold=0.25)[0]["status"] == "regression"
+
+def test_comparison_requires_a_baseline():
+    with pytest.raises(SystemExit):
+        main(["compare", "results.json"])
+    with pytest.raises(SystemExit):
+        main(["run", "--compare"])
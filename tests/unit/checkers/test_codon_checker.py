@@ -57,3 +57,60 @@ def test_medium_cai_example(codon_checker):
     assert codon_diversity > 0.7
     assert rare_codon_count == 0
     assert cai_value > 0.2
+
+def test_rolling_matches_run(codon_checker):
+    """
+    The rolling checker reports the same metrics as run while codons are appended and replaced.
+    """
+    cds = ['ATG', 'AGG', 'AAA', 'CAT', 'AGA', 'TGG', 'AGG', 'CTG', 'TAA']
+    rolling = codon_checker.rolling()
+    for i, codon in enumerate(cds):
+        rolling.append(codon)
+        expected = codon_checker.run(cds[:i + 1])
+        assert rolling.metrics()[:3] == expected[:3]
+        assert rolling.metrics()[3] == pytest.approx(expected[3])
+
+    edited = list(cds)
+    for index, codon in [(1, 'CGT'), (4, 'CGC'), (1, 'AGG'), (-1, 'TGA')]:
+        rolling.replace(index, codon)
+        edited[index] = codon
+        assert rolling.metrics()[:3] == codon_checker.run(edited)[:3]
+        assert rolling.metrics()[3] == pytest.approx(codon_checker.run(edited)[3])
+
+def test_rolling_cai_does_not_underflow(codon_checker):
+    """
+    On long genes the product of frequencies in run underflows, but the rolling CAI stays the geometric mean.
+    """
+    cds = ['AAA', 'CAT', 'TGG', 'CTG'] * 1000
+    rolling = codon_checker.rolling()
+    rolling.extend(cds)
+    assert codon_checker.run(cds)[3] == 0.0
+    assert rolling.cai() == pytest.approx(codon_checker.run(cds[:4])[3])
+
+def test_rolling_copy_is_independent(codon_checker):
+    rolling = codon_checker.rolling()
+    rolling.extend(['ATG', 'AAA'])
+    clone = rolling.copy()
+    clone.append('AGG')
+    assert len(rolling) == 2 and rolling.rare_count == 0
+    assert len(clone) == 3 and clone.rare_count == 1
+
+def test_run_batch_matches_run(codon_checker):
+    """
+    run_batch gives the metrics of run for every row of a codon index matrix.
+    """
+    candidates = [
+        ['ATG', 'AAA', 'CAT', 'TGG'],
+        ['AGG', 'AGA', 'AGG', 'AGA'],
+        ['ATG', 'CAA', 'GGG', 'TAA'],
+        ['CTG', 'CTG', 'CTG', 'AGG'],
+    ]
+    passed, diversity, rare, cai = codon_checker.run_batch(codon_checker.codon_table.ids_for(candidates))
+    for i, cds in enumerate(candidates):
+        expected = codon_checker.run(cds)
+        assert (passed[i], diversity[i], rare[i]) == expected[:3]
+        assert cai[i] == pytest.approx(expected[3])
+
+def test_run_batch_without_codons(codon_checker):
+    passed, diversity, rare, cai = codon_checker.run_batch([[], []])
+    assert not passed.any() and not diversity.any() and not rare.any() and not cai.any()
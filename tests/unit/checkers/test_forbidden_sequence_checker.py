@@ -52,3 +52,39 @@ def test_allowed_sites(checker):
         result, site = checker.run(seq)
         print(f"result: {result} on {seq}")
         assert result == True
+
+def test_reverse_strand_site(checker):
+    # GGTCTC (BsaI) is not palindromic, so its reverse complement must be caught too
+    result, site = checker.run("TTTGAGACCTTT")
+    assert result == False
+    assert site == "GGTCTC"
+
+def test_lowercase_input(checker):
+    result, site = checker.run("ttgacaattgaattccgaac")
+    assert result == False
+
+def test_find_all_positions_and_strands(checker):
+    hits = checker.find_all("CCGAGACCAAGAATTCAA")
+    assert (2, "-", "GGTCTC") in hits
+    assert (10, "+", "GAATTC") in hits
+    assert (10, "-", "GAATTC") in hits
+    assert len(hits) == 3
+
+def test_matches_naive_scan(checker):
+    import random
+    from genedesign.seq_utils.reverse_complement import reverse_complement
+
+    rng = random.Random(7)
+    for _ in range(200):
+        seq = ''.join(rng.choice("ACGT") for _ in range(60))
+        combined = seq + "x" + reverse_complement(seq)
+        expected = {site for site in checker.forbidden if site in combined}
+        found = {site for _, _, site in checker.find_all(seq)}
+        assert found == expected
+        assert checker.run(seq)[0] == (not expected)
+
+def test_scan_continues_across_pieces(checker):
+    state = checker.advance("TTTGAA")
+    assert checker.run("TTTGAA") == (True, None)
+    assert checker.scan("TTCAAA", state) == (checker.scan("TTTGAATTC")[0], "GAATTC")
+    assert checker.scan("CCCAAA", state)[1] is None
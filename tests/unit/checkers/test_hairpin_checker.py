@@ -0,0 +1,45 @@
+import random
+import pytest
+from genedesign.checkers.hairpin_checker import hairpin_checker, RollingHairpinChecker
+from genedesign.seq_utils.hairpin_counter import hairpin_counter
+
+def reference_hairpin_checker(dna):
+    # Re-counts every 50 bp chunk, as hairpin_checker was originally written
+    for i in range(0, len(dna) - 50 + 1, 25):
+        hairpin_count, hairpin_string = hairpin_counter(dna[i:i + 50])
+        if hairpin_count > 1:
+            return False, hairpin_string
+    return True, None
+
+def sparse_sequence(rng, length, density):
+    # Mostly A/C (which cannot pair with each other) with occasional G/T so that some chunks pass
+    return ''.join(rng.choice("GT") if rng.random() < density else rng.choice("AC") for _ in range(length))
+
+@pytest.fixture
+def sequences():
+    rng = random.Random(3)
+    seqs = [''.join(rng.choice("ACGT") for _ in range(rng.randint(0, 200))) for _ in range(100)]
+    seqs += [sparse_sequence(rng, rng.randint(40, 400), rng.choice([0.02, 0.05, 0.1])) for _ in range(300)]
+    return seqs
+
+def test_matches_chunked_checker(sequences):
+    for seq in sequences:
+        assert hairpin_checker(seq) == reference_hairpin_checker(seq)
+
+def test_incremental_matches_whole(sequences):
+    for seq in sequences:
+        checker = RollingHairpinChecker()
+        for i in range(0, len(seq), 3):
+            result = checker.extend(seq[i:i + 3])
+        if seq:
+            assert result == reference_hairpin_checker(seq)
+
+def test_copy_is_independent():
+    checker = RollingHairpinChecker()
+    checker.extend("AC" * 10)
+    trial = checker.copy()
+    assert trial.extend("CCCAAAAGGGCCCAAAAGGG" + "A" * 10)[0] == False
+    assert checker.extend("AC" * 20) == (True, None)
+
+def test_short_sequence_passes():
+    assert hairpin_checker("CCCAAAAGGGCCCAAAAGGG") == (True, None)
@@ -75,3 +75,54 @@ def test_j23119_promoters(promoter_checker):
         result, promoter = promoter_checker.run(seq)
         print(f"Sequence: {seq}, Expected: {expected}, Got: {result}, Promoter: {promoter}")
         assert result == expected, f"Test failed for sequence: {seq}. Expected {expected} but got {result}."
+
+def reference_run(checker, seq):
+    # Scalar scan of seq + "x" + reverse complement, as the checker was originally written
+    from genedesign.seq_utils.reverse_complement import reverse_complement
+    seq = seq.upper()
+    combined = seq + "x" + reverse_complement(seq)
+    for i in range(len(combined) - 29 + 1):
+        score = 0.0
+        for x, base in enumerate(combined[i:i + 29]):
+            y = {'A': 0, 'C': 1, 'G': 2, 'T': 3}.get(base, -1)
+            if y != -1:
+                score += checker.pwm[y][x]
+        if score >= 9.134:
+            return False, combined[i:i + 29]
+    return True, None
+
+def test_matches_scalar_scan(promoter_checker):
+    import random
+    rng = random.Random(11)
+    seqs = ["TTGACA" + ''.join(rng.choice("ACGT") for _ in range(rng.randint(0, 40))) + "TATAAT" for _ in range(150)]
+    seqs += [''.join(rng.choice("ACGT") for _ in range(rng.randint(0, 80))) for _ in range(150)]
+    for seq in seqs:
+        assert promoter_checker.run(seq) == reference_run(promoter_checker, seq)
+
+def test_run_batch_matches_run(promoter_checker):
+    import random
+    rng = random.Random(5)
+    seqs = [''.join(rng.choice("ACGT") for _ in range(35)) for _ in range(50)]
+    seqs += ["TTGACAGCTAGCTCAGTCCTAGGTATAATGCTAGC", "CTGATAGCTAGCTCAGTCCTAGGGATTATGCTAGC"]
+    assert promoter_checker.run_batch(seqs) == [promoter_checker.run(seq) for seq in seqs]
+
+def test_run_batch_requires_equal_lengths(promoter_checker):
+    with pytest.raises(ValueError):
+        promoter_checker.run_batch(["ACGT", "ACG"])
+
+def test_run_suffix_catches_promoter_spanning_junction(promoter_checker):
+    promoter = "TTGACAATTAATCATCGAACTAGTATAAT"
+    prefix = "GCGC" * 5 + promoter[:20]
+    suffix = promoter[20:] + "GCGC" * 3
+    assert promoter_checker.run(prefix) == (True, None)
+    assert promoter_checker.run_suffix(prefix + suffix, len(suffix)) == (False, promoter)
+
+def test_run_suffix_ignores_promoter_before_new_bases(promoter_checker):
+    promoter = "TTGACAATTAATCATCGAACTAGTATAAT"
+    assert promoter_checker.run_suffix(promoter + "GCGCGCGCG", 9) == (True, None)
+
+def test_run_suffix_reverse_strand(promoter_checker):
+    from genedesign.seq_utils.reverse_complement import reverse_complement
+    promoter = "TTGACAATTAATCATCGAACTAGTATAAT"
+    seq = "GCGC" * 3 + reverse_complement(promoter)
+    assert promoter_checker.run_suffix(seq, 9) == (False, promoter)
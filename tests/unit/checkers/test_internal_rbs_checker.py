@@ -40,3 +40,15 @@ def test_edge_case_no_shine_dalgarno(internal_rbs_checker):
     print(f"Result: {result}, Sequence: {dna_sequence}")
     assert result is True
     assert problematic_sequence is None
+
+def test_run_suffix_splits_like_run():
+    import random
+    checker = InternalRBSChecker()
+    checker.initiate()
+    rng = random.Random(2)
+    for _ in range(500):
+        seq = ''.join(rng.choice("AGGT") for _ in range(rng.randint(10, 40)))
+        split = rng.randint(0, len(seq))
+        whole_found = not checker.run(seq)[0]
+        split_found = not checker.run(seq[:split])[0] or not checker.run_suffix(seq, len(seq) - split)[0]
+        assert whole_found == split_found
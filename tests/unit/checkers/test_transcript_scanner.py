@@ -0,0 +1,86 @@
+import random
+import pytest
+from genedesign.checkers.transcript_scanner import TranscriptScanner
+from genedesign.checkers.forbidden_sequence_checker import ForbiddenSequenceChecker
+from genedesign.checkers.internal_rbs_checker import InternalRBSChecker
+from genedesign.checkers.internal_promoter_checker import encode_sequence
+from genedesign.checkers.hairpin_checker import RollingHairpinChecker, hairpin_checker
+from genedesign.seq_utils.hairpin_counter import find_hairpins
+from genedesign.models.violation import Violation
+
+PROMOTER = "TTGACAATTAATCATCGAACTAGTATAAT"
+
+@pytest.fixture
+def scanner():
+    s = TranscriptScanner()
+    s.initiate()
+    return s
+
+def random_sequence(rng, length, alphabet="ACGT"):
+    return ''.join(rng.choice(alphabet) for _ in range(length))
+
+def by_checker(violations, checker):
+    return [v for v in violations if v.checker == checker]
+
+def test_forbidden_sites_match_checker(scanner):
+    forbidden = ForbiddenSequenceChecker()
+    forbidden.initiate()
+    rng = random.Random(3)
+    for _ in range(50):
+        seq = random_sequence(rng, 300)
+        found = [(v.position, v.strand, v.detail) for v in by_checker(scanner.run(seq), "forbidden")]
+        assert found == forbidden.find_all(seq)
+
+def test_hairpins_match_hairpin_checker(scanner):
+    rng = random.Random(5)
+    for _ in range(100):
+        seq = random_sequence(rng, rng.randint(0, 160), "ACGTTA")
+        passed, hairpin_string = hairpin_checker(seq)
+        violations = by_checker(scanner.run(seq), "hairpin")
+        assert passed == (not violations)
+        if violations:
+            assert violations[0].detail == hairpin_string
+
+def test_vectorized_hairpins_match_counter(scanner):
+    rng = random.Random(7)
+    for _ in range(100):
+        seq = random_sequence(rng, rng.randint(0, 120), "ACGTN")
+        first, second = scanner.find_hairpins(encode_sequence(seq))
+        assert list(zip(first.tolist(), second.tolist())) == find_hairpins(seq)
+
+def test_internal_rbs_matches_checker(scanner):
+    rbs = InternalRBSChecker()
+    rbs.initiate()
+    rng = random.Random(11)
+    for _ in range(200):
+        seq = random_sequence(rng, 40) + "AGGAGG" + random_sequence(rng, 10) + random_sequence(rng, 20)
+        passed, site = rbs.run(seq)
+        violations = by_checker(scanner.run(seq), "internal_rbs")
+        assert passed == (not violations)
+        if site:
+            assert site in [v.detail for v in violations]
+
+def test_promoters_on_both_strands(scanner):
+    rc = PROMOTER.translate(str.maketrans("ACGT", "TGCA"))[::-1]
+    seq = "GC" * 10 + PROMOTER + "GC" * 10 + rc + "GC" * 5
+    promoters = by_checker(scanner.run(seq.lower()), "promoter")
+    assert Violation("promoter", 20, "+", PROMOTER) in promoters
+    assert Violation("promoter", 69, "-", PROMOTER) in promoters
+
+def test_limit_keeps_first_violation_per_checker(scanner):
+    seq = PROMOTER + "GAATTC" + "AAGCTT" + "GGATCC"
+    everything = scanner.run(seq)
+    first = scanner.run(seq, limit=1)
+    assert len(by_checker(everything, "forbidden")) > 1
+    assert by_checker(first, "forbidden") == by_checker(everything, "forbidden")[:1]
+    assert by_checker(first, "promoter") == by_checker(everything, "promoter")[:1]
+
+def test_selected_checkers_only():
+    scanner = TranscriptScanner(checkers=("promoter",))
+    scanner.initiate()
+    assert {v.checker for v in scanner.run(PROMOTER + "GAATTC")} == {"promoter"}
+    with pytest.raises(ValueError):
+        TranscriptScanner(checkers=("codon_usage",))
+
+def test_hairpin_windows_follow_rolling_checker(scanner):
+    assert scanner.settings()[-1] == RollingHairpinChecker().settings()
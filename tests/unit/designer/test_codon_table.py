@@ -0,0 +1,76 @@
+import random
+from collections import Counter
+import pytest
+from genedesign.codon_table import load_codon_table, build_alias_table
+from genedesign.checkers.codon_checker import CodonChecker
+
+@pytest.fixture
+def table():
+    return load_codon_table()
+
+def test_loaded_once_per_process(table):
+    assert load_codon_table() is table
+
+def test_independent_of_working_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    checker = CodonChecker()
+    checker.initiate()
+    assert checker.codon_frequencies['ATG'] == 1.0
+
+def test_table_is_read_only(table):
+    with pytest.raises(TypeError):
+        table.frequencies['ATG'] = 0.5
+
+def test_synonymous_codons(table):
+    assert [codon for codon, _ in table.synonymous['M']] == ['ATG']
+    assert len(table.synonymous['L']) == 6
+    assert len(table.codons) == 64
+
+def test_alias_table_probabilities():
+    weights = [0.04, 0.10, 0.11, 0.13, 0.13, 0.49]
+    prob, alias = build_alias_table(weights)
+    n = len(weights)
+    # Each index is drawn with probability (prob[i] + sum of (1 - prob[j]) for j aliased to i) / n
+    p = [prob[i] / n for i in range(n)]
+    for j in range(n):
+        p[alias[j]] += (1 - prob[j]) / n
+    assert p == pytest.approx([w / sum(weights) for w in weights])
+
+def test_sampling_follows_frequencies(table):
+    rng = random.Random(1)
+    draws = Counter(table.sample('L', rng) for _ in range(50000))
+    for codon, freq in table.synonymous['L']:
+        assert draws[codon] / 50000 == pytest.approx(freq / sum(f for _, f in table.synonymous['L']), abs=0.01)
+
+def test_seeded_sampling_is_reproducible(table):
+    first = [table.sample('S', random.Random(7)) for _ in range(5)]
+    second = [table.sample('S', random.Random(7)) for _ in range(5)]
+    assert first == second
+
+def test_unknown_amino_acid(table):
+    with pytest.raises(ValueError):
+        table.sample('B', random.Random())
+
+def test_sample_batch_shape_and_translation(table):
+    import numpy as np
+    ids = table.sample_batch("MKLW", 25, np.random.default_rng(0))
+    assert ids.shape == (25, 4)
+    for row in ids:
+        codons = table.codons_for(row)
+        assert codons[0] == 'ATG' and codons[3] == 'TGG'
+        assert codons[1] in ('AAA', 'AAG')
+        assert codons[2] in [codon for codon, _ in table.synonymous['L']]
+
+def test_sample_batch_follows_frequencies(table):
+    import numpy as np
+    ids = table.sample_batch("L", 50000, np.random.default_rng(1))
+    draws = Counter(table.codons[i] for i in ids[:, 0].tolist())
+    total = sum(f for _, f in table.synonymous['L'])
+    for codon, freq in table.synonymous['L']:
+        assert draws[codon] / 50000 == pytest.approx(freq / total, abs=0.01)
+
+def test_sample_batch_is_reproducible(table):
+    import numpy as np
+    first = table.sample_batch("SRL", 10, np.random.default_rng(3))
+    second = table.sample_batch("SRL", 10, np.random.default_rng(3))
+    assert (first == second).all()
@@ -0,0 +1,152 @@
+import os
+import sys
+import pytest
+from concurrent.futures import ProcessPoolExecutor
+from genedesign.design_cache import DesignCache, design_fingerprint
+from genedesign.design_stats import DesignStats
+from genedesign.models.rbs_option import RBSOption
+from genedesign.models.transcript import Transcript
+from genedesign.transcript_designer import TranscriptDesigner
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "benchmarking"))
+from proteome_benchmarker import iter_designs
+
+PEPTIDE = "MYPFIRTARMTVCAKKHVHLTRDAAEQLLADIDRRLDQLLPVEGERD"
+
+def make_transcript(index):
+    rbs = RBSOption(utr="AAGGAGG", cds="ATGAAATAA", gene_name=f"gene{index}", first_six_aas="MK")
+    return Transcript(rbs, "MK", ["ATG", "AAA", "TAA"])
+
+def initiated_designer(**kwargs):
+    designer = TranscriptDesigner(**kwargs)
+    designer.initiate()
+    return designer
+
+def store(args):
+    path, start = args
+    cache = DesignCache(path)
+    for index in range(start, start + 20):
+        cache.put(f"key{index}", make_transcript(index))
+    return [cache.get(f"key{index}").rbs.gene_name for index in range(start, start + 20)]
+
+@pytest.fixture
+def cache(tmp_path):
+    with DesignCache(str(tmp_path / "designs.sqlite")) as cache:
+        yield cache
+
+def test_round_trip(cache):
+    assert cache.get("missing") is None
+    cache.put("key", make_transcript(1))
+    assert cache.get("key") == make_transcript(1)
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+def test_evicts_least_recently_used(tmp_path):
+    with DesignCache(str(tmp_path / "designs.sqlite"), max_entries=3) as cache:
+        for index in range(3):
+            cache.put(f"key{index}", make_transcript(index))
+        cache.get("key0")  # Now more recently used than key1
+        cache.put("key3", make_transcript(3))
+        assert len(cache) == 3
+        assert cache.get("key1") is None
+        assert all(cache.get(f"key{index}") is not None for index in (0, 2, 3))
+
+def test_key_covers_every_input():
+    rbs = make_transcript(0).rbs
+    key = DesignCache.key("fingerprint", PEPTIDE, set(), 1)
+    assert key == DesignCache.key("fingerprint", PEPTIDE, frozenset(), 1)
+    others = {DesignCache.key("other", PEPTIDE, set(), 1), DesignCache.key("fingerprint", PEPTIDE[1:], set(), 1),
+              DesignCache.key("fingerprint", PEPTIDE, {rbs}, 1), DesignCache.key("fingerprint", PEPTIDE, set(), 2)}
+    assert key not in others and len(others) == 4
+
+def test_fingerprint_follows_settings():
+    designer = initiated_designer()
+    fingerprint = design_fingerprint(designer)
+    assert fingerprint == design_fingerprint(designer)
+    assert fingerprint != design_fingerprint(initiated_designer(mode="beam"))
+    designer.promoterChecker.threshold += 1
+    assert design_fingerprint(designer) != fingerprint
+
+def test_designer_serves_seeded_designs(cache):
+    stats = DesignStats()
+    designer = TranscriptDesigner(design_cache=cache, stats=stats)
+    designer.initiate()
+    uncached = initiated_designer()
+
+    for seed in (1, 2):
+        designer.reseed(seed)
+        first = designer.run(PEPTIDE, set())
+        designer.reseed(seed)
+        assert designer.run(PEPTIDE, set()) == first
+        uncached.reseed(seed)
+        assert uncached.run(PEPTIDE, set()) == first
+    assert (cache.hits, len(cache), stats.counters["cached"]) == (2, 2, 2)
+
+    # Unseeded runs and runs that continue from an earlier one are never cached
+    designer.reseed(None)
+    designer.run(PEPTIDE, set())
+    designer.reseed(3)
+    designer.run(PEPTIDE, set())
+    designer.run(PEPTIDE, set())
+    assert len(cache) == 3
+
+def test_concurrent_processes(tmp_path):
+    path = str(tmp_path / "designs.sqlite")
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        names = list(executor.map(store, [(path, start) for start in range(0, 80, 20)]))
+    assert names == [[f"gene{index}" for index in range(start, start + 20)] for start in range(0, 80, 20)]
+    assert len(DesignCache(path)) == 80
+    assert os.path.exists(path)
+
+def test_designer_rebuilds_codon_usage_on_hit(cache):
+    designer = TranscriptDesigner(design_cache=cache)
+    designer.initiate()
+    designer.reseed(1)
+    transcript = designer.run(PEPTIDE, set())
+    designer.reseed(1)
+    designer.run("MKV", set())
+    designer.reseed(1)
+    assert designer.run(PEPTIDE, set()) == transcript and cache.hits == 1
+    assert designer.codonUsage.metrics() == pytest.approx(designer.codonChecker.run(transcript.codons))
+
+def test_unwritable_directory_is_a_miss(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    cache = DesignCache(str(blocker / "designs.sqlite"))
+    cache.put("key", make_transcript(0))
+    assert cache.get("key") is None and cache.misses == 1
+
+def test_benchmark_reruns_hit_after_insertion(cache):
+    records = [(f"gene{index}", peptide) for index, peptide in enumerate(["MKVLAT", "MSTNPKPQRK", "MAEGHWYT", "MQRSTVAK"])]
+    stats = DesignStats()
+    first = [result['transcript'] for result, _ in iter_designs(records, seed=5, stats=stats, design_cache=cache)]
+    assert stats.counters["cached"] == 0
+
+    stats = DesignStats()
+    second = [result['transcript'] for result, _ in
+              iter_designs([("new", "MKKLLPTA")] + records, seed=5, stats=stats, design_cache=cache)]
+    assert stats.counters["cached"] == len(records)
+    assert second[1:] == first
+
+def test_corrupt_record_is_a_miss(cache):
+    cache.put("key", make_transcript(0))
+    cache.connection().execute("UPDATE designs SET transcript = ? WHERE key = ?", ('{"rbs": [', "key"))
+    assert cache.get("key") is None and cache.misses == 1
+    assert len(cache) == 0
+
+def test_count_follows_stores_and_clears(tmp_path):
+    path = str(tmp_path / "designs.sqlite")
+    with DesignCache(path, max_entries=3) as cache:
+        for index in range(5):
+            cache.put(f"key{index}", make_transcript(index))
+        cache.put("key4", make_transcript(5))
+        assert len(cache) == cache.connection().execute("SELECT COUNT(*) FROM designs").fetchone()[0] == 3
+        cache.clear()
+        assert len(cache) == 0
+
+    # A database written before the count was kept starts from its actual size
+    with DesignCache(path) as cache:
+        connection = cache.connection()
+        connection.executescript("DROP TABLE design_count; DROP TRIGGER designs_insert; DROP TRIGGER designs_delete; "
+                                 "INSERT INTO designs VALUES ('old', '{}', 0);")
+        cache.close()
+        assert len(cache) == 1
@@ -0,0 +1,97 @@
+import asyncio
+import json
+import pytest
+from genedesign.design_service import DesignService, DesignClient
+from genedesign.seq_utils.Translate import Translate
+
+PEPTIDE = "MYPFIRTARMTVCAKKHVHLTRDAAEQLLADIDRRLDQLLPVEGERD"
+
+@pytest.fixture
+def translator():
+    t = Translate()
+    t.initiate()
+    return t
+
+def run_with_service(scenario, **options):
+    """
+    Starts a one-worker service on a free local port, runs `scenario(service, client)` and shuts everything down.
+    """
+    async def main():
+        async with DesignService(workers=1, **options) as service:
+            await service.start(port=0)
+            host, port = service.address[:2]
+            async with await DesignClient.connect(host, port) as client:
+                return await scenario(service, client)
+    return asyncio.run(main())
+
+def test_design_round_trip(translator):
+    async def scenario(service, client):
+        return await client.design(PEPTIDE, seed=1), await client.design(PEPTIDE, seed=1)
+
+    first, second = run_with_service(scenario)
+    assert first['ok'] and first == second
+    codons = first['transcript']['codons']
+    assert translator.run(''.join(codons)) == PEPTIDE
+    assert codons[-1] == "TAA"
+
+def test_ignored_rbs_is_avoided():
+    async def scenario(service, client):
+        first = await client.design(PEPTIDE, seed=2)
+        second = await client.design(PEPTIDE, ignores=[first['transcript']['rbs']], seed=2)
+        return first, second
+
+    first, second = run_with_service(scenario)
+    assert second['ok'] and second['transcript']['rbs'] != first['transcript']['rbs']
+
+def test_concurrent_requests_are_batched_under_backpressure():
+    async def scenario(service, client):
+        responses = await asyncio.gather(*(client.design(PEPTIDE, seed=i) for i in range(12)))
+        return responses, service.batches, service.requests
+
+    responses, batches, requests = run_with_service(scenario, max_batch=4, max_queue=2)
+    assert all(response['ok'] for response in responses)
+    assert requests == 12 and batches < 12
+
+def test_errors_are_reported_per_request():
+    async def scenario(service, client):
+        failed = await client.design("MZZ")
+        # Read the responses to hand-written lines directly, without the client's listener
+        client.listener.cancel()
+        await asyncio.gather(client.listener, return_exceptions=True)
+        client.writer.write(b"not json\n" + json.dumps({'id': 'x', 'peptide': 5}).encode() + b"\n")
+        bad_lines = [json.loads(await client.reader.readline()) for _ in range(2)]
+        return failed, bad_lines
+
+    failed, bad_lines = run_with_service(scenario)
+    assert not failed['ok'] and failed['error']
+    assert [line['ok'] for line in bad_lines] == [False, False]
+    assert bad_lines[1]['id'] == 'x'
+
+def test_overlong_line_is_rejected():
+    async def scenario(service, client):
+        client.listener.cancel()
+        await asyncio.gather(client.listener, return_exceptions=True)
+        client.writer.write(b"x" * 200_000 + b"\n" + json.dumps({'id': 1, 'peptide': PEPTIDE, 'seed': 1}).encode() + b"\n")
+        return [json.loads(await client.reader.readline()) for _ in range(2)]
+
+    rejected, designed = run_with_service(scenario)
+    assert not rejected['ok'] and "too long" in rejected['error']
+    assert designed['id'] == 1 and designed['ok']
+
+def test_stop_answers_pending_requests():
+    async def main():
+        service = DesignService(workers=1, max_batch=1)
+        await service.start(port=0)
+        host, port = service.address[:2]
+        client = await DesignClient.connect(host, port)
+        requests = [asyncio.create_task(client.design(PEPTIDE * 20, seed=i)) for i in range(4)]
+        while service.queue.empty() and not service.batch_tasks:
+            await asyncio.sleep(0.01)
+        await asyncio.wait_for(service.stop(), timeout=60)
+        responses = await asyncio.wait_for(asyncio.gather(*requests), timeout=10)
+        await client.close()
+        return responses
+
+    responses = asyncio.run(main())
+    assert any(not response['ok'] and response['error'] == "Design service stopped" for response in responses)
+    assert all(response['ok'] or response['error'] == "Design service stopped" for response in responses)
@@ -0,0 +1,48 @@
+import pytest
+from genedesign.design_stats import DesignStats
+from genedesign.transcript_designer import TranscriptDesigner
+
+PEPTIDE = "MYPFIRTARMTVCAKKHVHLTRDAAEQLLADIDRRLDQLLPVEGERD"
+
+def test_record_and_merge():
+    first = DesignStats()
+    first.record("promoter", 0.002, True)
+    first.record("promoter", 0.005, False)
+    first.count("windows", 3)
+    second = DesignStats()
+    second.record("promoter", 0.001, True)
+    second.record("rbs_chooser", 0.004)
+    second.count("windows")
+
+    first.merge(second)
+    promoter = first.timings["promoter"]
+    assert (promoter.calls, promoter.passed, promoter.failed) == (3, 2, 1)
+    assert promoter.total_time == pytest.approx(0.008)
+    assert promoter.max_time == 0.005
+    assert first.timings["rbs_chooser"].calls == 1
+    assert first.counters["windows"] == 4
+    assert first.as_dict()["timings"]["promoter"]["calls"] == 3
+
+@pytest.mark.parametrize("mode", TranscriptDesigner.MODES)
+def test_designer_records_stats(mode):
+    stats = DesignStats()
+    designer = TranscriptDesigner(seed=0, mode=mode, stats=stats)
+    designer.initiate()
+    instrumented = designer.run(PEPTIDE, set())
+
+    windows = -(-len(PEPTIDE) // 3)
+    assert stats.counters["genes"] == 1
+    assert stats.counters["windows"] == windows
+    assert stats.counters["candidates"] >= windows
+    assert stats.timings["rbs_chooser"].calls == 1
+    for name in ("forbidden", "promoter", "internal_rbs"):
+        timing = stats.timings[name]
+        assert timing.calls == timing.passed + timing.failed > 0
+    assert stats.timings["rbs_cds_hairpin"].calls == stats.timings["rbs_edit_distance"].calls == 1
+    rbs_hairpin = stats.timings["rbs_hairpin"]
+    assert rbs_hairpin.calls == rbs_hairpin.passed + rbs_hairpin.failed > 0
+
+    # Instrumentation does not change the design
+    plain = TranscriptDesigner(seed=0, mode=mode)
+    plain.initiate()
+    assert plain.run(PEPTIDE, set()) == instrumented
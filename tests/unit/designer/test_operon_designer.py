@@ -5,4 +5,55 @@ Purpose: Tests the main functionality of the operon_designer.py, ensuring that i
 Coverage:
 Verify that the correct sequences are generated for different compositions.
 Ensure error handling for missing promoters, terminators, or incomplete input.
-"""
\ No newline at end of file
+"""
+import pytest
+from genedesign.operon_designer import OperonDesigner
+from genedesign.models.composition import Composition
+from genedesign.seq_utils.Translate import Translate
+
+PROTEINS = [
+    "MYPFIRTARMTVCAKKHVHLTRDAAEQLLADIDRRLDQLLPVEGERD",
+    "MALLSSSLSSQIPTGSHPLTHTQCIPHFSTTINAGISAGKPRSF",
+    "MSKGEELFTGVVPILVELDGDVNGHKFSVSGEGEGDATYGKLTLKF",
+]
+
+@pytest.fixture
+def composition():
+    return Composition("Ecoli", "TTGACAATTAATCATCGAACTAGTATAAT", PROTEINS, "TGCCTGGCGGCAGTAGCGCG")
+
+def test_operon_transcripts(composition):
+    translator = Translate()
+    translator.initiate()
+    designer = OperonDesigner(seed=1)
+    designer.initiate()
+    operon = designer.run(composition)
+
+    assert [transcript.peptide for transcript in operon.transcripts] == PROTEINS
+    for transcript in operon.transcripts:
+        assert translator.run(''.join(transcript.codons)) == transcript.peptide
+    assert len({transcript.rbs for transcript in operon.transcripts}) == len(PROTEINS)
+
+    # Deferred assignment picks the RBSs that choosing them gene by gene would
+    ignores = set()
+    for transcript in operon.transcripts:
+        rbs = designer.td.rbsChooser.run(''.join(transcript.codons), ignores)
+        assert rbs == transcript.rbs
+        ignores.add(rbs)
+
+def test_concurrent_design_matches_sequential(composition):
+    sequential = OperonDesigner(seed=4)
+    sequential.initiate()
+    with OperonDesigner(workers=2, seed=4) as concurrent:
+        concurrent.initiate()
+        assert concurrent.run(composition) == sequential.run(composition)
+
+def test_rank_starts_with_run_choice(composition):
+    designer = OperonDesigner(seed=2)
+    designer.initiate()
+    chooser = designer.td.rbsChooser
+    cds = designer.td.design_cds(PROTEINS[0])
+    ranking = chooser.rank(cds)
+    assert ranking[0] == chooser.run(cds, set())
+    assert sorted(ranking, key=chooser.rbs_library.index) == chooser.rbs_library
+    with pytest.raises(ValueError):
+        chooser.assign_ranked([ranking[:1], ranking[:1]])
@@ -0,0 +1,42 @@
+import os
+import pytest
+from genedesign.rbs_library import load_rbs_library, DEFAULT_RBS_LIBRARY
+from genedesign.rbs_chooser import RBSChooser
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("GENEDESIGN_CACHE_DIR", str(tmp_path))
+    load_rbs_library.cache_clear()
+    yield tmp_path
+    load_rbs_library.cache_clear()
+
+def test_library_is_compiled_into_cache(cache_dir):
+    library = load_rbs_library()
+    assert len(library) > 0
+    assert any(name.startswith("rbs_library_") for name in os.listdir(cache_dir))
+
+    load_rbs_library.cache_clear()
+    assert load_rbs_library() == library
+
+def test_library_features(cache_dir):
+    option, utr_hairpin_count = load_rbs_library()[0]
+    assert option.gene_name == "uspA"
+    assert option.first_six_aas == "MAYKHI"
+    assert utr_hairpin_count >= 0
+
+def test_unreadable_cache_is_rebuilt(cache_dir):
+    library = load_rbs_library()
+    for name in os.listdir(cache_dir):
+        with open(os.path.join(cache_dir, name), "wb") as f:
+            f.write(b"not a pickle")
+    load_rbs_library.cache_clear()
+    assert load_rbs_library() == library
+
+def test_chooser_respects_ignores(cache_dir):
+    chooser = RBSChooser()
+    chooser.initiate()
+    cds = "ATGGCTTATAAACACATTCTCATCGCGGTCTAA"
+    first = chooser.run(cds, set())
+    second = chooser.run(cds, {first})
+    assert first in chooser.rbs_options
+    assert second != first
@@ -6,4 +6,92 @@ Coverage:
 Test the reverse-translation of protein sequences into optimized DNA.
 Ensure proper RBS assignment for each mRNA.
 Validate handling of codon optimization and RNA folding requirements.
-"""
\ No newline at end of file
+"""
+import pytest
+from genedesign.transcript_designer import TranscriptDesigner
+from genedesign.seq_utils.Translate import Translate
+from genedesign.models.window_context import WindowContext
+
+PEPTIDE = "MYPFIRTARMTVCAKKHVHLTRDAAEQLLADIDRRLDQLLPVEGERD"
+
+@pytest.fixture
+def translator():
+    t = Translate()
+    t.initiate()
+    return t
+
+def test_design_translates_back(translator):
+    designer = TranscriptDesigner(seed=1)
+    designer.initiate()
+    transcript = designer.run(PEPTIDE, set())
+    assert all(len(codon) == 3 for codon in transcript.codons)
+    assert translator.run(''.join(transcript.codons)) == PEPTIDE
+    assert transcript.codons[-1] == "TAA"
+
+def test_seeded_designs_are_reproducible():
+    first = TranscriptDesigner(seed=5)
+    first.initiate()
+    second = TranscriptDesigner(seed=5)
+    second.initiate()
+    assert first.run(PEPTIDE, set()) == second.run(PEPTIDE, set())
+
+    second.reseed(5)
+    first.reseed(5)
+    assert first.run(PEPTIDE, set()) == second.run(PEPTIDE, set())
+
+def test_window_checked_against_committed_cds():
+    designer = TranscriptDesigner(seed=0)
+    designer.initiate()
+    context = designer.advance_context(WindowContext(), ["GCG", "CGC", "GAA"])
+    # "TTC" completes an EcoRI site (GAATTC) across the junction, which the window alone does not show
+    assert designer.check_window(["TTC", "GCT", "GGC"])["forbidden"] == True
+    assert designer.check_window(["TTC", "GCT", "GGC"], context)["forbidden"] == False
+    assert designer.validate_window(["TTC", "GCT", "GGC"], context) == False
+    assert designer.check_window(["TCG", "GCT", "GGC"], context)["forbidden"] == True
+
+def test_beam_mode_translates_back(translator):
+    designer = TranscriptDesigner(seed=3, mode="beam", beam_width=3)
+    designer.initiate()
+    transcript = designer.run(PEPTIDE, set())
+    assert translator.run(''.join(transcript.codons)) == PEPTIDE
+    assert transcript.codons[-1] == "TAA"
+
+    designer.reseed(3)
+    assert designer.run(PEPTIDE, set()) == transcript
+
+def test_beam_mode_avoids_forbidden_sites():
+    designer = TranscriptDesigner(seed=0, mode="beam")
+    designer.initiate()
+    cds = designer.beam_search_optimization(PEPTIDE) + "TAA"
+    assert designer.forbiddenChecker.run(cds) == (True, None)
+
+def test_unknown_mode_rejected():
+    with pytest.raises(ValueError):
+        TranscriptDesigner(mode="exhaustive")
+    with pytest.raises(ValueError):
+        TranscriptDesigner(mode="beam", beam_width=0)
+
+@pytest.mark.parametrize("mode", TranscriptDesigner.MODES)
+def test_codon_usage_tracks_design(mode):
+    designer = TranscriptDesigner(seed=2, mode=mode)
+    designer.initiate()
+    transcript = designer.run(PEPTIDE, set())
+    assert designer.codonUsage.codons == transcript.codons
+    assert designer.codonUsage.metrics()[:3] == designer.codonChecker.run(transcript.codons)[:3]
+
+def test_sliding_mode_checks_junction_with_stop_codon():
+    designer = TranscriptDesigner(seed=0)
+    designer.initiate()
+    # CAT TTT TTT completes a TTTTTTTT site once TAA is appended, though the last window passes on its own
+    for seed in range(20):
+        designer.reseed(seed)
+        cds = designer.sliding_window_optimization("MKHFF") + "TAA"
+        assert designer.forbiddenChecker.run(cds) == (True, None)
+
+@pytest.mark.parametrize("mode", TranscriptDesigner.MODES)
+@pytest.mark.parametrize("peptide", ["MKXAL", "mkal"])
+def test_invalid_residue_rejected(mode, peptide):
+    designer = TranscriptDesigner(seed=1, mode=mode)
+    designer.initiate()
+    with pytest.raises(ValueError, match="No codons available for amino acid"):
+        designer.run(peptide, set())
@@ -0,0 +1,70 @@
+import pytest
+from genedesign.verdict_cache import VerdictCache, shared_verdict_cache
+from genedesign.transcript_designer import TranscriptDesigner
+from genedesign.models.window_context import WindowContext
+
+PEPTIDE = "MYPFIRTARMTVCAKKHVHLTRDAAEQLLADIDRRLDQLLPVEGERD"
+
+def test_hits_and_misses():
+    cache = VerdictCache(maxsize=4)
+    calls = []
+    compute = lambda: calls.append(1) or True
+    assert cache.lookup("GCTGAACTG", compute) is True
+    assert cache.lookup("GCTGAACTG", compute) is True
+    assert (cache.hits, cache.misses, len(calls)) == (1, 1, 1)
+    assert cache.hit_rate == 0.5
+
+def test_least_recently_used_evicted():
+    cache = VerdictCache(maxsize=2)
+    cache.lookup("a", lambda: 1)
+    cache.lookup("b", lambda: 2)
+    cache.lookup("a", lambda: 1)    # "b" is now the least recently used
+    cache.lookup("c", lambda: 3)
+    assert len(cache) == 2
+    assert cache.lookup("a", lambda: None) == 1
+    assert cache.lookup("b", lambda: None) is None
+
+def test_clear_and_invalid_size():
+    cache = VerdictCache(maxsize=2)
+    cache.lookup("a", lambda: 1)
+    cache.clear()
+    assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+    with pytest.raises(ValueError):
+        VerdictCache(maxsize=0)
+
+def test_designers_share_process_cache():
+    first = TranscriptDesigner()
+    first.initiate()
+    second = TranscriptDesigner()
+    second.initiate()
+    assert first.verdictCache is second.verdictCache is shared_verdict_cache()
+
+def test_cached_verdicts_match_fresh_checks():
+    cached = TranscriptDesigner(seed=2, verdict_cache=VerdictCache())
+    cached.initiate()
+    cds = cached.sliding_window_optimization(PEPTIDE)
+    cached.reseed(2)
+    assert cached.sliding_window_optimization(PEPTIDE) == cds
+    assert cached.verdictCache.hits > 0
+
+    # Promoter verdicts depend on the lookback, so the same window is judged again in a new context
+    context = cached.advance_context(WindowContext(), ["TTG", "ACA"])
+    window = ["GCT", "GAA", "CTG"]
+    assert cached.check_window(window, context) == cached.check_window(window, context)
+    fresh = TranscriptDesigner(verdict_cache=VerdictCache())
+    fresh.initiate()
+    assert cached.check_window(window, context) == fresh.check_window(window, context)
+
+def test_designers_with_other_settings_keep_their_verdicts():
+    cache = VerdictCache()
+    lenient = TranscriptDesigner(verdict_cache=cache)
+    lenient.initiate()
+    strict = TranscriptDesigner(verdict_cache=cache)
+    strict.initiate()
+    strict.codonChecker.cai_threshold = 2.0  # No window can reach it
+    strict.refresh_fingerprints()
+
+    window = ["GCT", "GAA", "CTG"]
+    assert lenient.check_window(window)["codon_usage"]
+    assert not strict.check_window(window)["codon_usage"]
+    assert lenient.checkerFingerprint != strict.checkerFingerprint
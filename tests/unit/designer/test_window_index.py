@@ -0,0 +1,69 @@
+import itertools
+import os
+import numpy as np
+import pytest
+from genedesign.window_index import index_fingerprint, load_window_index
+from genedesign.codon_table import DEFAULT_CODON_USAGE, load_codon_table
+from genedesign.seq_utils.Translate import Translate
+from genedesign.checkers.codon_checker import CodonChecker
+from genedesign.checkers.forbidden_sequence_checker import ForbiddenSequenceChecker
+from genedesign.checkers.internal_rbs_checker import InternalRBSChecker
+from genedesign.checkers.hairpin_checker import RollingHairpinChecker
+
+@pytest.fixture
+def index():
+    return load_window_index()
+
+@pytest.fixture
+def checkers():
+    forbidden, rbs, codon = ForbiddenSequenceChecker(), InternalRBSChecker(), CodonChecker()
+    for checker in (forbidden, rbs, codon):
+        checker.initiate()
+    return forbidden, rbs, codon
+
+def test_sampled_windows_pass_window_checks(index, checkers):
+    forbidden, rbs, codon = checkers
+    translator = Translate()
+    translator.initiate()
+    table = load_codon_table()
+    rng = np.random.default_rng(0)
+    for peptide in ["MYP", "KKK", "GAF", "RR", "L"]:
+        for row in index.sample(peptide, 20, rng):
+            candidate = list(table.codons_for(row))
+            dna = ''.join(candidate)
+            assert translator.run(dna) == peptide
+            assert forbidden.run(dna)[0] and rbs.run(dna)[0] and codon.run(candidate)[0]
+
+def test_valid_windows_match_enumeration(index, checkers):
+    forbidden, rbs, codon = checkers
+    table = load_codon_table()
+    options = [[codon for codon, _ in table.synonymous[aa]] for aa in "KKF"]
+    expected = sum(
+        1 for candidate in itertools.product(*options)
+        if forbidden.run(''.join(candidate))[0] and rbs.run(''.join(candidate))[0] and codon.run(list(candidate))[0]
+    )
+    assert index.valid_count("KKF") == expected > 0
+
+def test_index_is_compiled_into_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("GENEDESIGN_CACHE_DIR", str(tmp_path))
+    load_window_index.cache_clear()
+    try:
+        built = load_window_index()
+        assert any(name.startswith("window_index_") for name in os.listdir(tmp_path))
+        load_window_index.cache_clear()
+        loaded = load_window_index()
+        assert np.array_equal(built.windows, loaded.windows)
+        assert np.array_equal(built.offsets, loaded.offsets)
+    finally:
+        load_window_index.cache_clear()
+
+@pytest.mark.parametrize("cls, attribute, value", [
+    (CodonChecker, "cai_threshold", 0.3),
+    (CodonChecker, "rare_codon_limit", 2),
+    (InternalRBSChecker, "settings", lambda self: (("AGGAGG",), ("ATG",))),
+    (RollingHairpinChecker, "settings", lambda self: (50, 25, 4, 4, 9, 1)),
+])
+def test_fingerprint_covers_compile_settings(monkeypatch, cls, attribute, value):
+    fingerprint = index_fingerprint(DEFAULT_CODON_USAGE)
+    monkeypatch.setattr(cls, attribute, value)
+    assert index_fingerprint(DEFAULT_CODON_USAGE) != fingerprint
@@ -0,0 +1,39 @@
+import random
+import pytest
+from genedesign.seq_utils.calc_edit_distance import calculate_edit_distance, myers_edit_distances
+
+def full_table_distance(s1, s2):
+    dist = [[i + j if i == 0 or j == 0 else 0 for j in range(len(s2) + 1)] for i in range(len(s1) + 1)]
+    for i in range(1, len(s1) + 1):
+        for j in range(1, len(s2) + 1):
+            if s1[i - 1] == s2[j - 1]:
+                dist[i][j] = dist[i - 1][j - 1]
+            else:
+                dist[i][j] = 1 + min(dist[i - 1][j], dist[i][j - 1], dist[i - 1][j - 1])
+    return dist[-1][-1]
+
+@pytest.fixture
+def pairs():
+    rng = random.Random(0)
+    words = [''.join(rng.choice("MKLV") for _ in range(rng.randint(0, 8))) for _ in range(60)]
+    return [(a, b) for a, b in zip(words, reversed(words))]
+
+def test_known_distances():
+    assert calculate_edit_distance("AACAAGATAT", "AACATGATAT") == 1
+    assert calculate_edit_distance("AACAAGTTAT", "ATCAAGTTCT") == 2
+    assert calculate_edit_distance("", "MKL") == 3
+    assert myers_edit_distances("AACAAGTTAT", ["AACAAGTTAT", "ATCAAGTTCT", ""]) == [0, 2, 10]
+
+def test_matches_full_table(pairs):
+    for a, b in pairs:
+        expected = full_table_distance(a, b)
+        assert calculate_edit_distance(a, b) == expected
+        assert myers_edit_distances(a, [b]) == [expected]
+
+def test_cutoff_caps_distances(pairs):
+    for a, b in pairs:
+        expected = full_table_distance(a, b)
+        for cutoff in range(4):
+            capped = min(expected, cutoff + 1)
+            assert calculate_edit_distance(a, b, max_distance=cutoff) == capped
+            assert myers_edit_distances(a, [b], max_distance=cutoff) == [capped]
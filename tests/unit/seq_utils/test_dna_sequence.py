@@ -0,0 +1,65 @@
+import pytest
+from genedesign.seq_utils.dna_sequence import DNASequence, encode_sequence
+from genedesign.seq_utils.reverse_complement import reverse_complement
+from genedesign.seq_utils.hairpin_counter import hairpin_counter
+from genedesign.seq_utils.Translate import Translate
+from genedesign.checkers.forbidden_sequence_checker import ForbiddenSequenceChecker
+from genedesign.checkers.internal_promoter_checker import PromoterChecker
+from genedesign.checkers.hairpin_checker import hairpin_checker
+
+CDS = "ATGAAAGAATTCTTGACAATTAATCATCGAACTAGTATAATAAAAACCCCCAAAAAAAAGGGGGAATAA"
+
+def test_round_trip_and_packing():
+    seq = DNASequence(CDS.lower())
+    assert str(seq) == CDS
+    assert seq == CDS and len(seq) == len(CDS)
+    assert len(seq._data) == -(-len(CDS) // 4)
+    assert list(encode_sequence(seq)) == list(encode_sequence(CDS))
+
+def test_slices_share_bytes():
+    seq = DNASequence(CDS)
+    view = seq[5:22]
+    assert view._data is seq._data
+    assert str(view) == CDS[5:22]
+    assert str(view[3:-2]) == CDS[5:22][3:-2]
+    assert str(seq[::-1]) == CDS[::-1]
+    assert seq[-1] == CDS[-1]
+
+def test_reverse_complement_is_cached():
+    seq = DNASequence(CDS)
+    rc = seq.reverse_complement()
+    assert rc == reverse_complement(CDS)
+    assert seq.reverse_complement() is rc
+    assert rc.reverse_complement() is seq
+    assert reverse_complement(seq) is rc
+
+def test_codons():
+    seq = DNASequence(CDS)
+    assert [seq.codon(i) for i in range(len(CDS) // 3)] == [CDS[i:i + 3] for i in range(0, len(CDS), 3)]
+    assert seq[1:10].codon(0) == CDS[1:4]
+    with pytest.raises(IndexError):
+        seq.codon(len(CDS) // 3)
+
+def test_invalid_bases_rejected():
+    with pytest.raises(ValueError):
+        DNASequence("ATGNNN")
+    with pytest.raises(KeyError):
+        reverse_complement("ATGN")
+
+def test_consumers_accept_dna_sequence():
+    seq = DNASequence(CDS)
+    translator = Translate()
+    translator.initiate()
+    assert translator.run(seq) == translator.run(CDS)
+
+    forbidden = ForbiddenSequenceChecker()
+    forbidden.initiate()
+    assert forbidden.run(seq) == forbidden.run(CDS)
+
+    promoter = PromoterChecker()
+    promoter.initiate()
+    assert promoter.run(seq) == promoter.run(CDS)
+    assert promoter.run_batch([seq, seq[1:]+"A"]) == promoter.run_batch([CDS, CDS[1:]+"A"])
+
+    assert hairpin_counter(seq) == hairpin_counter(CDS)
+    assert hairpin_checker(seq) == hairpin_checker(CDS)
@@ -38,3 +38,42 @@ def test_varied_hairpins(sequence):
         assert hairpins is not None, "Expected a hairpin string, but got None."
     else:
         assert hairpins is None, "Expected no hairpin string, but got one."
+
+def reference_hairpin_counter(sequence, min_stem=3, min_loop=4, max_loop=9):
+    # Pairwise scan, as hairpin_counter was originally written
+    from genedesign.seq_utils.reverse_complement import reverse_complement
+    count = 0
+    hairpin_string = ""
+    for i in range(len(sequence)):
+        for j in range(i + min_stem + min_loop, min(i + min_stem + max_loop + 1, len(sequence))):
+            stem1 = sequence[i:i + min_stem]
+            stem2 = sequence[j:j + min_stem]
+            if stem1 == reverse_complement(stem2):
+                count += 1
+                hairpin_string += f"Hairpin {count}: {stem1}({sequence[i + min_stem:j]}){stem2}\n"
+    return count, hairpin_string if count > 0 else None
+
+@pytest.mark.parametrize("min_stem,min_loop,max_loop", [(3, 4, 9), (4, 3, 6), (5, 4, 8)])
+def test_matches_pairwise_scan(min_stem, min_loop, max_loop):
+    import random
+    rng = random.Random(min_stem)
+    for _ in range(100):
+        sequence = ''.join(rng.choice("ACGT") for _ in range(rng.randint(0, 120)))
+        expected = reference_hairpin_counter(sequence, min_stem, min_loop, max_loop)
+        assert hairpin_counter(sequence, min_stem, min_loop, max_loop) == expected
+
+def test_count_only():
+    count, hairpins = hairpin_counter("AAAAACCCCCAAAAAAAAGGGGGAAA", report=False)
+    assert count > 0
+    assert hairpins is None
+
+def test_junction_count_completes_split_sequence():
+    import random
+    from genedesign.seq_utils.hairpin_counter import junction_hairpin_count
+    rng = random.Random(9)
+    for _ in range(200):
+        left = ''.join(rng.choice("ACGT") for _ in range(rng.randint(0, 60)))
+        right = ''.join(rng.choice("ACGT") for _ in range(rng.randint(0, 60)))
+        total = hairpin_counter(left + right, report=False)[0]
+        parts = hairpin_counter(left, report=False)[0] + hairpin_counter(right, report=False)[0]
+        assert parts + junction_hairpin_count(left, right) == total